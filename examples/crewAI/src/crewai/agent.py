@@ -1,6 +1,10 @@
+import contextvars
 import shutil
 import subprocess
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Any, Callable, Dict, List, Literal, Optional, Sequence, Tuple, Type, Union
 
 from pydantic import Field, InstanceOf, PrivateAttr, model_validator
@@ -8,9 +12,12 @@ from pydantic import Field, InstanceOf, PrivateAttr, model_validator
 from crewai.agents import CacheHandler
 from crewai.agents.agent_builder.base_agent import BaseAgent
 from crewai.agents.crew_agent_executor import CrewAgentExecutor
-from crewai.knowledge.knowledge import Knowledge
+from crewai.knowledge.knowledge import Knowledge, knowledge_fingerprint
 from crewai.knowledge.source.base_knowledge_source import BaseKnowledgeSource
-from crewai.knowledge.utils.knowledge_utils import extract_knowledge_context
+from crewai.knowledge.utils.knowledge_utils import (
+    extract_keywords,
+    extract_knowledge_context,
+)
 from crewai.lite_agent import LiteAgent, LiteAgentOutput
 from crewai.llm import BaseLLM
 from crewai.memory.contextual.contextual_memory import ContextualMemory
@@ -49,6 +56,8 @@ from crewai.utilities.llm_utils import create_llm
 from crewai.utilities.token_counter_callback import TokenCalcHandler
 from crewai.utilities.training_handler import CrewTrainingHandler
 
+KNOWLEDGE_QUERY_CACHE_SIZE = 128
+
 
 class Agent(BaseAgent):
     """Represents an agent in a system.
@@ -76,6 +85,10 @@ class Agent(BaseAgent):
     """
 
     _times_executed: int = PrivateAttr(default=0)
+    _knowledge_query_cache: "OrderedDict[str, str]" = PrivateAttr(
+        default_factory=OrderedDict
+    )
+    _knowledge_query_lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
     max_execution_time: Optional[int] = Field(
         default=None,
         description="Maximum execution time for an agent to execute a task",
@@ -206,12 +219,22 @@ class Agent(BaseAgent):
                 if isinstance(self.knowledge_sources, list) and all(
                     isinstance(k, BaseKnowledgeSource) for k in self.knowledge_sources
                 ):
+                    # Kickoffs reuse the knowledge as long as its setup is unchanged
+                    if self.knowledge is not None and (
+                        self.knowledge.fingerprint
+                        == knowledge_fingerprint(
+                            self.knowledge_sources, self.embedder, self.role
+                        )
+                    ):
+                        return
+                    if self.knowledge is not None:
+                        self.knowledge.close()
+                    # Storage is initialized and sources are ingested on the first query
                     self.knowledge = Knowledge(
                         sources=self.knowledge_sources,
                         embedder=self.embedder,
                         collection_name=self.role,
                     )
-                    self.knowledge.add_sources()
         except (TypeError, ValueError) as e:
             raise ValueError(f"Invalid Knowledge Configuration: {str(e)}")
 
@@ -305,6 +328,28 @@ class Agent(BaseAgent):
                 task=task_prompt, context=context
             )
 
+        has_knowledge = bool(self.knowledge or (self.crew and self.crew.knowledge))
+        knowledge_query: Optional[Future] = None
+        if has_knowledge:
+            crewai_event_bus.emit(
+                self,
+                event=KnowledgeRetrievalStartedEvent(
+                    agent=self,
+                ),
+            )
+            if self._is_any_available_memory():
+                # The query rewrite may be an LLM call, so overlap it with memory retrieval
+                executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="crewai-knowledge-query"
+                )
+                knowledge_query = executor.submit(
+                    contextvars.copy_context().run,
+                    self._resolve_knowledge_search_query,
+                    task,
+                    task_prompt,
+                )
+                executor.shutdown(wait=False)
+
         if self._is_any_available_memory():
             crewai_event_bus.emit(
                 self,
@@ -333,6 +378,8 @@ class Agent(BaseAgent):
                     task_id=str(task.id) if task else None,
                     memory_content=memory,
                     retrieval_time_ms=(time.time() - start_time) * 1000,
+                    store_retrieval_times_ms=dict(contextual_memory.retrieval_times),
+                    timed_out_stores=list(contextual_memory.timed_out_stores),
                     source_type="agent",
                 ),
             )
@@ -340,17 +387,12 @@ class Agent(BaseAgent):
             self.knowledge_config.model_dump() if self.knowledge_config else {}
         )
 
-
-        if self.knowledge or (self.crew and self.crew.knowledge):
-            crewai_event_bus.emit(
-                self,
-                event=KnowledgeRetrievalStartedEvent(
-                    agent=self,
-                ),
-            )
+        if has_knowledge:
             try:
-                self.knowledge_search_query = self._get_knowledge_search_query(
-                    task_prompt
+                self.knowledge_search_query = (
+                    knowledge_query.result()
+                    if knowledge_query
+                    else self._resolve_knowledge_search_query(task, task_prompt)
                 )
                 if self.knowledge_search_query:
                     # Quering agent specific knowledge
@@ -726,6 +768,17 @@ class Agent(BaseAgent):
     def set_fingerprint(self, fingerprint: Fingerprint):
         self.security_config.fingerprint = fingerprint
 
+    def _resolve_knowledge_search_query(
+        self, task: Task, task_prompt: str
+    ) -> str | None:
+        """Build the knowledge search query the way knowledge_config.query_rewrite asks."""
+        mode = self.knowledge_config.query_rewrite if self.knowledge_config else "llm"
+        if mode == "description":
+            return task.description
+        if mode == "keywords":
+            return extract_keywords(task.description)
+        return self._get_knowledge_search_query(task_prompt)
+
     def _get_knowledge_search_query(self, task_prompt: str) -> str | None:
         """Generate a search query for the knowledge base based on the task description."""
         crewai_event_bus.emit(
@@ -738,6 +791,22 @@ class Agent(BaseAgent):
         query = self.i18n.slice("knowledge_search_query").format(
             task_prompt=task_prompt
         )
+        # Repeated task templates rewrite to the same query
+        cache_key = " ".join(task_prompt.split()).casefold()
+        with self._knowledge_query_lock:
+            cached_query = self._knowledge_query_cache.get(cache_key)
+            if cached_query is not None:
+                self._knowledge_query_cache.move_to_end(cache_key)
+        if cached_query is not None:
+            crewai_event_bus.emit(
+                self,
+                event=KnowledgeQueryCompletedEvent(
+                    query=query,
+                    agent=self,
+                ),
+            )
+            return cached_query
+
         rewriter_prompt = self.i18n.slice("knowledge_search_query_system_prompt")
         if not isinstance(self.llm, BaseLLM):
             self._logger.log(
@@ -770,6 +839,11 @@ class Agent(BaseAgent):
                     agent=self,
                 ),
             )
+            if rewritten_query:
+                with self._knowledge_query_lock:
+                    self._knowledge_query_cache[cache_key] = rewritten_query
+                    if len(self._knowledge_query_cache) > KNOWLEDGE_QUERY_CACHE_SIZE:
+                        self._knowledge_query_cache.popitem(last=False)
             return rewritten_query
         except Exception as e:
             crewai_event_bus.emit(
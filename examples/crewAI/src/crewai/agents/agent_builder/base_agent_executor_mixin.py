@@ -1,8 +1,9 @@
 import time
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
 from crewai.memory.entity.entity_memory_item import EntityMemoryItem
 from crewai.memory.long_term.long_term_memory_item import LongTermMemoryItem
+from crewai.memory.short_term.short_term_memory_item import ShortTermMemoryItem
 from crewai.utilities import I18N
 from crewai.utilities.converter import ConverterError
 from crewai.utilities.evaluators.task_evaluator import TaskEvaluator
@@ -12,6 +13,7 @@ from crewai.utilities.events.event_listener import event_listener
 if TYPE_CHECKING:
     from crewai.agents.agent_builder.base_agent import BaseAgent
     from crewai.crew import Crew
+    from crewai.memory.write_queue import MemoryWriteQueue
     from crewai.task import Task
 
 
@@ -24,6 +26,10 @@ class CrewAgentExecutorMixin:
     _i18n: I18N
     _printer: Printer = Printer()
 
+    def _get_memory_write_queue(self) -> Optional["MemoryWriteQueue"]:
+        """Returns the crew's write-behind queue when memory saves should not block the task."""
+        return getattr(self.crew, "_memory_write_queue", None) if self.crew else None
+
     def _create_short_term_memory(self, output) -> None:
         """Create and save a short-term memory item if conditions are met."""
         if (
@@ -37,6 +43,19 @@ class CrewAgentExecutorMixin:
                     hasattr(self.crew, "_short_term_memory")
                     and self.crew._short_term_memory
                 ):
+                    write_queue = self._get_memory_write_queue()
+                    if write_queue:
+                        write_queue.submit_save(
+                            self.crew._short_term_memory,
+                            ShortTermMemoryItem(
+                                data=output.text,
+                                metadata={
+                                    "observation": self.task.description,
+                                },
+                                agent=self.agent.role,
+                            ),
+                        )
+                        return
                     self.crew._short_term_memory.save(
                         value=output.text,
                         metadata={
@@ -58,6 +77,17 @@ class CrewAgentExecutorMixin:
             and self.crew._external_memory
         ):
             try:
+                write_queue = self._get_memory_write_queue()
+                if write_queue:
+                    write_queue.submit(
+                        self.crew._external_memory.save,
+                        value=output.text,
+                        metadata={
+                            "description": self.task.description,
+                        },
+                        agent=self.agent.role,
+                    )
+                    return
                 self.crew._external_memory.save(
                     value=output.text,
                     metadata={
@@ -78,42 +108,12 @@ class CrewAgentExecutorMixin:
             and self.task
             and self.agent
         ):
-            try:
-                ltm_agent = TaskEvaluator(self.agent)
-                evaluation = ltm_agent.evaluate(self.task, output.text)
-
-                if isinstance(evaluation, ConverterError):
-                    return
-
-                long_term_memory = LongTermMemoryItem(
-                    task=self.task.description,
-                    agent=self.agent.role,
-                    quality=evaluation.quality,
-                    datetime=str(time.time()),
-                    expected_output=self.task.expected_output,
-                    metadata={
-                        "suggestions": evaluation.suggestions,
-                        "quality": evaluation.quality,
-                    },
-                )
-                self.crew._long_term_memory.save(long_term_memory)
-
-                for entity in evaluation.entities:
-                    entity_memory = EntityMemoryItem(
-                        name=entity.name,
-                        type=entity.type,
-                        description=entity.description,
-                        relationships="\n".join(
-                            [f"- {r}" for r in entity.relationships]
-                        ),
-                    )
-                    self.crew._entity_memory.save(entity_memory)
-            except AttributeError as e:
-                print(f"Missing attributes for long term memory: {e}")
-                pass
-            except Exception as e:
-                print(f"Failed to add to long term memory: {e}")
-                pass
+            write_queue = self._get_memory_write_queue()
+            if write_queue:
+                # The evaluation is an LLM call, so it is deferred as a whole
+                write_queue.submit(self._save_long_term_memory, output)
+            else:
+                self._save_long_term_memory(output)
         elif (
             self.crew
             and self.crew._long_term_memory
@@ -124,6 +124,45 @@ class CrewAgentExecutorMixin:
                 color="bold_yellow",
             )
 
+    def _save_long_term_memory(self, output) -> None:
+        """Evaluate the task output and save the resulting long-term and entity memories."""
+        try:
+            ltm_agent = TaskEvaluator(self.agent)
+            evaluation = ltm_agent.evaluate(self.task, output.text)
+
+            if isinstance(evaluation, ConverterError):
+                return
+
+            long_term_memory = LongTermMemoryItem(
+                task=self.task.description,
+                agent=self.agent.role,
+                quality=evaluation.quality,
+                datetime=str(time.time()),
+                expected_output=self.task.expected_output,
+                metadata={
+                    "suggestions": evaluation.suggestions,
+                    "quality": evaluation.quality,
+                },
+            )
+            self.crew._long_term_memory.save(long_term_memory)
+
+            entity_memories = [
+                EntityMemoryItem(
+                    name=entity.name,
+                    type=entity.type,
+                    description=entity.description,
+                    relationships="\n".join([f"- {r}" for r in entity.relationships]),
+                )
+                for entity in evaluation.entities
+            ]
+            self.crew._entity_memory.save_many(entity_memories)
+        except AttributeError as e:
+            print(f"Missing attributes for long term memory: {e}")
+            pass
+        except Exception as e:
+            print(f"Failed to add to long term memory: {e}")
+            pass
+
     def _ask_human_input(self, final_answer: str) -> str:
         """Prompt human input with mode-appropriate messaging."""
         event_listener.formatter.pause_live_updates()
@@ -11,6 +11,7 @@ from typing import (
     Callable,
     Dict,
     List,
+    Literal,
     Optional,
     Set,
     Tuple,
@@ -48,6 +49,7 @@ from crewai.memory.external.external_memory import ExternalMemory
 from crewai.memory.long_term.long_term_memory import LongTermMemory
 from crewai.memory.short_term.short_term_memory import ShortTermMemory
 from crewai.memory.user.user_memory import UserMemory
+from crewai.memory.write_queue import MemoryWriteQueue
 from crewai.process import Process
 from crewai.security import Fingerprint, SecurityConfig
 from crewai.task import Task
@@ -123,6 +125,7 @@ class Crew(FlowTrackable, BaseModel):
     _entity_memory: Optional[InstanceOf[EntityMemory]] = PrivateAttr()
     _user_memory: Optional[InstanceOf[UserMemory]] = PrivateAttr()
     _external_memory: Optional[InstanceOf[ExternalMemory]] = PrivateAttr()
+    _memory_write_queue: Optional[MemoryWriteQueue] = PrivateAttr(default=None)
     _train: Optional[bool] = PrivateAttr(default=False)
     _train_iteration: Optional[int] = PrivateAttr()
     _inputs: Optional[Dict[str, Any]] = PrivateAttr(default=None)
@@ -334,8 +337,19 @@ class Crew(FlowTrackable, BaseModel):
             self._initialize_default_memories()
             self._initialize_user_memory()
 
+        self._initialize_memory_write_queue()
+
         return self
 
+    def _initialize_memory_write_queue(self):
+        write_behind = (self.memory_config or {}).get("write_behind")
+        if not write_behind:
+            return
+        if isinstance(write_behind, dict):
+            self._memory_write_queue = MemoryWriteQueue(**write_behind)
+        else:
+            self._memory_write_queue = MemoryWriteQueue()
+
     @model_validator(mode="after")
     def create_crew_knowledge(self) -> "Crew":
         """Create the knowledge for the crew."""
@@ -687,6 +701,8 @@ class Crew(FlowTrackable, BaseModel):
             )
             raise
         finally:
+            if self._memory_write_queue:
+                self._memory_write_queue.flush()
             detach(token)
 
     def kickoff_for_each(self, inputs: List[Dict[str, Any]]) -> List[CrewOutput]:
@@ -1157,11 +1173,20 @@ class Crew(FlowTrackable, BaseModel):
         return result
 
     def query_knowledge(
-        self, query: List[str], results_limit: int = 3, score_threshold: float = 0.35
+        self,
+        query: List[str],
+        results_limit: int = 3,
+        score_threshold: float = 0.35,
+        search_mode: Literal["vector", "hybrid"] = "vector",
+        rrf_k: int = 60,
     ) -> Union[List[Dict[str, Any]], None]:
         if self.knowledge:
             return self.knowledge.query(
-                query, results_limit=results_limit, score_threshold=score_threshold
+                query,
+                results_limit=results_limit,
+                score_threshold=score_threshold,
+                search_mode=search_mode,
+                rrf_k=rrf_k,
             )
         return None
 
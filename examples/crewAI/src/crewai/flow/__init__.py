@@ -1,5 +1,28 @@
-from crewai.flow.flow import Flow, start, listen, or_, and_, router
+from crewai.flow.flow import (
+    Flow,
+    and_,
+    cached,
+    concurrency,
+    get_current_flow,
+    listen,
+    or_,
+    router,
+    start,
+)
+from crewai.flow.host import FlowHost
 from crewai.flow.persistence import persist
 
-__all__ = ["Flow", "start", "listen", "or_", "and_", "router", "persist"]
+__all__ = [
+    "Flow",
+    "start",
+    "listen",
+    "or_",
+    "and_",
+    "router",
+    "concurrency",
+    "cached",
+    "persist",
+    "FlowHost",
+    "get_current_flow",
+]
 
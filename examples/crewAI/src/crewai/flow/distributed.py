@@ -0,0 +1,502 @@
+"""
+Multi-process execution of flows through a local SQLite work queue.
+
+The process calling ``DistributedFlowRunner.kickoff`` coordinates the run: it
+decides which methods are triggered, exactly like ``Flow.kickoff`` does, and
+puts one task per method invocation on the queue. Worker processes claim the
+tasks, load the current state from the persistence backend, run the method
+and report its result together with the changes it made to the state as a
+JSON patch. The coordinator applies the patches in the order the tasks finish
+and saves the merged state, which the next tasks start from.
+
+Tasks of a worker that dies are put back on the queue and run again by a new
+worker, up to ``max_attempts`` times.
+
+Example:
+    ```python
+    from crewai.flow.distributed import DistributedFlowRunner
+
+    runner = DistributedFlowRunner(ResearchFlow, workers=4)
+    result = runner.kickoff(inputs={"topic": "AI agents"})
+    ```
+"""
+
+import asyncio
+import inspect
+import json
+import multiprocessing
+import os
+import pickle
+import sqlite3
+import threading
+import time
+import traceback
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+
+from crewai.flow.flow import Flow
+from crewai.flow.persistence.base import FlowPersistence
+from crewai.flow.persistence.json_patch import apply_patch, make_patch, state_to_json
+from crewai.flow.persistence.sqlite import SQLiteFlowPersistence
+from crewai.utilities.events.crewai_event_bus import crewai_event_bus
+from crewai.utilities.events.flow_events import (
+    FlowFailedEvent,
+    FlowFinishedEvent,
+    FlowStartedEvent,
+)
+
+
+class SQLiteWorkQueue:
+    """Durable queue of flow method invocations shared by processes.
+
+    Tasks move from "pending" to "running" when a worker claims them, and to
+    "done" or "failed" when it reports back. The coordinator then marks them
+    "collected". Runs are recorded too, so workers know when to stop.
+    """
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._local = threading.local()
+        self.init_db()
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {"db_path": self.db_path}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.db_path = state["db_path"]
+        self._local = threading.local()
+
+    def init_db(self) -> None:
+        conn = self._connection()
+        conn.execute(
+            """
+        CREATE TABLE IF NOT EXISTS flow_tasks (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            run_id TEXT NOT NULL,
+            method_name TEXT NOT NULL,
+            arguments BLOB NOT NULL,
+            status TEXT NOT NULL DEFAULT 'pending',
+            worker_pid INTEGER,
+            attempts INTEGER NOT NULL DEFAULT 0,
+            result BLOB,
+            state_patch TEXT,
+            error TEXT
+        )
+        """
+        )
+        conn.execute(
+            """
+        CREATE INDEX IF NOT EXISTS idx_flow_tasks_run_status
+        ON flow_tasks(run_id, status, id)
+        """
+        )
+        conn.execute(
+            """
+        CREATE TABLE IF NOT EXISTS flow_runs (
+            run_id TEXT PRIMARY KEY,
+            status TEXT NOT NULL
+        )
+        """
+        )
+
+    def start_run(self, run_id: str) -> None:
+        conn = self._connection()
+        conn.execute(
+            "INSERT OR REPLACE INTO flow_runs (run_id, status) VALUES (?, 'running')",
+            (run_id,),
+        )
+        # Tasks left over from an earlier, interrupted run with this ID
+        conn.execute("DELETE FROM flow_tasks WHERE run_id = ?", (run_id,))
+
+    def finish_run(self, run_id: str) -> None:
+        self._connection().execute(
+            "UPDATE flow_runs SET status = 'finished' WHERE run_id = ?", (run_id,)
+        )
+
+    def is_running(self, run_id: str) -> bool:
+        row = self._connection().execute(
+            "SELECT status FROM flow_runs WHERE run_id = ?", (run_id,)
+        ).fetchone()
+        return row is not None and row[0] == "running"
+
+    def enqueue(self, run_id: str, method_name: str, arguments: Tuple[Any, ...]) -> int:
+        cursor = self._connection().execute(
+            "INSERT INTO flow_tasks (run_id, method_name, arguments) VALUES (?, ?, ?)",
+            (run_id, method_name, pickle.dumps(arguments)),
+        )
+        return cursor.lastrowid  # type: ignore[return-value]
+
+    def claim(self, run_id: str) -> Optional[Tuple[int, str, Tuple[Any, ...]]]:
+        """Marks the oldest pending task as run by this process and returns it."""
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute(
+                """
+            SELECT id, method_name, arguments FROM flow_tasks
+            WHERE run_id = ? AND status = 'pending'
+            ORDER BY id LIMIT 1
+            """,
+                (run_id,),
+            ).fetchone()
+            if row is not None:
+                conn.execute(
+                    """
+                UPDATE flow_tasks
+                SET status = 'running', worker_pid = ?, attempts = attempts + 1
+                WHERE id = ?
+                """,
+                    (os.getpid(), row[0]),
+                )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        if row is None:
+            return None
+        return row[0], row[1], pickle.loads(row[2])
+
+    def complete(self, task_id: int, result: Any, state_patch: List[Dict[str, Any]]) -> None:
+        self._connection().execute(
+            """
+        UPDATE flow_tasks SET status = 'done', result = ?, state_patch = ?
+        WHERE id = ? AND status = 'running'
+        """,
+            (pickle.dumps(result), json.dumps(state_patch), task_id),
+        )
+
+    def fail(self, task_id: int, error: str) -> None:
+        self._connection().execute(
+            """
+        UPDATE flow_tasks SET status = 'failed', error = ?
+        WHERE id = ? AND status = 'running'
+        """,
+            (error, task_id),
+        )
+
+    def collect(self, run_id: str) -> List[Tuple[int, str, Any, Any, Optional[str]]]:
+        """Returns the tasks finished since the last call, as (id, status,
+        result, state patch, error), and marks them collected."""
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            rows = conn.execute(
+                """
+            SELECT id, status, result, state_patch, error FROM flow_tasks
+            WHERE run_id = ? AND status IN ('done', 'failed')
+            ORDER BY id
+            """,
+                (run_id,),
+            ).fetchall()
+            conn.executemany(
+                "UPDATE flow_tasks SET status = 'collected' WHERE id = ?",
+                [(row[0],) for row in rows],
+            )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return [
+            (
+                task_id,
+                status,
+                pickle.loads(result) if result is not None else None,
+                json.loads(state_patch) if state_patch is not None else None,
+                error,
+            )
+            for task_id, status, result, state_patch, error in rows
+        ]
+
+    def requeue(self, run_id: str, worker_pid: int, max_attempts: int) -> List[int]:
+        """Puts the tasks of a dead worker back on the queue. Tasks that
+        already ran max_attempts times are failed instead; their IDs are returned."""
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            exhausted = [
+                row[0]
+                for row in conn.execute(
+                    """
+                SELECT id FROM flow_tasks
+                WHERE run_id = ? AND status = 'running' AND worker_pid = ? AND attempts >= ?
+                """,
+                    (run_id, worker_pid, max_attempts),
+                )
+            ]
+            conn.executemany(
+                """
+            UPDATE flow_tasks SET status = 'failed', error = 'Worker process died'
+            WHERE id = ?
+            """,
+                [(task_id,) for task_id in exhausted],
+            )
+            conn.execute(
+                """
+            UPDATE flow_tasks SET status = 'pending', worker_pid = NULL
+            WHERE run_id = ? AND status = 'running' AND worker_pid = ?
+            """,
+                (run_id, worker_pid),
+            )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return exhausted
+
+
+def _run_worker(
+    flow_class: Type[Flow],
+    queue: SQLiteWorkQueue,
+    persistence: FlowPersistence,
+    run_id: str,
+    poll_interval: float,
+) -> None:
+    """Claims and runs tasks of a run until the run is finished."""
+    flow = flow_class(persistence=persistence)
+    # Only the coordinator saves the state, once merged; a save of the
+    # worker's partial state could land after it and lose a sibling's changes
+    flow._suspend_persistence = True
+    while True:
+        task = queue.claim(run_id)
+        if task is None:
+            if not queue.is_running(run_id):
+                return
+            time.sleep(poll_interval)
+            continue
+
+        task_id, method_name, arguments = task
+        try:
+            stored_state = persistence.load_state(run_id)
+            if stored_state:
+                flow._restore_state(stored_state)
+            before = state_to_json(flow.state)
+            result = asyncio.run(
+                flow._execute_method(method_name, flow._methods[method_name], *arguments)
+            )
+            queue.complete(task_id, result, make_patch(before, state_to_json(flow.state)))
+        except Exception:
+            queue.fail(task_id, traceback.format_exc())
+
+
+class DistributedFlowRunner:
+    """Runs a flow's methods in a pool of worker processes.
+
+    The flow class must be importable by the workers (defined at module level),
+    and method arguments and results must be picklable. The state is merged
+    key by key, so methods running in parallel should update different keys;
+    when two of them change the same key, the one that finishes last wins.
+    Flow events are emitted in the process that runs each method.
+    """
+
+    def __init__(
+        self,
+        flow_class: Type[Flow],
+        workers: Optional[int] = None,
+        db_path: Optional[str] = None,
+        persistence: Optional[FlowPersistence] = None,
+        max_attempts: int = 3,
+        poll_interval: float = 0.05,
+        start_method: Optional[str] = "spawn",
+    ):
+        """Initialize the runner.
+
+        Args:
+            flow_class: The Flow subclass to run.
+            workers: Number of worker processes. Defaults to the number of CPUs.
+            db_path: Path to the SQLite database of the work queue. If not
+                    provided, uses db_storage_path() from utilities.paths.
+            persistence: Backend the workers exchange the state through. It
+                    must be shared by processes; defaults to SQLiteFlowPersistence.
+            max_attempts: Times a task is run before the run fails because its
+                    workers keep dying.
+            poll_interval: Seconds between polls of the queue when it is idle.
+            start_method: multiprocessing start method of the workers.
+
+        Raises:
+            ValueError: If workers or max_attempts is not positive
+        """
+        from crewai.utilities.paths import db_storage_path
+
+        if workers is not None and workers < 1:
+            raise ValueError("workers must be at least 1")
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+
+        self.flow_class = flow_class
+        self.workers = workers or os.cpu_count() or 1
+        self.queue = SQLiteWorkQueue(
+            db_path or str(Path(db_storage_path()) / "flow_queue.db")
+        )
+        self.persistence = persistence or SQLiteFlowPersistence()
+        self.max_attempts = max_attempts
+        self.poll_interval = poll_interval
+        self._context = multiprocessing.get_context(start_method)
+        self._worker_exits = 0
+        self.flow: Optional[Flow] = None
+
+    def kickoff(self, inputs: Optional[Dict[str, Any]] = None) -> Any:
+        """Runs the flow and returns the result of the last method that finished.
+
+        Raises:
+            RuntimeError: If a method fails, or a task's workers keep dying
+        """
+        flow = self.flow_class(persistence=self.persistence)
+        self.flow = flow
+        flow_name = flow.name or flow.__class__.__name__
+        if inputs:
+            # Same handling of the state ID as Flow.kickoff_async
+            if "id" in inputs:
+                stored_state = self.persistence.load_state(inputs["id"])
+                if stored_state:
+                    flow._restore_state(stored_state)
+                elif isinstance(flow._state, dict):
+                    flow._state["id"] = inputs["id"]
+                else:
+                    setattr(flow._state, "id", inputs["id"])
+            filtered_inputs = {k: v for k, v in inputs.items() if k != "id"}
+            if filtered_inputs:
+                flow._initialize_state(filtered_inputs)
+        run_id = flow.flow_id
+        state = state_to_json(flow.state)
+        self.persistence.save_state(run_id, "kickoff", state)
+
+        crewai_event_bus.emit(
+            flow, FlowStartedEvent(type="flow_started", flow_name=flow_name, inputs=inputs)
+        )
+
+        self.queue.start_run(run_id)
+        processes: List[multiprocessing.process.BaseProcess] = []
+        waiting: Dict[int, Tuple[str, Callable[[Any], None]]] = {}
+        outputs: List[Any] = []
+
+        def submit(
+            method_name: str, result: Any, then: Optional[Callable[[Any], None]] = None
+        ) -> None:
+            # Like Flow._execute_single_listener, pass the trigger's result
+            # only to methods that take a parameter
+            params = [
+                p
+                for p in inspect.signature(flow._methods[method_name]).parameters.values()
+                if p.name != "self"
+            ]
+            task_id = self.queue.enqueue(run_id, method_name, (result,) if params else ())
+            waiting[task_id] = (
+                method_name,
+                then or (lambda output: route(output, [], method_name, [], method_name)),
+            )
+
+        def route(
+            result: Any,
+            routers: List[str],
+            trigger: Optional[str],
+            paths: List[str],
+            origin: str,
+        ) -> None:
+            """Flow._execute_listeners as continuations: runs the triggered
+            routers one after another, then the listeners of the trigger and
+            of every router path."""
+            if not routers:
+                routers = (
+                    flow._find_triggered_methods(trigger, router_only=True)
+                    if trigger
+                    else []
+                )
+                if not routers:
+                    for current in [origin] + paths:
+                        for listener in flow._find_triggered_methods(current, router_only=False):
+                            submit(listener, result)
+                    return
+
+            router_name, rest = routers[0], routers[1:]
+
+            def after_router(path: Any) -> None:
+                route(path, [], router_name, [], router_name)
+                route(result, rest, path, paths + [path] if path else paths, origin)
+
+            submit(router_name, result, after_router)
+
+        self._worker_exits = 0
+        try:
+            flow._pending_and_listeners = {}
+            for start_method in flow._start_methods:
+                submit(start_method, None)
+
+            while waiting:
+                self._keep_workers_alive(processes, run_id)
+                finished = self.queue.collect(run_id)
+                if not finished:
+                    time.sleep(self.poll_interval)
+                    continue
+                for task_id, status, result, state_patch, error in finished:
+                    method_name, then = waiting.pop(task_id)
+                    if status == "failed":
+                        raise RuntimeError(f"Flow method {method_name} failed:\n{error}")
+                    state = apply_patch(state, state_patch)
+                    self.persistence.save_state(run_id, method_name, state)
+                    outputs.append(result)
+                    then(result)
+        except BaseException as e:
+            crewai_event_bus.emit(
+                flow, FlowFailedEvent(type="flow_failed", flow_name=flow_name, error=e)
+            )
+            raise
+        finally:
+            self.queue.finish_run(run_id)
+            for process in processes:
+                process.join(timeout=10)
+                if process.is_alive():
+                    process.terminate()
+            flow._restore_state(state)
+
+        final_output = outputs[-1] if outputs else None
+        crewai_event_bus.emit(
+            flow,
+            FlowFinishedEvent(type="flow_finished", flow_name=flow_name, result=final_output),
+        )
+        return final_output
+
+    def _keep_workers_alive(
+        self, processes: List[multiprocessing.process.BaseProcess], run_id: str
+    ) -> None:
+        """Starts missing workers, first putting back the tasks of dead ones."""
+        for process in list(processes):
+            if process.is_alive():
+                continue
+            processes.remove(process)
+            self._worker_exits += 1
+            if self._worker_exits > self.workers * self.max_attempts:
+                raise RuntimeError(
+                    f"Flow worker processes exited {self._worker_exits} times "
+                    f"(last exit code {process.exitcode})"
+                )
+            if process.pid is not None:
+                exhausted = self.queue.requeue(run_id, process.pid, self.max_attempts)
+                if exhausted:
+                    raise RuntimeError(
+                        f"Flow task {exhausted[0]} was attempted {self.max_attempts} "
+                        "times, but its worker process died every time"
+                    )
+        while len(processes) < self.workers:
+            process = self._context.Process(
+                target=_run_worker,
+                args=(
+                    self.flow_class,
+                    self.queue,
+                    self.persistence,
+                    run_id,
+                    self.poll_interval,
+                ),
+                daemon=True,
+            )
+            process.start()
+            processes.append(process)
@@ -1,15 +1,25 @@
 import asyncio
+import contextvars
 import copy
+import functools
+import hashlib
 import inspect
+import json
 import logging
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from typing import (
     Any,
     Callable,
     Dict,
     Generic,
+    Iterable,
     List,
+    Literal,
     Optional,
     Set,
+    Tuple,
     Type,
     TypeVar,
     Union,
@@ -18,24 +28,47 @@ from typing import (
 from uuid import uuid4
 
 from pydantic import BaseModel, Field, ValidationError
+from pydantic_core import to_jsonable_python
 
 from crewai.flow.flow_visualizer import plot_flow
 from crewai.flow.persistence.base import FlowPersistence
+from crewai.flow.persistence.json_patch import (
+    JsonPatch,
+    apply_patch,
+    make_patch,
+    state_to_json,
+)
 from crewai.flow.utils import get_possible_return_constants
 from crewai.utilities.events.crewai_event_bus import crewai_event_bus
 from crewai.utilities.events.flow_events import (
     FlowCreatedEvent,
+    FlowFailedEvent,
     FlowFinishedEvent,
+    FlowMapProgressEvent,
     FlowPlotEvent,
     FlowStartedEvent,
+    FlowStateEvent,
     MethodExecutionFailedEvent,
     MethodExecutionFinishedEvent,
     MethodExecutionStartedEvent,
+    StateSnapshot,
 )
 from crewai.utilities.printer import Printer
 
 logger = logging.getLogger(__name__)
 
+# The flow whose kickoff is running in the current context. Every asyncio task
+# and every thread-pool call of a flow method sees the flow it belongs to, so
+# flows running concurrently in one process don't see each other
+_current_flow: contextvars.ContextVar[Optional["Flow"]] = contextvars.ContextVar(
+    "crewai_current_flow", default=None
+)
+
+
+def get_current_flow() -> Optional["Flow"]:
+    """Returns the flow being executed in the current context, if any."""
+    return _current_flow.get()
+
 
 class FlowState(BaseModel):
     """Base model for all flow states, ensuring each state has a unique ID."""
@@ -380,6 +413,126 @@ def and_(*conditions: Union[str, dict, Callable]) -> dict:
     return {"type": "AND", "methods": methods}
 
 
+def concurrency(
+    limit: Optional[int] = None,
+    run: Optional[Literal["thread", "inline"]] = None,
+) -> Callable:
+    """
+    Configures how a flow method runs when several executions overlap.
+
+    Parameters
+    ----------
+    limit : Optional[int], optional
+        Maximum number of executions of this method running at the same time.
+        Further executions wait for one to finish. Default is None, meaning
+        no limit beyond the flow's thread pool.
+    run : Optional[Literal["thread", "inline"]], optional
+        For synchronous methods, "thread" runs the method in the flow's thread
+        pool, in parallel with other branches, and "inline" runs it directly
+        on the event loop, blocking other branches while it runs. Default is
+        None, meaning the flow's ``sync_methods`` setting applies.
+
+    Returns
+    -------
+    Callable
+        A decorator function that records the settings on the method.
+
+    Raises
+    ------
+    ValueError
+        If the limit is not a positive integer.
+
+    Examples
+    --------
+    >>> @listen("fetch_pages")
+    >>> @concurrency(limit=2, run="thread")  # At most two crews scraping at once
+    >>> def scrape(self, pages):
+    ...     with self.state_lock:
+    ...         self.state["scraped"] = pages
+    """
+    if limit is not None and limit < 1:
+        raise ValueError("Concurrency limit must be a positive integer")
+
+    def decorator(func):
+        func.__concurrency_limit__ = limit
+        func.__sync_method_mode__ = run
+        return func
+
+    return decorator
+
+
+def _code_digest(code: Any) -> str:
+    """Hashes the bytecode, constants and names of a function, including nested functions."""
+    digest = hashlib.sha256(code.co_code)
+    for const in code.co_consts:
+        # Code objects are hashed by their content, as their repr holds an address
+        digest.update(
+            (_code_digest(const) if inspect.iscode(const) else repr(const)).encode(
+                "utf-8"
+            )
+        )
+    digest.update(repr(code.co_names).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def cached(keys: Optional[List[str]] = None, version: Optional[str] = None) -> Callable:
+    """
+    Skips a deterministic flow method when it already ran with the same inputs.
+
+    Before the method runs, its inputs are fingerprinted: the state fields
+    listed in ``keys`` and the arguments it is called with, such as the result
+    of the method that triggered it, along with the method's code and
+    ``version``, so editing the method invalidates its recorded outcomes. If
+    the flow's persistence backend holds
+    an outcome for that fingerprint, the method is not executed. Its recorded
+    result is used instead and the changes it made to the state are applied
+    again, so its listeners fire as usual. Otherwise the method runs and its
+    outcome is recorded.
+
+    An outcome is only recorded if no other method of the flow ran while
+    the method did, as the changes to the state would otherwise include
+    theirs. Caching requires a persistence backend, passed to the flow or set
+    with the class-level ``@persist`` decorator. Without one the method
+    always runs.
+
+    Parameters
+    ----------
+    keys : Optional[List[str]], optional
+        Names of the top-level state fields the method depends on. Default is
+        None, meaning the whole state except its ID.
+    version : Optional[str], optional
+        Part of the fingerprint. Change it to invalidate the recorded outcomes
+        when something the method calls changes, such as a prompt or a helper
+        function. Default is None.
+
+    Returns
+    -------
+    Callable
+        A decorator function that marks the method as cached.
+
+    Examples
+    --------
+    >>> @listen(load_topic)
+    >>> @cached(keys=["topic", "goal"])
+    >>> def generate_book_outline(self):
+    ...     pass
+    """
+    if keys is not None and (
+        isinstance(keys, str) or not all(isinstance(key, str) for key in keys)
+    ):
+        raise ValueError("Cache keys must be a list of state field names")
+
+    def decorator(func):
+        func.__cache_keys__ = list(keys) if keys is not None else None
+        func.__cache_version__ = version
+        code = getattr(inspect.unwrap(func), "__code__", None)
+        func.__cache_code__ = _code_digest(code) if code is not None else None
+        func.__is_cached__ = True
+        return func
+
+    return decorator
+
+
 class FlowMeta(type):
     def __new__(mcs, name, bases, dct):
         cls = super().__new__(mcs, name, bases, dct)
@@ -416,10 +569,26 @@ class FlowMeta(type):
                         if possible_returns:
                             router_paths[attr_name] = possible_returns
 
+        # Inverted index from a trigger (method name or router output) to the
+        # routers and listeners waiting on it, in declaration order, so finding
+        # what a finished method triggers only looks at its dependents. The
+        # runtime uses it split by routers and listeners, plot() as a whole.
+        dependents: Dict[str, List[str]] = {}
+        router_triggers: Dict[str, List[str]] = {}
+        listener_triggers: Dict[str, List[str]] = {}
+        for listener_name, (_, methods) in listeners.items():
+            index = router_triggers if listener_name in routers else listener_triggers
+            for method in dict.fromkeys(methods):
+                dependents.setdefault(method, []).append(listener_name)
+                index.setdefault(method, []).append(listener_name)
+
         setattr(cls, "_start_methods", start_methods)
         setattr(cls, "_listeners", listeners)
         setattr(cls, "_routers", routers)
         setattr(cls, "_router_paths", router_paths)
+        setattr(cls, "_dependents", dependents)
+        setattr(cls, "_router_triggers", router_triggers)
+        setattr(cls, "_listener_triggers", listener_triggers)
 
         return cls
 
@@ -435,8 +604,21 @@ class Flow(Generic[T], metaclass=FlowMeta):
     _listeners: Dict[str, tuple[str, List[str]]] = {}
     _routers: Set[str] = set()
     _router_paths: Dict[str, List[str]] = {}
+    _dependents: Dict[str, List[str]] = {}
+    _router_triggers: Dict[str, List[str]] = {}
+    _listener_triggers: Dict[str, List[str]] = {}
     initial_state: Union[Type[T], T, None] = None
     name: Optional[str] = None
+    # How method events capture the state: "lazy" deep-copies it when a handler
+    # first reads event.state, "copy" deep-copies it on every event, and "shared"
+    # shallow-copies it, sharing nested values with the live state
+    state_snapshots: Literal["lazy", "copy", "shared"] = "lazy"
+    # Synchronous methods run "inline" on the event loop, one after another, or
+    # with "thread" in a thread pool of max_workers threads (None uses the
+    # ThreadPoolExecutor default) so listeners triggered together overlap;
+    # threaded methods must then update the state under state_lock
+    sync_methods: Literal["thread", "inline"] = "inline"
+    max_workers: Optional[int] = None
 
     def __class_getitem__(cls: Type["Flow"], item: Type[T]) -> Type["Flow"]:
         class _FlowGeneric(cls):  # type: ignore
@@ -462,6 +644,13 @@ class Flow(Generic[T], metaclass=FlowMeta):
         self._pending_and_listeners: Dict[str, Set[str]] = {}
         self._method_outputs: List[Any] = []  # List to store all method outputs
         self._persistence: Optional[FlowPersistence] = persistence
+        self._state_lock = threading.RLock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._method_semaphores: Dict[str, asyncio.Semaphore] = {}
+        # Methods called or replayed from the cache so far, and methods
+        # running now, to tell whether a cached method ran alone
+        self._method_calls = 0
+        self._running_methods = 0
 
         # Initialize state with initial values
         self._state = self._create_initial_state()
@@ -577,12 +766,47 @@ class Flow(Generic[T], metaclass=FlowMeta):
         )
 
     def _copy_state(self) -> T:
-        return copy.deepcopy(self._state)
+        with self._state_lock:
+            return copy.deepcopy(self._state)
+
+    def _snapshot_state(self) -> Union[T, StateSnapshot]:
+        """Captures the state for a method event, as configured by state_snapshots."""
+        if self.state_snapshots == "copy":
+            return self._copy_state()
+        if self.state_snapshots == "shared":
+            with self._state_lock:
+                if isinstance(self._state, BaseModel):
+                    return cast(T, self._state.model_copy())
+                return copy.copy(self._state)
+        return StateSnapshot(self._copy_state)
+
+    def _emit_state_event(self, event: FlowStateEvent) -> None:
+        """
+        Emits an event carrying a lazy state snapshot. If a handler kept the
+        event without reading its state, the copy is taken now, before the
+        state can change.
+        """
+        snapshot = event._state
+        crewai_event_bus.emit(self, event)
+        if isinstance(snapshot, StateSnapshot) and not snapshot.taken:
+            retained = weakref.ref(event)
+            del event
+            if retained() is not None:
+                snapshot.get()
 
     @property
     def state(self) -> T:
         return self._state
 
+    @property
+    def state_lock(self) -> threading.RLock:
+        """
+        Lock held while the flow copies or persists its state. Methods running
+        in parallel threads should hold it while updating shared state, e.g.
+        ``with self.state_lock: self.state.count += 1``.
+        """
+        return self._state_lock
+
     @property
     def method_outputs(self) -> List[Any]:
         """Returns the list of all outputs from executed methods."""
@@ -729,7 +953,8 @@ class Flow(Generic[T], metaclass=FlowMeta):
         This method performs state restoration (if an 'id' is provided and persistence is available)
         and updates the flow state with any additional inputs. It then emits the FlowStartedEvent,
         logs the flow startup, and executes all start methods. Once completed, it emits the
-        FlowFinishedEvent and returns the final output.
+        FlowFinishedEvent and returns the final output. If a method raises or the run is
+        cancelled, it emits the FlowFailedEvent instead.
 
         Args:
             inputs: Optional dictionary containing input values and/or a state ID for restoration.
@@ -737,6 +962,13 @@ class Flow(Generic[T], metaclass=FlowMeta):
         Returns:
             The final output from the flow, which is the result of the last executed method.
         """
+        token = _current_flow.set(self)
+        try:
+            return await self._kickoff(inputs)
+        finally:
+            _current_flow.reset(token)
+
+    async def _kickoff(self, inputs: Optional[Dict[str, Any]]) -> Any:
         if inputs:
             # Override the id in the state if it exists in inputs
             if "id" in inputs:
@@ -778,16 +1010,19 @@ class Flow(Generic[T], metaclass=FlowMeta):
             f"Flow started with ID: {self.flow_id}", color="bold_magenta"
         )
 
-        if inputs is not None and "id" not in inputs:
-            self._initialize_state(inputs)
-
-        tasks = [
-            self._execute_start_method(start_method)
-            for start_method in self._start_methods
-        ]
-        await asyncio.gather(*tasks)
-
-        final_output = self._method_outputs[-1] if self._method_outputs else None
+        try:
+            final_output = await self._run_start_methods(inputs)
+        except BaseException as e:
+            # Also on cancellation, so listeners release what they track per run
+            crewai_event_bus.emit(
+                self,
+                FlowFailedEvent(
+                    type="flow_failed",
+                    flow_name=self.name or self.__class__.__name__,
+                    error=e,
+                ),
+            )
+            raise
 
         crewai_event_bus.emit(
             self,
@@ -800,6 +1035,184 @@ class Flow(Generic[T], metaclass=FlowMeta):
 
         return final_output
 
+    async def _run_start_methods(self, inputs: Optional[Dict[str, Any]]) -> Any:
+        if inputs is not None and "id" not in inputs:
+            self._initialize_state(inputs)
+
+        # AND conditions and semaphores are tracked per run; semaphores also
+        # belong to the event loop of the run that created them
+        self._pending_and_listeners = {}
+        self._method_semaphores = {}
+        executor = None
+        if self._executor is None:
+            executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix=f"{self.name or self.__class__.__name__}-flow",
+            )
+            self._executor = executor
+        try:
+            tasks = [
+                self._execute_start_method(start_method)
+                for start_method in self._start_methods
+            ]
+            await asyncio.gather(*tasks)
+        finally:
+            if executor is not None:
+                self._executor = None
+                executor.shutdown(wait=False)
+
+        return self._method_outputs[-1] if self._method_outputs else None
+
+    async def map(
+        self,
+        items: Iterable[Any],
+        fn: Callable[[Any], Any],
+        max_concurrency: int = 4,
+        on_result: Optional[Callable[[Any, Any], None]] = None,
+        key: Optional[Callable[[Any], Any]] = None,
+        name: Optional[str] = None,
+    ) -> List[Any]:
+        """
+        Applies ``fn`` to every item, running at most ``max_concurrency`` at once.
+
+        Synchronous functions run in the flow's thread pool, whatever the
+        flow's ``sync_methods`` setting. Each result is passed to ``on_result(item, result)`` as
+        soon as it is ready, with the state lock held, so it can be recorded
+        in the state, and a FlowMapProgressEvent is emitted.
+
+        When the flow has a persistence backend, every finished item is
+        recorded. If the flow is interrupted and kicked off again with the
+        same state ID, the recorded results are passed to ``on_result`` again
+        and only the unfinished items run. The records are removed once all
+        items have finished.
+
+        Parameters
+        ----------
+        items : Iterable[Any]
+            The items to process.
+        fn : Callable[[Any], Any]
+            Function or coroutine function called with each item.
+        max_concurrency : int, optional
+            Maximum number of items processed at the same time. Default is 4.
+        on_result : Optional[Callable[[Any, Any], None]], optional
+            Called on the event loop with each item and its result.
+        key : Optional[Callable[[Any], Any]], optional
+            Returns a unique, stable key for an item, used to recognize
+            finished items when resuming. Default is the item's position.
+        name : Optional[str], optional
+            Name of the fan-out within the flow. Default is the name of ``fn``.
+
+        Returns
+        -------
+        List[Any]
+            The results, in the order of the items.
+
+        Raises
+        ------
+        ValueError
+            If max_concurrency is not positive or item keys are not unique.
+
+        Examples
+        --------
+        >>> @listen(load_leads)
+        >>> async def score_leads(self):
+        ...     await self.map(
+        ...         self.state.candidates,
+        ...         lambda candidate: ScoreCrew().crew().kickoff(inputs=...),
+        ...         max_concurrency=5,
+        ...         on_result=lambda candidate, output: self.state.scores.append(output.pydantic),
+        ...         key=lambda candidate: candidate.id,
+        ...     )
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        items = list(items)
+        keys = [
+            str(key(item)) if key is not None else str(index)
+            for index, item in enumerate(items)
+        ]
+        if len(set(keys)) != len(keys):
+            raise ValueError("Item keys must be unique")
+        name = name or getattr(fn, "__name__", "map")
+        flow_name = self.name or self.__class__.__name__
+        loop = asyncio.get_running_loop()
+        persistence = self._persistence if self.flow_id else None
+
+        finished: Dict[str, Any] = {}
+        if persistence is not None:
+            finished = await loop.run_in_executor(
+                None, persistence.load_progress, self.flow_id, name
+            )
+
+        results: List[Any] = [None] * len(items)
+        completed = 0
+
+        def record(index: int, result: Any, resumed: bool) -> None:
+            nonlocal completed
+            results[index] = result
+            completed += 1
+            if on_result is not None:
+                with self._state_lock:
+                    on_result(items[index], result)
+            crewai_event_bus.emit(
+                self,
+                FlowMapProgressEvent(
+                    type="flow_map_progress",
+                    flow_name=flow_name,
+                    map_name=name,
+                    item_key=keys[index],
+                    completed=completed,
+                    total=len(items),
+                    resumed=resumed,
+                ),
+            )
+
+        for index, item_key in enumerate(keys):
+            if item_key in finished:
+                record(index, finished[item_key], resumed=True)
+
+        # Workers pull from one iterator, so items are only started as fast
+        # as they finish
+        unfinished = [index for index, k in enumerate(keys) if k not in finished]
+        pending = iter(unfinished)
+
+        async def worker() -> None:
+            for index in pending:
+                if asyncio.iscoroutinefunction(fn):
+                    result = await fn(items[index])
+                else:
+                    # Items overlap whatever the flow's sync_methods setting
+                    result = await self._run_in_thread(fn, items[index])
+                if inspect.isawaitable(result):  # e.g. a lambda calling kickoff_async
+                    result = await result
+                if persistence is not None:
+                    await loop.run_in_executor(
+                        None,
+                        persistence.save_progress,
+                        self.flow_id,
+                        name,
+                        keys[index],
+                        result,
+                    )
+                record(index, result, resumed=False)
+
+        workers = [
+            asyncio.create_task(worker())
+            for _ in range(min(max_concurrency, len(unfinished)))
+        ]
+        try:
+            await asyncio.gather(*workers)
+        except BaseException:
+            for task in workers:
+                task.cancel()
+            raise
+
+        if persistence is not None:
+            await loop.run_in_executor(
+                None, persistence.clear_progress, self.flow_id, name
+            )
+        return results
+
     async def _execute_start_method(self, start_method_name: str) -> None:
         """
         Executes a flow's start method and its triggered listeners.
@@ -830,36 +1243,92 @@ class Flow(Generic[T], metaclass=FlowMeta):
             dumped_params = {f"_{i}": arg for i, arg in enumerate(args)} | (
                 kwargs or {}
             )
-            crewai_event_bus.emit(
-                self,
+            self._emit_state_event(
                 MethodExecutionStartedEvent(
                     type="method_execution_started",
                     method_name=method_name,
                     flow_name=self.name or self.__class__.__name__,
                     params=dumped_params,
-                    state=self._copy_state(),
+                    state=self._snapshot_state(),
                 ),
             )
 
-            result = (
-                await method(*args, **kwargs)
-                if asyncio.iscoroutinefunction(method)
-                else method(*args, **kwargs)
-            )
+            fingerprint: Optional[str] = None
+            recorded: Optional[Tuple[Any, JsonPatch]] = None
+            if (
+                getattr(method, "__is_cached__", False)
+                and self._persistence is not None
+            ):
+                fingerprint = self._fingerprint(method_name, method, args, kwargs)
+                if fingerprint is not None:
+                    recorded = await asyncio.get_running_loop().run_in_executor(
+                        None, self._persistence.load_cached_result, fingerprint
+                    )
+
+            if recorded is not None:
+                result, state_patch = recorded
+                self._method_calls += 1
+                self._apply_state_patch(state_patch)
+                self._log_flow_event(
+                    f"Reusing the cached result of {method_name}", color="yellow"
+                )
+            else:
+                state_before: Optional[Dict[str, Any]] = None
+                if fingerprint is not None:
+                    # Other methods may have changed the state while the cache was read
+                    with self._state_lock:
+                        state_before = state_to_json(self._state)
+                calls_before = self._method_calls
+                self._method_calls += 1
+                self._running_methods += 1
+                ran_alone = self._running_methods == 1
+                try:
+                    limit = getattr(method, "__concurrency_limit__", None)
+                    if limit is None:
+                        result = await self._call_method(method, *args, **kwargs)
+                    else:
+                        semaphore = self._method_semaphores.get(method_name)
+                        if semaphore is None:
+                            semaphore = self._method_semaphores[method_name] = (
+                                asyncio.Semaphore(limit)
+                            )
+                        async with semaphore:
+                            result = await self._call_method(method, *args, **kwargs)
+                finally:
+                    self._running_methods -= 1
+                ran_alone = ran_alone and self._method_calls == calls_before + 1
+
+                if state_before is not None and not ran_alone:
+                    logger.warning(
+                        f"Not caching {method_name}, other methods ran while it did"
+                    )
+                elif state_before is not None:
+                    with self._state_lock:
+                        state_patch = make_patch(
+                            state_before, state_to_json(self._state)
+                        )
+                    await asyncio.get_running_loop().run_in_executor(
+                        None,
+                        self._persistence.save_cached_result,  # type: ignore[union-attr]
+                        fingerprint,
+                        method_name,
+                        result,
+                        state_patch,
+                    )
 
             self._method_outputs.append(result)
             self._method_execution_counts[method_name] = (
                 self._method_execution_counts.get(method_name, 0) + 1
             )
 
-            crewai_event_bus.emit(
-                self,
+            self._emit_state_event(
                 MethodExecutionFinishedEvent(
                     type="method_execution_finished",
                     method_name=method_name,
                     flow_name=self.name or self.__class__.__name__,
-                    state=self._copy_state(),
+                    state=self._snapshot_state(),
                     result=result,
+                    cached=recorded is not None,
                 ),
             )
 
@@ -876,6 +1345,88 @@ class Flow(Generic[T], metaclass=FlowMeta):
             )
             raise e
 
+    def _fingerprint(
+        self,
+        method_name: str,
+        method: Callable,
+        args: tuple,
+        kwargs: Dict[str, Any],
+    ) -> Optional[str]:
+        """Fingerprints a @cached method: its code and version, and its inputs.
+
+        Returns None if the inputs can't be serialized.
+        """
+        keys: Optional[List[str]] = getattr(method, "__cache_keys__", None)
+        with self._state_lock:
+            state = state_to_json(self._state)
+        if keys is None:
+            fields = {key: value for key, value in state.items() if key != "id"}
+        else:
+            missing = [key for key in keys if key not in state]
+            if missing:
+                raise ValueError(
+                    f"Cache keys of {method_name} are not state fields: {missing}"
+                )
+            fields = {key: state[key] for key in keys}
+
+        cls = self.__class__
+        try:
+            inputs = json.dumps(
+                {
+                    "method": f"{cls.__module__}.{cls.__qualname__}.{method_name}",
+                    "code": getattr(method, "__cache_code__", None),
+                    "version": getattr(method, "__cache_version__", None),
+                    "state": fields,
+                    "args": to_jsonable_python(args),
+                    "kwargs": to_jsonable_python(kwargs),
+                },
+                sort_keys=True,
+            )
+        except Exception as e:
+            logger.warning(f"Not caching {method_name}, its inputs can't be serialized: {e}")
+            return None
+        return hashlib.sha256(inputs.encode("utf-8")).hexdigest()
+
+    def _apply_state_patch(self, state_patch: JsonPatch) -> None:
+        """Applies the recorded state changes of a cached method to the state."""
+        with self._state_lock:
+            current = state_to_json(self._state)
+            patched = apply_patch(current, state_patch)
+            missing = object()
+            changed = [
+                key
+                for key in current.keys() | patched.keys()
+                if current.get(key, missing) != patched.get(key, missing)
+            ]
+            if isinstance(self._state, dict):
+                for key in changed:
+                    if key in patched:
+                        self._state[key] = patched[key]
+                    else:
+                        del self._state[key]
+            else:
+                model = type(self._state).model_validate(patched)
+                for key in changed:
+                    if key in patched:
+                        setattr(self._state, key, getattr(model, key))
+
+    async def _call_method(self, method: Callable, *args: Any, **kwargs: Any) -> Any:
+        """Awaits async methods and runs sync ones inline or in the flow's thread pool."""
+        if asyncio.iscoroutinefunction(method):
+            return await method(*args, **kwargs)
+        mode = getattr(method, "__sync_method_mode__", None) or self.sync_methods
+        if mode == "inline":
+            return method(*args, **kwargs)
+        return await self._run_in_thread(method, *args, **kwargs)
+
+    async def _run_in_thread(self, fn: Callable, *args: Any, **kwargs: Any) -> Any:
+        # The copied context carries context variables (e.g. tracing) into the thread
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor,
+            contextvars.copy_context().run,
+            functools.partial(fn, *args, **kwargs),
+        )
+
     async def _execute_listeners(self, trigger_method: str, result: Any) -> None:
         """
         Executes all listeners and routers triggered by a method completion.
@@ -911,9 +1462,11 @@ class Flow(Generic[T], metaclass=FlowMeta):
                 break
 
             for router_name in routers_triggered:
-                await self._execute_single_listener(router_name, result)
-                # After executing router, the router's result is the path
-                router_result = self._method_outputs[-1]
+                # The router's result is the path. It is taken from the call
+                # rather than _method_outputs, which parallel branches append to
+                router_result = await self._execute_single_listener(
+                    router_name, result
+                )
                 if router_result:  # Only add non-None results
                     router_results.append(router_result)
                 current_trigger = (
@@ -959,32 +1512,31 @@ class Flow(Generic[T], metaclass=FlowMeta):
 
         Notes
         -----
+        - Only the methods listening to trigger_method are looked at, found
+          through the trigger index built by FlowMeta
         - Handles both OR and AND conditions:
           * OR: Triggers if any condition is met
           * AND: Triggers only when all conditions are met
-        - Maintains state for AND conditions using _pending_and_listeners
-        - Separates router and normal listener evaluation
+        - Maintains state for AND conditions using _pending_and_listeners,
+          which is reset at the start of every run
         """
+        index = self._router_triggers if router_only else self._listener_triggers
         triggered = []
-        for listener_name, (condition_type, methods) in self._listeners.items():
-            is_router = listener_name in self._routers
-
-            if router_only != is_router:
-                continue
+        for listener_name in index.get(trigger_method, ()):
+            condition_type, methods = self._listeners[listener_name]
 
             if condition_type == "OR":
-                # If the trigger_method matches any in methods, run this
-                if trigger_method in methods:
-                    triggered.append(listener_name)
+                triggered.append(listener_name)
             elif condition_type == "AND":
                 # Initialize pending methods for this listener if not already done
-                if listener_name not in self._pending_and_listeners:
-                    self._pending_and_listeners[listener_name] = set(methods)
-                # Remove the trigger method from pending methods
-                if trigger_method in self._pending_and_listeners[listener_name]:
-                    self._pending_and_listeners[listener_name].discard(trigger_method)
+                pending = self._pending_and_listeners.get(listener_name)
+                if pending is None:
+                    pending = self._pending_and_listeners[listener_name] = set(
+                        methods
+                    )
+                pending.discard(trigger_method)
 
-                if not self._pending_and_listeners[listener_name]:
+                if not pending:
                     # All required methods have been executed
                     triggered.append(listener_name)
                     # Reset pending methods for this listener
@@ -992,7 +1544,7 @@ class Flow(Generic[T], metaclass=FlowMeta):
 
         return triggered
 
-    async def _execute_single_listener(self, listener_name: str, result: Any) -> None:
+    async def _execute_single_listener(self, listener_name: str, result: Any) -> Any:
         """
         Executes a single listener method with proper event handling.
 
@@ -1007,6 +1559,11 @@ class Flow(Generic[T], metaclass=FlowMeta):
             The result from the triggering method, which may be passed
             to the listener if it accepts parameters.
 
+        Returns
+        -------
+        Any
+            The listener's own result.
+
         Notes
         -----
         - Inspects method signature to determine if it accepts the trigger result
@@ -1036,6 +1593,7 @@ class Flow(Generic[T], metaclass=FlowMeta):
 
             # Execute listeners (and possibly routers) of this listener
             await self._execute_listeners(listener_name, listener_result)
+            return listener_result
 
         except Exception as e:
             print(
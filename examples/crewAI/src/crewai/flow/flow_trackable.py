@@ -4,6 +4,7 @@ from typing import Optional
 from pydantic import BaseModel, Field, InstanceOf, model_validator
 
 from crewai.flow import Flow
+from crewai.flow.flow import get_current_flow
 
 
 class FlowTrackable(BaseModel):
@@ -11,7 +12,8 @@ class FlowTrackable(BaseModel):
     Flow instance that created a Crew or Agent.
 
     Automatically finds and stores a reference to the parent Flow instance by
-    inspecting the call stack.
+    inspecting the call stack, or else takes the flow running in the current
+    context, which stays correct when many flows run concurrently.
     """
 
     parent_flow: Optional[InstanceOf[Flow]] = Field(
@@ -42,4 +44,7 @@ class FlowTrackable(BaseModel):
         finally:
             del frame
 
+        if self.parent_flow is None:
+            self.parent_flow = get_current_flow()
+
         return self
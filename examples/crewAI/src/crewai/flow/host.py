@@ -0,0 +1,153 @@
+"""
+Concurrent execution of many flows on one event loop.
+
+``Flow.kickoff`` starts an event loop of its own and a thread pool per run.
+A ``FlowHost`` instead runs flows as tasks of the event loop it is used from,
+so a service can handle many flows at once from a single process: at most
+``max_concurrent_flows`` run at the same time, and the synchronous methods of
+all of them that run in threads share one thread pool. Every flow runs in its
+own task, so ``get_current_flow`` and the objects it creates refer to the
+right flow.
+
+Example:
+    ```python
+    from crewai.flow import FlowHost
+
+    host = FlowHost(max_concurrent_flows=100)
+
+    async def handle_webhook(payload):
+        return await host.run(LeadFlow(), inputs=payload)
+    ```
+"""
+
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional, Set
+
+from crewai.flow.flow import Flow
+
+logger = logging.getLogger(__name__)
+
+
+class FlowHost:
+    """Runs flows concurrently on the running event loop.
+
+    Flows waiting for a free slot are started in the order they were
+    submitted. A flow instance can only run once at a time; create one
+    instance per request.
+    """
+
+    def __init__(
+        self,
+        max_concurrent_flows: Optional[int] = None,
+        max_workers: Optional[int] = None,
+    ):
+        """Initialize the host.
+
+        Args:
+            max_concurrent_flows: Maximum number of flows running at the same
+                time. None does not limit them.
+            max_workers: Size of the thread pool shared by the synchronous
+                methods that run in threads, in all flows. None uses the
+                ThreadPoolExecutor default.
+
+        Raises:
+            ValueError: If max_concurrent_flows or max_workers is not positive
+        """
+        if max_concurrent_flows is not None and max_concurrent_flows < 1:
+            raise ValueError("max_concurrent_flows must be at least 1")
+        if max_workers is not None and max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+
+        self.max_concurrent_flows = max_concurrent_flows
+        self.max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._tasks: Set["asyncio.Task[Any]"] = set()
+        self._running: Set[int] = set()
+        self._closed = False
+
+    @property
+    def active_flows(self) -> int:
+        """Number of flows submitted and not finished yet, including waiting ones."""
+        return len(self._tasks)
+
+    def start(
+        self, flow: Flow, inputs: Optional[Dict[str, Any]] = None
+    ) -> "asyncio.Task[Any]":
+        """Submits a flow and returns the task running it.
+
+        Must be called from the event loop. Awaiting the task returns the
+        flow's output or raises its error. Errors are logged as well, so the
+        failures of flows nobody awaits are not lost.
+
+        Raises:
+            RuntimeError: If the host is closed or the flow is already running
+        """
+        if self._closed:
+            raise RuntimeError("FlowHost is closed")
+        if id(flow) in self._running:
+            raise RuntimeError(
+                f"Flow {flow.flow_id} is already running; create a new instance per run"
+            )
+        if self.max_concurrent_flows is not None and self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_concurrent_flows)
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="flow-host"
+            )
+
+        self._running.add(id(flow))
+        task = asyncio.get_running_loop().create_task(self._run(flow, inputs))
+        self._tasks.add(task)
+        task.add_done_callback(self._finished)
+        return task
+
+    async def run(self, flow: Flow, inputs: Optional[Dict[str, Any]] = None) -> Any:
+        """Runs a flow on the host and returns its output."""
+        return await self.start(flow, inputs)
+
+    async def join(self) -> None:
+        """Waits until every submitted flow has finished, successfully or not."""
+        while self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def close(self) -> None:
+        """Stops accepting flows, waits for the running ones and releases the
+        thread pool."""
+        self._closed = True
+        await self.join()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    async def __aenter__(self) -> "FlowHost":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    async def _run(self, flow: Flow, inputs: Optional[Dict[str, Any]]) -> Any:
+        try:
+            if self._slots is None:
+                return await self._kickoff(flow, inputs)
+            async with self._slots:
+                return await self._kickoff(flow, inputs)
+        finally:
+            self._running.discard(id(flow))
+
+    async def _kickoff(self, flow: Flow, inputs: Optional[Dict[str, Any]]) -> Any:
+        # A flow that has an executor uses it instead of creating its own
+        flow._executor = self._executor
+        try:
+            return await flow.kickoff_async(inputs)
+        finally:
+            flow._executor = None
+
+    def _finished(self, task: "asyncio.Task[Any]") -> None:
+        self._tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(
+                "Flow run failed", exc_info=task.exception()  # type: ignore[arg-type]
+            )
@@ -1,7 +1,8 @@
 """Base class for flow state persistence."""
 
 import abc
-from typing import Any, Dict, Optional, Union
+from datetime import timedelta
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from pydantic import BaseModel
 
@@ -51,3 +52,86 @@ class FlowPersistence(abc.ABC):
             The most recent state as a dictionary, or None if no state exists
         """
         pass
+
+    def save_progress(self, flow_uuid: str, name: str, key: str, result: Any) -> None:
+        """Record the result of one finished item of a Flow.map fan-out.
+
+        Backends that do not override the progress methods run interrupted
+        fan-outs again from the start.
+
+        Args:
+            flow_uuid: Unique identifier for the flow instance
+            name: Name of the fan-out within the flow
+            key: Key of the finished item
+            result: Result of the item
+        """
+        pass
+
+    def load_progress(self, flow_uuid: str, name: str) -> Dict[str, Any]:
+        """Load the results of the finished items of a fan-out, by item key.
+
+        Args:
+            flow_uuid: Unique identifier for the flow instance
+            name: Name of the fan-out within the flow
+
+        Returns:
+            The recorded results, or an empty dictionary if there are none
+        """
+        return {}
+
+    def clear_progress(self, flow_uuid: str, name: str) -> None:
+        """Forget the recorded results of a fan-out once it has completed.
+
+        Args:
+            flow_uuid: Unique identifier for the flow instance
+            name: Name of the fan-out within the flow
+        """
+        pass
+
+    def save_cached_result(
+        self,
+        fingerprint: str,
+        method_name: str,
+        result: Any,
+        state_patch: List[Dict[str, Any]],
+    ) -> None:
+        """Record the outcome of a @cached flow method.
+
+        Backends that do not override the cache methods never skip cached
+        methods.
+
+        Args:
+            fingerprint: Fingerprint of the method and the inputs it ran with
+            method_name: Name of the method
+            result: Return value of the method
+            state_patch: JSON patch of the changes the method made to the state
+        """
+        pass
+
+    def load_cached_result(
+        self, fingerprint: str
+    ) -> Optional[Tuple[Any, List[Dict[str, Any]]]]:
+        """Load the outcome recorded for a fingerprint of a @cached method.
+
+        Args:
+            fingerprint: Fingerprint of the method and its inputs
+
+        Returns:
+            The result and state patch, or None if nothing was recorded
+        """
+        return None
+
+    def clear_cached_results(
+        self,
+        method_name: Optional[str] = None,
+        older_than: Optional[timedelta] = None,
+    ) -> None:
+        """Forget recorded outcomes of @cached flow methods.
+
+        Args:
+            method_name: Only forget the outcomes of methods with this name.
+                None forgets those of every method.
+            older_than: Only forget outcomes recorded longer ago than this.
+                None forgets them regardless of their age.
+        """
+        pass
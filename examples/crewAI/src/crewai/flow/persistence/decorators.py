@@ -22,12 +22,18 @@ Example:
 """
 
 import asyncio
+import contextlib
 import functools
 import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import (
     Any,
     Callable,
+    Literal,
     Optional,
+    Tuple,
     Type,
     TypeVar,
     Union,
@@ -58,7 +64,7 @@ class PersistenceDecorator:
     _printer = Printer()  # Class-level printer instance
 
     @classmethod
-    def persist_state(cls, flow_instance: Any, method_name: str, persistence_instance: FlowPersistence, verbose: bool = False) -> None:
+    def persist_state(cls, flow_instance: Any, method_name: str, persistence_instance: FlowPersistence, verbose: bool = False, state: Any = None) -> None:
         """Persist flow state with proper error handling and logging.
 
         This method handles the persistence of flow state data, including proper
@@ -69,14 +75,20 @@ class PersistenceDecorator:
             method_name: Name of the method that triggered persistence
             persistence_instance: The persistence backend to use
             verbose: Whether to log persistence operations
+            state: Snapshot of the state to persist instead of the live state
 
         Raises:
             ValueError: If flow has no state or state lacks an ID
             RuntimeError: If state persistence fails
             AttributeError: If flow instance lacks required state attributes
         """
+        # Distributed workers leave saving the merged state to their coordinator
+        if getattr(flow_instance, '_suspend_persistence', False):
+            return
         try:
-            state = getattr(flow_instance, 'state', None)
+            snapshot = state is not None
+            if not snapshot:
+                state = getattr(flow_instance, 'state', None)
             if state is None:
                 raise ValueError("Flow instance has no state")
 
@@ -95,11 +107,17 @@ class PersistenceDecorator:
                 logger.info(LOG_MESSAGES["save_state"].format(flow_uuid))
 
             try:
-                persistence_instance.save_state(
-                    flow_uuid=flow_uuid,
-                    method_name=method_name,
-                    state_data=state,
-                )
+                # Methods in parallel threads may be updating the live state meanwhile
+                with (
+                    contextlib.nullcontext()
+                    if snapshot
+                    else getattr(flow_instance, 'state_lock', contextlib.nullcontext())
+                ):
+                    persistence_instance.save_state(
+                        flow_uuid=flow_uuid,
+                        method_name=method_name,
+                        state_data=state,
+                    )
             except Exception as e:
                 error_msg = LOG_MESSAGES["save_error"].format(method_name, str(e))
                 cls._printer.print(error_msg, color="red")
@@ -117,7 +135,97 @@ class PersistenceDecorator:
             raise ValueError(error_msg) from e
 
 
-def persist(persistence: Optional[FlowPersistence] = None, verbose: bool = False):
+WritePolicy = Literal["every_method", "interval", "routers", "flow_end"]
+
+
+class StateWriter:
+    """Writes the state of one flow instance from a background thread.
+
+    Depending on the write policy, a finished method requests a write only if
+    the last one was at least ``interval`` seconds ago ("interval"), only if it
+    is a router ("routers") or never ("flow_end"). Requests that are not written
+    are remembered and ``flush`` writes them when the flow run ends. A request
+    copies the state under the flow's state lock, on the thread making it, so
+    the writer never reads the state while a method changes it. Requests made
+    while a write is queued replace its copy with theirs.
+    """
+
+    def __init__(
+        self,
+        persistence: FlowPersistence,
+        policy: WritePolicy,
+        interval: float = 1.0,
+        verbose: bool = False,
+    ):
+        self.persistence = persistence
+        self.policy = policy
+        self.interval = interval
+        self.verbose = verbose
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._last_write: Optional[Future] = None
+        self._pending: Optional[Tuple[str, Any]] = None  # method and state of the queued write
+        self._unwritten: Optional[str] = None  # method of the latest unwritten request
+        self._last_request = float("-inf")
+
+    def method_finished(self, flow_instance: Any, method_name: str, is_router: bool) -> None:
+        with self._lock:
+            write = (
+                (self.policy == "routers" and is_router)
+                or (
+                    self.policy == "interval"
+                    and time.monotonic() - self._last_request >= self.interval
+                )
+            )
+            self._unwritten = method_name
+            if write:
+                self._submit(flow_instance)
+
+    def _submit(self, flow_instance: Any) -> None:
+        self._last_request = time.monotonic()
+        queued = self._pending is not None
+        self._pending = (cast(str, self._unwritten), flow_instance._copy_state())
+        self._unwritten = None
+        if queued:
+            return
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="flow-state-writer"
+            )
+        self._last_write = self._executor.submit(self._write, flow_instance)
+
+    def _write(self, flow_instance: Any) -> None:
+        with self._lock:
+            method_name, state = cast(Tuple[str, Any], self._pending)
+            self._pending = None
+        PersistenceDecorator.persist_state(
+            flow_instance, method_name, self.persistence, self.verbose, state=state
+        )
+
+    def flush(self, flow_instance: Any) -> None:
+        """Writes any unwritten state and waits for all writes to finish.
+
+        Raises:
+            RuntimeError, ValueError: The error of the last write, as it
+                supersedes the earlier ones; their errors are only logged
+        """
+        with self._lock:
+            if self._unwritten is not None:
+                self._submit(flow_instance)
+            last_write, self._last_write = self._last_write, None
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+        if last_write is not None:
+            last_write.result()
+
+
+def persist(
+    persistence: Optional[FlowPersistence] = None,
+    verbose: bool = False,
+    write_policy: WritePolicy = "every_method",
+    write_interval: float = 1.0,
+):
     """Decorator to persist flow state.
 
     This decorator can be applied at either the class level or method level.
@@ -129,12 +237,21 @@ def persist(persistence: Optional[FlowPersistence] = None, verbose: bool = False
         persistence: Optional FlowPersistence implementation to use.
                     If not provided, uses SQLiteFlowPersistence.
         verbose: Whether to log persistence operations. Defaults to False.
+        write_policy: When class-level persistence writes the state. "every_method"
+                    writes it after every method, before the next one starts.
+                    The other policies write from a background thread and
+                    flush when the flow run ends, whether it succeeds or fails:
+                    "interval" writes at most once every write_interval
+                    seconds, "routers" after routers only, and "flow_end"
+                    only when the run ends.
+        write_interval: Seconds between writes for the "interval" policy.
 
     Returns:
         A decorator that can be applied to either a class or method
 
     Raises:
-        ValueError: If the flow state doesn't have an 'id' field
+        ValueError: If the flow state doesn't have an 'id' field, or a write
+                    policy is given for a method
         RuntimeError: If state persistence fails
 
     Example:
@@ -143,6 +260,10 @@ def persist(persistence: Optional[FlowPersistence] = None, verbose: bool = False
             @start()
             def begin(self):
                 pass
+
+        @persist(write_policy="interval", write_interval=5)
+        class ChattyFlow(Flow[MyState]):
+            ...
     """
     def decorator(target: Union[Type, Callable[..., T]]) -> Union[Type, Callable[..., T]]:
         """Decorator that handles both class and method decoration."""
@@ -157,9 +278,40 @@ def persist(persistence: Optional[FlowPersistence] = None, verbose: bool = False
                 if 'persistence' not in kwargs:
                     kwargs['persistence'] = actual_persistence
                 original_init(self, *args, **kwargs)
+                if write_policy != "every_method":
+                    self._state_writer = StateWriter(
+                        actual_persistence, write_policy, write_interval, verbose
+                    )
 
             setattr(target, "__init__", new_init)
 
+            if write_policy != "every_method":
+                original_kickoff_async = getattr(target, "kickoff_async")
+
+                @functools.wraps(original_kickoff_async)
+                async def kickoff_async(self: Any, *args: Any, **kwargs: Any) -> Any:
+                    loop = asyncio.get_running_loop()
+                    try:
+                        result = await original_kickoff_async(self, *args, **kwargs)
+                    except BaseException:
+                        # Keep the flow's error rather than one from the final write
+                        with contextlib.suppress(Exception):
+                            await loop.run_in_executor(None, self._state_writer.flush, self)
+                        raise
+                    await loop.run_in_executor(None, self._state_writer.flush, self)
+                    return result
+
+                setattr(target, "kickoff_async", kickoff_async)
+
+            def save(flow_instance: Any, method_name: str, method: Callable) -> None:
+                if getattr(flow_instance, "_suspend_persistence", False):
+                    return
+                writer = getattr(flow_instance, "_state_writer", None)
+                if writer is None:
+                    PersistenceDecorator.persist_state(flow_instance, method_name, actual_persistence, verbose)
+                else:
+                    writer.method_finished(flow_instance, method_name, hasattr(method, "__is_router__"))
+
             # Store original methods to preserve their decorators
             original_methods = {}
 
@@ -181,7 +333,7 @@ def persist(persistence: Optional[FlowPersistence] = None, verbose: bool = False
                         @functools.wraps(original_method)
                         async def method_wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
                             result = await original_method(self, *args, **kwargs)
-                            PersistenceDecorator.persist_state(self, method_name, actual_persistence, verbose)
+                            save(self, method_name, original_method)
                             return result
                         return method_wrapper
 
@@ -201,7 +353,7 @@ def persist(persistence: Optional[FlowPersistence] = None, verbose: bool = False
                         @functools.wraps(original_method)
                         def method_wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
                             result = original_method(self, *args, **kwargs)
-                            PersistenceDecorator.persist_state(self, method_name, actual_persistence, verbose)
+                            save(self, method_name, original_method)
                             return result
                         return method_wrapper
 
@@ -219,6 +371,8 @@ def persist(persistence: Optional[FlowPersistence] = None, verbose: bool = False
             return target
         else:
             # Method decoration
+            if write_policy != "every_method":
+                raise ValueError("write_policy only applies to class-level @persist")
             method = target
             setattr(method, "__is_flow_method__", True)
 
@@ -0,0 +1,64 @@
+"""
+Minimal JSON Patch (RFC 6902) support for storing flow states as deltas.
+
+Only the operations needed to turn one JSON object into another are produced:
+``add``, ``remove`` and ``replace``. Objects are diffed key by key; any other
+changed value, including lists, is replaced as a whole.
+"""
+
+import copy
+import json
+from typing import Any, Dict, List
+
+from pydantic import BaseModel
+
+JsonPatch = List[Dict[str, Any]]
+
+
+def state_to_json(state: Any) -> Dict[str, Any]:
+    """Returns the flow state as a JSON-compatible dictionary."""
+    if isinstance(state, BaseModel):
+        return state.model_dump(mode="json")
+    return json.loads(json.dumps(state))
+
+
+def _escape(key: str) -> str:
+    return key.replace("~", "~0").replace("/", "~1")
+
+
+def _unescape(token: str) -> str:
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+def make_patch(old: Dict[str, Any], new: Dict[str, Any], path: str = "") -> JsonPatch:
+    """Returns the operations that turn ``old`` into ``new``."""
+    patch: JsonPatch = []
+    for key in old:
+        if key not in new:
+            patch.append({"op": "remove", "path": f"{path}/{_escape(key)}"})
+    for key, value in new.items():
+        key_path = f"{path}/{_escape(key)}"
+        if key not in old:
+            patch.append({"op": "add", "path": key_path, "value": value})
+        elif isinstance(value, dict) and isinstance(old[key], dict):
+            patch.extend(make_patch(old[key], value, key_path))
+        elif value != old[key] or type(value) is not type(old[key]):
+            patch.append({"op": "replace", "path": key_path, "value": value})
+    return patch
+
+
+def apply_patch(document: Dict[str, Any], patch: JsonPatch) -> Dict[str, Any]:
+    """Applies ``patch`` to a copy of ``document`` and returns the copy."""
+    document = copy.deepcopy(document)
+    for operation in patch:
+        *parents, key = [_unescape(token) for token in operation["path"].split("/")[1:]]
+        target = document
+        for parent in parents:
+            target = target[parent]
+        if operation["op"] == "remove":
+            del target[key]
+        elif operation["op"] in ("add", "replace"):
+            target[key] = copy.deepcopy(operation["value"])
+        else:
+            raise ValueError(f"Unsupported JSON patch operation: {operation['op']}")
+    return document
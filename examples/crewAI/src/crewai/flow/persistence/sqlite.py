@@ -3,14 +3,22 @@ SQLite-based implementation of flow state persistence.
 """
 
 import json
+import logging
+import os
+import pickle
 import sqlite3
-from datetime import datetime, timezone
+import threading
+import zlib
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from pydantic import BaseModel
 
 from crewai.flow.persistence.base import FlowPersistence
+from crewai.flow.persistence.json_patch import apply_patch, make_patch
+
+logger = logging.getLogger(__name__)
 
 
 class SQLiteFlowPersistence(FlowPersistence):
@@ -19,19 +27,39 @@ class SQLiteFlowPersistence(FlowPersistence):
     This class provides a simple, file-based persistence implementation using SQLite.
     It's suitable for development and testing, or for production use cases with
     moderate performance requirements.
+
+    A single connection in WAL mode is kept open and shared by the threads of
+    a process. By default every save stores the full state. With
+    ``checkpoint_every`` greater than one, only a JSON patch against the
+    previous save is stored in between full checkpoints, and ``load_state``
+    replays the patches on top of the last checkpoint. ``compress`` stores
+    rows zlib-compressed, and ``keep_last`` prunes all but the newest states
+    of each flow.
     """
 
     db_path: str
 
-    def __init__(self, db_path: Optional[str] = None):
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        checkpoint_every: int = 1,
+        compress: bool = False,
+        keep_last: Optional[int] = None,
+    ):
         """Initialize SQLite persistence.
 
         Args:
             db_path: Path to the SQLite database file. If not provided, uses
                     db_storage_path() from utilities.paths.
+            checkpoint_every: Store the full state every this many saves of a
+                    flow, and deltas against the previous save in between.
+            compress: Whether to zlib-compress the stored states.
+            keep_last: Number of most recent states to keep per flow. Older
+                    ones are deleted as new ones are saved. None keeps all.
 
         Raises:
-            ValueError: If db_path is invalid
+            ValueError: If db_path is invalid, or checkpoint_every or keep_last
+                    is not positive
         """
         from crewai.utilities.paths import db_storage_path
 
@@ -40,13 +68,62 @@ class SQLiteFlowPersistence(FlowPersistence):
 
         if not path:
             raise ValueError("Database path must be provided")
+        if checkpoint_every < 1:
+            raise ValueError("checkpoint_every must be at least 1")
+        if keep_last is not None and keep_last < 1:
+            raise ValueError("keep_last must be at least 1")
 
         self.db_path = path  # Now mypy knows this is str
+        self.checkpoint_every = checkpoint_every
+        self.compress = compress
+        self.keep_last = keep_last
+
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._conn_pid: Optional[int] = None
+        # flow_uuid -> (id of the last row saved by this instance, saves since
+        # the last full checkpoint, the state it stored), used to write deltas
+        self._last_saved: Dict[str, Tuple[int, int, Dict[str, Any]]] = {}
         self.init_db()
 
+    def _connection(self) -> sqlite3.Connection:
+        """Returns the shared connection, opening a new one in a forked child."""
+        if self._conn is None or self._conn_pid != os.getpid():
+            conn = sqlite3.connect(
+                self.db_path, timeout=30, check_same_thread=False, isolation_level=None
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn = conn
+            self._conn_pid = os.getpid()
+            self._last_saved = {}
+        return self._conn
+
+    def close(self) -> None:
+        """Closes the shared connection. It is reopened on the next use."""
+        with self._lock:
+            if self._conn is not None and self._conn_pid == os.getpid():
+                self._conn.close()
+            self._conn = None
+            self._last_saved = {}
+
+    def __del__(self) -> None:
+        if getattr(self, "_conn", None) is not None and self._conn_pid == os.getpid():
+            self._conn.close()  # type: ignore[union-attr]
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        state.update(_lock=None, _conn=None, _conn_pid=None, _last_saved={})
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
     def init_db(self) -> None:
         """Create the necessary tables if they don't exist."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._lock:
+            conn = self._connection()
             conn.execute(
                 """
             CREATE TABLE IF NOT EXISTS flow_states (
@@ -54,15 +131,48 @@ class SQLiteFlowPersistence(FlowPersistence):
                 flow_uuid TEXT NOT NULL,
                 method_name TEXT NOT NULL,
                 timestamp DATETIME NOT NULL,
-                state_json TEXT NOT NULL
+                state_json TEXT NOT NULL,
+                kind TEXT NOT NULL DEFAULT 'full',
+                encoding TEXT NOT NULL DEFAULT 'json'
+            )
+            """
             )
+            # Databases created before deltas and compression lack these columns
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(flow_states)")}
+            for column, default in (("kind", "full"), ("encoding", "json")):
+                if column not in columns:
+                    conn.execute(
+                        f"ALTER TABLE flow_states ADD COLUMN {column} TEXT NOT NULL DEFAULT '{default}'"
+                    )
+            # Composite index serving both the per-flow lookups and their
+            # ordering by id; it supersedes the former flow_uuid-only index
+            conn.execute(
+                """
+            CREATE INDEX IF NOT EXISTS idx_flow_states_uuid_id
+            ON flow_states(flow_uuid, id)
             """
             )
-            # Add index for faster UUID lookups
+            conn.execute("DROP INDEX IF EXISTS idx_flow_states_uuid")
             conn.execute(
                 """
-            CREATE INDEX IF NOT EXISTS idx_flow_states_uuid
-            ON flow_states(flow_uuid)
+            CREATE TABLE IF NOT EXISTS flow_map_progress (
+                flow_uuid TEXT NOT NULL,
+                name TEXT NOT NULL,
+                item_key TEXT NOT NULL,
+                result BLOB NOT NULL,
+                PRIMARY KEY (flow_uuid, name, item_key)
+            )
+            """
+            )
+            conn.execute(
+                """
+            CREATE TABLE IF NOT EXISTS flow_method_cache (
+                fingerprint TEXT PRIMARY KEY,
+                method_name TEXT NOT NULL,
+                timestamp DATETIME NOT NULL,
+                result BLOB NOT NULL,
+                state_patch TEXT NOT NULL
+            )
             """
             )
 
@@ -89,23 +199,63 @@ class SQLiteFlowPersistence(FlowPersistence):
                 f"state_data must be either a Pydantic BaseModel or dict, got {type(state_data)}"
             )
 
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute(
-                """
-            INSERT INTO flow_states (
-                flow_uuid,
-                method_name,
-                timestamp,
-                state_json
-            ) VALUES (?, ?, ?, ?)
-            """,
-                (
+        state_json = json.dumps(state_dict)
+
+        with self._lock:
+            conn = self._connection()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                kind, payload = "full", state_json
+                saved_state: Optional[Dict[str, Any]] = None
+                saves_since_full = 0
+                if self.checkpoint_every > 1:
+                    # Compare the states as they round-trip through JSON
+                    saved_state = json.loads(state_json)
+                    last = self._last_saved.get(flow_uuid)
+                    if (
+                        last is not None
+                        and last[1] + 1 < self.checkpoint_every
+                        and last[0] == self._latest_id(conn, flow_uuid)
+                    ):
+                        kind = "delta"
+                        payload = json.dumps(make_patch(last[2], saved_state))
+                        saves_since_full = last[1] + 1
+
+                encoding = "zlib" if self.compress else "json"
+                cursor = conn.execute(
+                    """
+                INSERT INTO flow_states (
                     flow_uuid,
                     method_name,
-                    datetime.now(timezone.utc).isoformat(),
-                    json.dumps(state_dict),
-                ),
-            )
+                    timestamp,
+                    state_json,
+                    kind,
+                    encoding
+                ) VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                    (
+                        flow_uuid,
+                        method_name,
+                        datetime.now(timezone.utc).isoformat(),
+                        zlib.compress(payload.encode("utf-8")) if self.compress else payload,
+                        kind,
+                        encoding,
+                    ),
+                )
+                if self.keep_last is not None:
+                    self._prune(conn, flow_uuid)
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                self._last_saved.pop(flow_uuid, None)
+                raise
+
+            if saved_state is not None and cursor.lastrowid is not None:
+                self._last_saved[flow_uuid] = (
+                    cursor.lastrowid,
+                    saves_since_full,
+                    saved_state,
+                )
 
     def load_state(self, flow_uuid: str) -> Optional[Dict[str, Any]]:
         """Load the most recent state for a given flow UUID.
@@ -116,19 +266,159 @@ class SQLiteFlowPersistence(FlowPersistence):
         Returns:
             The most recent state as a dictionary, or None if no state exists
         """
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute(
+        with self._lock:
+            rows = self._connection().execute(
                 """
-            SELECT state_json
+            SELECT kind, encoding, state_json
             FROM flow_states
             WHERE flow_uuid = ?
-            ORDER BY id DESC
-            LIMIT 1
+              AND id >= (
+                SELECT MAX(id) FROM flow_states
+                WHERE flow_uuid = ? AND kind = 'full'
+              )
+            ORDER BY id
+            """,
+                (flow_uuid, flow_uuid),
+            ).fetchall()
+
+        state: Optional[Dict[str, Any]] = None
+        for kind, encoding, payload in rows:
+            if encoding == "zlib":
+                payload = zlib.decompress(payload).decode("utf-8")
+            if kind == "full":
+                state = json.loads(payload)
+            elif state is not None:
+                state = apply_patch(state, json.loads(payload))
+        return state
+
+    def save_progress(self, flow_uuid: str, name: str, key: str, result: Any) -> None:
+        """Record the result of one finished item of a Flow.map fan-out.
+
+        Results are pickled; results that cannot be pickled are not recorded,
+        so their items run again when the fan-out resumes.
+        """
+        try:
+            payload = pickle.dumps(result)
+        except Exception as e:
+            logger.warning(f"Not recording progress of item {key} of {name}: {e}")
+            return
+        with self._lock:
+            self._connection().execute(
+                """
+            INSERT OR REPLACE INTO flow_map_progress (flow_uuid, name, item_key, result)
+            VALUES (?, ?, ?, ?)
             """,
-                (flow_uuid,),
+                (flow_uuid, name, key, payload),
             )
-            row = cursor.fetchone()
 
-        if row:
-            return json.loads(row[0])
-        return None
+    def load_progress(self, flow_uuid: str, name: str) -> Dict[str, Any]:
+        """Load the results of the finished items of a fan-out, by item key."""
+        with self._lock:
+            rows = self._connection().execute(
+                "SELECT item_key, result FROM flow_map_progress WHERE flow_uuid = ? AND name = ?",
+                (flow_uuid, name),
+            ).fetchall()
+        return {key: pickle.loads(payload) for key, payload in rows}
+
+    def clear_progress(self, flow_uuid: str, name: str) -> None:
+        """Forget the recorded results of a fan-out once it has completed."""
+        with self._lock:
+            self._connection().execute(
+                "DELETE FROM flow_map_progress WHERE flow_uuid = ? AND name = ?",
+                (flow_uuid, name),
+            )
+
+    def save_cached_result(
+        self,
+        fingerprint: str,
+        method_name: str,
+        result: Any,
+        state_patch: List[Dict[str, Any]],
+    ) -> None:
+        """Record the outcome of a @cached flow method.
+
+        Results are pickled; results that cannot be pickled are not recorded,
+        so the method runs again next time.
+        """
+        try:
+            payload = pickle.dumps(result)
+        except Exception as e:
+            logger.warning(f"Not caching the result of {method_name}: {e}")
+            return
+        with self._lock:
+            self._connection().execute(
+                """
+            INSERT OR REPLACE INTO flow_method_cache (
+                fingerprint, method_name, timestamp, result, state_patch
+            ) VALUES (?, ?, ?, ?, ?)
+            """,
+                (
+                    fingerprint,
+                    method_name,
+                    datetime.now(timezone.utc).isoformat(),
+                    payload,
+                    json.dumps(state_patch),
+                ),
+            )
+
+    def load_cached_result(
+        self, fingerprint: str
+    ) -> Optional[Tuple[Any, List[Dict[str, Any]]]]:
+        """Load the outcome recorded for a fingerprint of a @cached method."""
+        with self._lock:
+            row = self._connection().execute(
+                "SELECT result, state_patch FROM flow_method_cache WHERE fingerprint = ?",
+                (fingerprint,),
+            ).fetchone()
+        if row is None:
+            return None
+        return pickle.loads(row[0]), json.loads(row[1])
+
+    def clear_cached_results(
+        self,
+        method_name: Optional[str] = None,
+        older_than: Optional[timedelta] = None,
+    ) -> None:
+        """Forget recorded outcomes of @cached flow methods, e.g. to prune old ones."""
+        conditions = []
+        params: List[Any] = []
+        if method_name is not None:
+            conditions.append("method_name = ?")
+            params.append(method_name)
+        if older_than is not None:
+            # Timestamps are ISO strings in UTC, so they sort chronologically
+            conditions.append("timestamp < ?")
+            params.append((datetime.now(timezone.utc) - older_than).isoformat())
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        with self._lock:
+            self._connection().execute(f"DELETE FROM flow_method_cache{where}", params)
+
+    @staticmethod
+    def _latest_id(conn: sqlite3.Connection, flow_uuid: str) -> Optional[int]:
+        return conn.execute(
+            "SELECT MAX(id) FROM flow_states WHERE flow_uuid = ?", (flow_uuid,)
+        ).fetchone()[0]
+
+    def _prune(self, conn: sqlite3.Connection, flow_uuid: str) -> None:
+        """Deletes all but the newest keep_last states of a flow, keeping the
+        checkpoint the oldest kept delta is based on."""
+        row = conn.execute(
+            """
+        SELECT id FROM flow_states WHERE flow_uuid = ?
+        ORDER BY id DESC LIMIT 1 OFFSET ?
+        """,
+            (flow_uuid, self.keep_last - 1),  # type: ignore[operator]
+        ).fetchone()
+        if row is None:
+            return
+        base = conn.execute(
+            """
+        SELECT MAX(id) FROM flow_states
+        WHERE flow_uuid = ? AND id <= ? AND kind = 'full'
+        """,
+            (flow_uuid, row[0]),
+        ).fetchone()[0]
+        conn.execute(
+            "DELETE FROM flow_states WHERE flow_uuid = ? AND id < ?",
+            (flow_uuid, base if base is not None else row[0]),
+        )
@@ -11,16 +11,79 @@ Example
 >>> flow = Flow()
 >>> node_levels = calculate_node_levels(flow)
 >>> ancestors = build_ancestor_dict(flow)
+
+The structure of a flow class is analysed once and cached in a FlowGraph (see
+get_flow_graph), and function sources are parsed once per module file, so
+plotting a flow repeatedly or defining many routers in one module stays cheap.
 """
 
 import ast
+import functools
 import inspect
+import os
 import textwrap
-from collections import defaultdict, deque
-from typing import Any, Deque, Dict, List, Optional, Set, Union
+import weakref
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Set, Tuple, Union
 
 
-def get_possible_return_constants(function: Any) -> Optional[List[str]]:
+@functools.lru_cache(maxsize=128)
+def _parse_module_functions(
+    filename: str, mtime: float
+) -> Dict[int, Union[ast.FunctionDef, ast.AsyncFunctionDef]]:
+    """
+    Parse a source file once and index its function definitions by the line
+    their code objects report as first line (the first decorator, if any).
+
+    The modification time is part of the cache key so edited files are
+    parsed again.
+    """
+    with open(filename, encoding="utf-8") as f:
+        tree = ast.parse(f.read(), filename)
+
+    functions: Dict[int, Union[ast.FunctionDef, ast.AsyncFunctionDef]] = {}
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            first_line = min(
+                [node.lineno] + [decorator.lineno for decorator in node.decorator_list]
+            )
+            functions.setdefault(first_line, node)
+    return functions
+
+
+def get_function_ast(function: Any) -> Optional[ast.AST]:
+    """
+    Get the AST of a function's definition.
+
+    The definition is looked up in the cached parse of its module file. Functions
+    whose file cannot be read (defined interactively, for instance) fall back to
+    parsing their own source.
+
+    Parameters
+    ----------
+    function : Any
+        The function or method to parse.
+
+    Returns
+    -------
+    Optional[ast.AST]
+        The function definition node, or None if its source is unavailable.
+    """
+    function = inspect.unwrap(function)
+    code = getattr(getattr(function, "__func__", function), "__code__", None)
+    if code is not None:
+        try:
+            filename = inspect.getsourcefile(function)
+            if filename:
+                functions = _parse_module_functions(
+                    filename, os.path.getmtime(filename)
+                )
+                node = functions.get(code.co_firstlineno)
+                if node is not None and node.name == code.co_name:
+                    return node
+        except (OSError, TypeError, SyntaxError, UnicodeDecodeError):
+            pass
+
     try:
         source = inspect.getsource(function)
     except OSError:
@@ -34,7 +97,7 @@ def get_possible_return_constants(function: Any) -> Optional[List[str]]:
         # Remove leading indentation
         source = textwrap.dedent(source)
         # Parse the source code into an AST
-        code_ast = ast.parse(source)
+        return ast.parse(source)
     except IndentationError as e:
         print(f"IndentationError while parsing source code of {function.__name__}: {e}")
         print(f"Source code:\n{source}")
@@ -48,6 +111,12 @@ def get_possible_return_constants(function: Any) -> Optional[List[str]]:
         print(f"Source code:\n{source}")
         return None
 
+
+def get_possible_return_constants(function: Any) -> Optional[List[str]]:
+    code_ast = get_function_ast(function)
+    if code_ast is None:
+        return None
+
     return_values = set()
     dict_definitions = {}
 
@@ -94,6 +163,144 @@ def get_possible_return_constants(function: Any) -> Optional[List[str]]:
     return list(return_values) if return_values else None
 
 
+class FlowGraph:
+    """
+    Structure of a flow class, computed once and shared by every plot of it.
+
+    Attributes
+    ----------
+    start_methods : List[str]
+        Start methods, in the order of the flow's methods.
+    dependents : Dict[str, List[str]]
+        Maps each trigger (a method name or a router output) to the listeners
+        waiting on it, in declaration order. This is the trigger index FlowMeta
+        compiles for the runtime, not a copy of it.
+    router_outputs : Set[str]
+        Every path any router of the flow can return.
+    parent_children : Dict[str, List[str]]
+        Maps each parent to its children, as built by build_parent_children_dict.
+    levels : Optional[Dict[str, int]]
+        Node levels, filled in by the first calculate_node_levels call.
+    """
+
+    def __init__(self, flow: Any):
+        self.start_methods: List[str] = [
+            name
+            for name, method in flow._methods.items()
+            if hasattr(method, "__is_start_method__")
+        ]
+        self.dependents: Dict[str, List[str]] = flow._dependents
+
+        self.router_outputs: Set[str] = {
+            path for paths in flow._router_paths.values() for path in paths
+        }
+
+        parent_children: Dict[str, Dict[str, None]] = {
+            trigger: dict.fromkeys(listeners)
+            for trigger, listeners in self.dependents.items()
+        }
+        for router_method_name, paths in flow._router_paths.items():
+            for path in paths:
+                for listener_name in self.dependents.get(path, ()):
+                    parent_children.setdefault(router_method_name, {})[
+                        listener_name
+                    ] = None
+        self.parent_children: Dict[str, List[str]] = {
+            parent: list(children) for parent, children in parent_children.items()
+        }
+
+        self._child_index: Dict[Tuple[str, str], int] = {
+            (parent, child): index
+            for parent, children in self.parent_children.items()
+            for index, child in enumerate(sorted(children))
+        }
+        self._components = _strongly_connected_components(self.parent_children)
+        self.levels: Optional[Dict[str, int]] = None
+
+    def child_index(self, parent: str, child: str) -> int:
+        """Index of child in the sorted children of parent, as get_child_index."""
+        return self._child_index[(parent, child)]
+
+    def is_cycle_edge(self, source: str, target: str) -> bool:
+        """Whether the edge from source to target lies on a cycle of the flow."""
+        component = self._components.get(source)
+        return component is not None and component == self._components.get(target)
+
+
+_flow_graphs: "weakref.WeakKeyDictionary[type, FlowGraph]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_flow_graph(flow: Any) -> FlowGraph:
+    """
+    Get the structure of a flow, analysing its class on first use.
+
+    Parameters
+    ----------
+    flow : Any
+        The flow instance to analyze.
+
+    Returns
+    -------
+    FlowGraph
+        The graph shared by all instances of the flow's class.
+    """
+    flow_class = type(flow)
+    graph = _flow_graphs.get(flow_class)
+    if graph is None:
+        graph = _flow_graphs[flow_class] = FlowGraph(flow)
+    return graph
+
+
+def _strongly_connected_components(
+    graph: Dict[str, List[str]],
+) -> Dict[str, int]:
+    """
+    Assign every node to its strongly connected component (iterative Tarjan).
+
+    Nodes that are part of no cycle get a component of their own, so an edge
+    lies on a cycle exactly when both of its ends share a component.
+    """
+    index: Dict[str, int] = {}
+    lowlink: Dict[str, int] = {}
+    on_stack: Set[str] = set()
+    stack: List[str] = []
+    components: Dict[str, int] = {}
+
+    for root in graph:
+        if root in index:
+            continue
+        work: List[Tuple[str, int]] = [(root, 0)]
+        while work:
+            node, child_position = work.pop()
+            if child_position == 0:
+                index[node] = lowlink[node] = len(index)
+                stack.append(node)
+                on_stack.add(node)
+            children = graph.get(node, [])
+            if child_position < len(children):
+                work.append((node, child_position + 1))
+                child = children[child_position]
+                if child not in index:
+                    work.append((child, 0))
+                elif child in on_stack:
+                    lowlink[node] = min(lowlink[node], index[child])
+                continue
+            if lowlink[node] == index[node]:
+                component = len(components)
+                while True:
+                    member = stack.pop()
+                    on_stack.discard(member)
+                    components[member] = component
+                    if member == node:
+                        break
+            if work:
+                parent = work[-1][0]
+                lowlink[parent] = min(lowlink[parent], lowlink[node])
+    return components
+
+
 def calculate_node_levels(flow: Any) -> Dict[str, int]:
     """
     Calculate the hierarchical level of each node in the flow.
@@ -117,42 +324,46 @@ def calculate_node_levels(flow: Any) -> Dict[str, int]:
     - Each subsequent connected node is assigned level = parent_level + 1
     - Handles both OR and AND conditions for listeners
     - Processes router paths separately
+    - Only the dependents of each node are visited, and the result is cached
+      per flow class
     """
+    graph = get_flow_graph(flow)
+    if graph.levels is not None:
+        return dict(graph.levels)
+
     levels: Dict[str, int] = {}
     queue: Deque[str] = deque()
     visited: Set[str] = set()
     pending_and_listeners: Dict[str, Set[str]] = {}
+    and_listeners: Dict[str, Set[str]] = {
+        listener_name: set(trigger_methods)
+        for listener_name, (condition_type, trigger_methods) in flow._listeners.items()
+        if condition_type == "AND"
+    }
 
     # Make all start methods at level 0
-    for method_name, method in flow._methods.items():
-        if hasattr(method, "__is_start_method__"):
-            levels[method_name] = 0
-            queue.append(method_name)
-
-    # Precompute listener dependencies
-    or_listeners = defaultdict(list)
-    and_listeners = defaultdict(set)
-    for listener_name, (condition_type, trigger_methods) in flow._listeners.items():
-        if condition_type == "OR":
-            for method in trigger_methods:
-                or_listeners[method].append(listener_name)
-        elif condition_type == "AND":
-            and_listeners[listener_name] = set(trigger_methods)
+    for method_name in graph.start_methods:
+        levels[method_name] = 0
+        queue.append(method_name)
 
     # Breadth-first traversal to assign levels
     while queue:
         current = queue.popleft()
         current_level = levels[current]
         visited.add(current)
+        dependents = graph.dependents.get(current, ())
 
-        for listener_name in or_listeners[current]:
+        for listener_name in dependents:
+            if flow._listeners[listener_name][0] != "OR":
+                continue
             if listener_name not in levels or levels[listener_name] > current_level + 1:
                 levels[listener_name] = current_level + 1
                 if listener_name not in visited:
                     queue.append(listener_name)
 
-        for listener_name, required_methods in and_listeners.items():
-            if current in required_methods:
+        for listener_name in dependents:
+            required_methods = and_listeners.get(listener_name)
+            if required_methods is not None:
                 if listener_name not in pending_and_listeners:
                     pending_and_listeners[listener_name] = set()
                 pending_and_listeners[listener_name].add(current)
@@ -169,7 +380,8 @@ def calculate_node_levels(flow: Any) -> Dict[str, int]:
         # Handle router connections
         process_router_paths(flow, current, current_level, levels, queue)
 
-    return levels
+    graph.levels = levels
+    return dict(levels)
 
 
 def count_outgoing_edges(flow: Any) -> Dict[str, int]:
@@ -245,23 +457,23 @@ def dfs_ancestors(
         return
     visited.add(node)
 
+    dependents = get_flow_graph(flow).dependents
+
     # Handle regular listeners
-    for listener_name, (_, trigger_methods) in flow._listeners.items():
-        if node in trigger_methods:
-            ancestors[listener_name].add(node)
-            ancestors[listener_name].update(ancestors[node])
-            dfs_ancestors(listener_name, ancestors, visited, flow)
+    for listener_name in dependents.get(node, ()):
+        ancestors[listener_name].add(node)
+        ancestors[listener_name].update(ancestors[node])
+        dfs_ancestors(listener_name, ancestors, visited, flow)
 
     # Handle router methods separately
     if node in flow._routers:
         router_method_name = node
         paths = flow._router_paths.get(router_method_name, [])
         for path in paths:
-            for listener_name, (_, trigger_methods) in flow._listeners.items():
-                if path in trigger_methods:
-                    # Only propagate the ancestors of the router method, not the router method itself
-                    ancestors[listener_name].update(ancestors[node])
-                    dfs_ancestors(listener_name, ancestors, visited, flow)
+            for listener_name in dependents.get(path, ()):
+                # Only propagate the ancestors of the router method, not the router method itself
+                ancestors[listener_name].update(ancestors[node])
+                dfs_ancestors(listener_name, ancestors, visited, flow)
 
 
 def is_ancestor(
@@ -307,28 +519,10 @@ def build_parent_children_dict(flow: Any) -> Dict[str, List[str]]:
     - Maps router methods to their paths and listeners
     - Children lists are sorted for consistent ordering
     """
-    parent_children: Dict[str, List[str]] = {}
-
-    # Map listeners to their trigger methods
-    for listener_name, (_, trigger_methods) in flow._listeners.items():
-        for trigger in trigger_methods:
-            if trigger not in parent_children:
-                parent_children[trigger] = []
-            if listener_name not in parent_children[trigger]:
-                parent_children[trigger].append(listener_name)
-
-    # Map router methods to their paths and to listeners
-    for router_method_name, paths in flow._router_paths.items():
-        for path in paths:
-            # Map router method to listeners of each path
-            for listener_name, (_, trigger_methods) in flow._listeners.items():
-                if path in trigger_methods:
-                    if router_method_name not in parent_children:
-                        parent_children[router_method_name] = []
-                    if listener_name not in parent_children[router_method_name]:
-                        parent_children[router_method_name].append(listener_name)
-
-    return parent_children
+    return {
+        parent: list(children)
+        for parent, children in get_flow_graph(flow).parent_children.items()
+    }
 
 
 def get_child_index(
@@ -361,16 +555,13 @@ def process_router_paths(flow, current, current_level, levels, queue):
     Handle the router connections for the current node.
     """
     if current in flow._routers:
+        dependents = get_flow_graph(flow).dependents
         paths = flow._router_paths.get(current, [])
         for path in paths:
-            for listener_name, (
-                condition_type,
-                trigger_methods,
-            ) in flow._listeners.items():
-                if path in trigger_methods:
-                    if (
-                        listener_name not in levels
-                        or levels[listener_name] > current_level + 1
-                    ):
-                        levels[listener_name] = current_level + 1
-                        queue.append(listener_name)
+            for listener_name in dependents.get(path, ()):
+                if (
+                    listener_name not in levels
+                    or levels[listener_name] > current_level + 1
+                ):
+                    levels[listener_name] = current_level + 1
+                    queue.append(listener_name)
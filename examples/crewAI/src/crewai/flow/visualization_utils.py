@@ -16,15 +16,9 @@ Example
 """
 
 import ast
-import inspect
 from typing import Any, Dict, List, Tuple, Union
 
-from .utils import (
-    build_ancestor_dict,
-    build_parent_children_dict,
-    get_child_index,
-    is_ancestor,
-)
+from .utils import get_flow_graph, get_function_ast
 
 
 def method_calls_crew(method: Any) -> bool:
@@ -44,14 +38,10 @@ def method_calls_crew(method: Any) -> bool:
     Notes
     -----
     Uses AST analysis to detect method calls, specifically looking for
-    attribute access of 'crew'.
+    attribute access of 'crew'. The method's module is parsed once and cached.
     """
-    try:
-        source = inspect.getsource(method)
-        source = inspect.cleandoc(source)
-        tree = ast.parse(source)
-    except Exception as e:
-        print(f"Could not parse method {method.__name__}: {e}")
+    tree = get_function_ast(method)
+    if tree is None:
         return False
 
     class CrewCallVisitor(ast.NodeVisitor):
@@ -203,9 +193,10 @@ def add_edges(
     - Handles both normal listener edges and router edges
     - Applies appropriate styling (color, dashes) based on edge type
     - Adds curvature to edges when needed (cycles or multiple children)
+    - Uses the flow's cached FlowGraph, so each edge is styled in constant time
     """
-    ancestors = build_ancestor_dict(flow)
-    parent_children = build_parent_children_dict(flow)
+    graph = get_flow_graph(flow)
+    parent_children = graph.parent_children
 
     # Edges for normal listeners
     for method_name in flow._listeners:
@@ -215,12 +206,10 @@ def add_edges(
         for trigger in trigger_methods:
             # Check if nodes exist before adding edges
             if trigger in node_positions and method_name in node_positions:
-                is_router_edge = any(
-                    trigger in paths for paths in flow._router_paths.values()
-                )
+                is_router_edge = trigger in graph.router_outputs
                 edge_color = colors["router_edge"] if is_router_edge else colors["edge"]
 
-                is_cycle_edge = is_ancestor(trigger, method_name, ancestors)
+                is_cycle_edge = graph.is_cycle_edge(trigger, method_name)
                 parent_has_multiple_children = len(parent_children.get(trigger, [])) > 1
                 needs_curvature = is_cycle_edge or parent_has_multiple_children
 
@@ -231,7 +220,7 @@ def add_edges(
                     if source_pos and target_pos:
                         dx = target_pos[0] - source_pos[0]
                         smooth_type = "curvedCCW" if dx <= 0 else "curvedCW"
-                        index = get_child_index(trigger, method_name, parent_children)
+                        index = graph.child_index(trigger, method_name)
                         edge_smooth = {
                             "type": smooth_type,
                             "roundness": 0.2 + (0.1 * index),
@@ -252,9 +241,7 @@ def add_edges(
                 net.add_edge(trigger, method_name, **edge_style)
             else:
                 # Nodes not found in node_positions. Check if it's a known router outcome and a known method.
-                is_router_edge = any(
-                    trigger in paths for paths in flow._router_paths.values()
-                )
+                is_router_edge = trigger in graph.router_outputs
                 # Check if method_name is a known method
                 method_known = method_name in flow._methods
 
@@ -268,54 +255,50 @@ def add_edges(
     # Edges for router return paths
     for router_method_name, paths in flow._router_paths.items():
         for path in paths:
-            for listener_name, (
-                condition_type,
-                trigger_methods,
-            ) in flow._listeners.items():
-                if path in trigger_methods:
-                    if (
-                        router_method_name in node_positions
-                        and listener_name in node_positions
-                    ):
-                        is_cycle_edge = is_ancestor(
-                            router_method_name, listener_name, ancestors
-                        )
-                        parent_has_multiple_children = (
-                            len(parent_children.get(router_method_name, [])) > 1
-                        )
-                        needs_curvature = is_cycle_edge or parent_has_multiple_children
-
-                        if needs_curvature:
-                            source_pos = node_positions.get(router_method_name)
-                            target_pos = node_positions.get(listener_name)
-
-                            if source_pos and target_pos:
-                                dx = target_pos[0] - source_pos[0]
-                                smooth_type = "curvedCCW" if dx <= 0 else "curvedCW"
-                                index = get_child_index(
-                                    router_method_name, listener_name, parent_children
-                                )
-                                edge_smooth = {
-                                    "type": smooth_type,
-                                    "roundness": 0.2 + (0.1 * index),
-                                }
-                            else:
-                                edge_smooth = {"type": "cubicBezier"}
+            for listener_name in graph.dependents.get(path, ()):
+                if (
+                    router_method_name in node_positions
+                    and listener_name in node_positions
+                ):
+                    is_cycle_edge = graph.is_cycle_edge(
+                        router_method_name, listener_name
+                    )
+                    parent_has_multiple_children = (
+                        len(parent_children.get(router_method_name, [])) > 1
+                    )
+                    needs_curvature = is_cycle_edge or parent_has_multiple_children
+
+                    if needs_curvature:
+                        source_pos = node_positions.get(router_method_name)
+                        target_pos = node_positions.get(listener_name)
+
+                        if source_pos and target_pos:
+                            dx = target_pos[0] - source_pos[0]
+                            smooth_type = "curvedCCW" if dx <= 0 else "curvedCW"
+                            index = graph.child_index(
+                                router_method_name, listener_name
+                            )
+                            edge_smooth = {
+                                "type": smooth_type,
+                                "roundness": 0.2 + (0.1 * index),
+                            }
                         else:
-                            edge_smooth.update({"type": "continuous"})
-
-                        edge_style = {
-                            "color": colors["router_edge"],
-                            "width": 2,
-                            "arrows": "to",
-                            "dashes": True,
-                            "smooth": edge_smooth,
-                        }
-                        net.add_edge(router_method_name, listener_name, **edge_style)
+                            edge_smooth = {"type": "cubicBezier"}
                     else:
-                        # Same check here: known router edge and known method?
-                        method_known = listener_name in flow._methods
-                        if not method_known:
-                            print(
-                                f"Warning: No node found for '{router_method_name}' or '{listener_name}'. Skipping edge."
-                            )
+                        edge_smooth.update({"type": "continuous"})
+
+                    edge_style = {
+                        "color": colors["router_edge"],
+                        "width": 2,
+                        "arrows": "to",
+                        "dashes": True,
+                        "smooth": edge_smooth,
+                    }
+                    net.add_edge(router_method_name, listener_name, **edge_style)
+                else:
+                    # Same check here: known router edge and known method?
+                    method_known = listener_name in flow._methods
+                    if not method_known:
+                        print(
+                            f"Warning: No node found for '{router_method_name}' or '{listener_name}'. Skipping edge."
+                        )
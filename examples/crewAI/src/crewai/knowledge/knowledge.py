@@ -1,14 +1,50 @@
+import hashlib
+import json
 import os
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Literal, Optional, Sequence
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
 from crewai.knowledge.source.base_knowledge_source import BaseKnowledgeSource
+from crewai.knowledge.storage.ingestion_manifest import ManifestEntry
 from crewai.knowledge.storage.knowledge_storage import KnowledgeStorage
+from crewai.knowledge.storage.lexical_index import RRF_K
 
 os.environ["TOKENIZERS_PARALLELISM"] = "false"  # removes logging from fastembed
 
 
+def knowledge_fingerprint(
+    sources: Sequence[BaseKnowledgeSource],
+    embedder: Optional[Dict[str, Any]],
+    collection_name: Optional[str],
+) -> str:
+    """
+    Identifies a knowledge setup by its collection, embedder and sources (their
+    files' stats, or their content, and chunking settings), without reading files.
+    """
+    digest = hashlib.sha256(
+        json.dumps(
+            [collection_name, embedder],
+            sort_keys=True,
+            default=lambda obj: f"{type(obj).__qualname__}@{id(obj)}",
+        ).encode("utf-8")
+    )
+    for source in sources:
+        digest.update(
+            repr(
+                (
+                    source.manifest_key(),
+                    source.file_stats(),
+                    source.chunk_size,
+                    source.chunk_overlap,
+                    source.chunk_boundary,
+                    source.chunk_unit,
+                )
+            ).encode("utf-8")
+        )
+    return digest.hexdigest()
+
+
 class Knowledge(BaseModel):
     """
     Knowledge is a collection of sources and setup for the vector store to save and query relevant context.
@@ -24,6 +60,10 @@ class Knowledge(BaseModel):
     embedder: Optional[Dict[str, Any]] = None
     collection_name: Optional[str] = None
 
+    _fingerprint: str = PrivateAttr(default="")
+    _storage_ready: bool = PrivateAttr(default=False)
+    _sources_added: bool = PrivateAttr(default=False)
+
     def __init__(
         self,
         collection_name: str,
@@ -40,38 +80,139 @@ class Knowledge(BaseModel):
                 embedder=embedder, collection_name=collection_name
             )
         self.sources = sources
-        self.storage.initialize_knowledge_storage()
+        # The vector store is opened, and sources ingested, on first use
+        self._fingerprint = knowledge_fingerprint(sources, embedder, collection_name)
+
+    @property
+    def fingerprint(self) -> str:
+        """Fingerprint of the sources, embedder and collection this knowledge was built from."""
+        return self._fingerprint
+
+    def _ensure_storage(self) -> None:
+        if not self._storage_ready and self.storage is not None:
+            self.storage.initialize_knowledge_storage()
+            self._storage_ready = True
 
     def query(
-        self, query: List[str], results_limit: int = 3, score_threshold: float = 0.35
+        self,
+        query: List[str],
+        results_limit: int = 3,
+        score_threshold: float = 0.35,
+        search_mode: Literal["vector", "hybrid"] = "vector",
+        rrf_k: int = RRF_K,
     ) -> List[Dict[str, Any]]:
         """
         Query across all knowledge sources to find the most relevant information.
-        Returns the top_k most relevant chunks.
+        Returns the top_k most relevant chunks. With ``search_mode="hybrid"``,
+        vector and keyword (BM25) results are merged by reciprocal-rank fusion.
 
         Raises:
             ValueError: If storage is not initialized.
         """
         if self.storage is None:
             raise ValueError("Storage is not initialized.")
+        if not self._sources_added:
+            self.add_sources()
+        self._ensure_storage()
 
         results = self.storage.search(
             query,
             limit=results_limit,
             score_threshold=score_threshold,
+            search_mode=search_mode,
+            rrf_k=rrf_k,
         )
         return results
 
     def add_sources(self):
         try:
-            for source in self.sources:
-                source.storage = self.storage
-                source.add()
+            self._ensure_storage()
+            if isinstance(self.storage, KnowledgeStorage):
+                self._add_sources_incrementally(self.storage)
+            else:
+                for source in self.sources:
+                    source.storage = self.storage
+                    source.add()
+            self._sources_added = True
         except Exception as e:
             raise e
 
+    def _add_sources_incrementally(self, storage: KnowledgeStorage) -> None:
+        """
+        Ingests only the sources that changed since the last run, according to
+        the storage's ingestion manifest, and deletes the chunks of sources that
+        are no longer part of this knowledge.
+        """
+        manifest = storage.manifest
+        collection = storage.collection_key
+        entries = manifest.entries(collection)
+
+        # Vectors from another embedding model can't be mixed with new ones
+        if any(
+            entry.embedder_fingerprint != storage.embedder_fingerprint
+            for entry in entries.values()
+        ):
+            storage.delete_documents(
+                list(
+                    {chunk_id for entry in entries.values() for chunk_id in entry.chunk_ids}
+                )
+            )
+            manifest.delete(collection, entries.keys())
+            entries = {}
+
+        kept_ids: set = set()
+        stale_ids: set = set()
+        current_keys = set()
+        for source in self.sources:
+            source.storage = storage
+            key = source.manifest_key()
+            current_keys.add(key)
+            entry = entries.get(key)
+            files = source.file_stats()
+
+            if entry and files and entry.files == files:
+                kept_ids.update(entry.chunk_ids)
+                continue
+            content_hash = source.content_hash()
+            if entry and entry.content_hash == content_hash:
+                kept_ids.update(entry.chunk_ids)
+                if entry.files != files:
+                    entry.files = files
+                    manifest.save(collection, entry)
+                continue
+
+            source.add()
+            chunk_ids = list(dict.fromkeys(source.chunk_ids()))
+            kept_ids.update(chunk_ids)
+            if entry:
+                stale_ids.update(entry.chunk_ids)
+            manifest.save(
+                collection,
+                ManifestEntry(
+                    source_key=key,
+                    files=files,
+                    content_hash=content_hash,
+                    chunk_ids=chunk_ids,
+                    embedder_fingerprint=storage.embedder_fingerprint,
+                ),
+            )
+
+        removed_keys = [key for key in entries if key not in current_keys]
+        for key in removed_keys:
+            stale_ids.update(entries[key].chunk_ids)
+        manifest.delete(collection, removed_keys)
+        storage.delete_documents(list(stale_ids - kept_ids))
+
+    def close(self) -> None:
+        """Releases the storage's vector store client. It is reopened on the next use."""
+        if isinstance(self.storage, KnowledgeStorage):
+            self.storage.close()
+        self._storage_ready = False
+
     def reset(self) -> None:
         if self.storage:
             self.storage.reset()
+            self._storage_ready = False
+            self._sources_added = False
         else:
             raise ValueError("Storage is not initialized.")
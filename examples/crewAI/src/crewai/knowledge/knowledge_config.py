@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic import BaseModel, Field
 
 
@@ -7,6 +9,11 @@ class KnowledgeConfig(BaseModel):
     Args:
         results_limit (int): The number of relevant documents to return.
         score_threshold (float): The minimum score for a document to be considered relevant.
+        search_mode (str): "vector" for embedding search only, or "hybrid" to fuse it with keyword (BM25) search.
+        rrf_k (int): Rank constant of the reciprocal-rank fusion used by hybrid search.
+        query_rewrite (str): How agents turn a task into a search query: with an LLM call ("llm"),
+            by extracting keywords from the task description ("keywords"), or by using the
+            task description as is ("description").
     """
 
     results_limit: int = Field(default=3, description="The number of results to return")
@@ -14,3 +21,18 @@ class KnowledgeConfig(BaseModel):
         default=0.35,
         description="The minimum score for a result to be considered relevant",
     )
+    search_mode: Literal["vector", "hybrid"] = Field(
+        default="vector",
+        description="Whether to fuse vector search with keyword (BM25) search",
+    )
+    rrf_k: int = Field(
+        default=60,
+        gt=0,
+        description="Rank constant of the reciprocal-rank fusion used by hybrid search",
+    )
+    # Read by the agent when building the query, so not passed on to Knowledge.query
+    query_rewrite: Literal["llm", "keywords", "description"] = Field(
+        default="llm",
+        exclude=True,
+        description="How agents turn a task into a knowledge search query",
+    )
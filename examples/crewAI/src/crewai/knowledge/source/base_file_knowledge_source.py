@@ -1,8 +1,8 @@
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import ClassVar, Dict, List, Optional, Union
 
-from pydantic import Field, field_validator
+from pydantic import Field, field_validator, model_validator
 
 from crewai.knowledge.source.base_knowledge_source import BaseKnowledgeSource
 from crewai.knowledge.storage.knowledge_storage import KnowledgeStorage
@@ -14,6 +14,8 @@ class BaseFileKnowledgeSource(BaseKnowledgeSource, ABC):
     """Base class for knowledge sources that load content from files."""
 
     _logger: Logger = Logger(verbose=True)
+    # Whether add() loads the files itself; the files of other sources are loaded at construction
+    _loads_content_in_add: ClassVar[bool] = False
     file_path: Optional[Union[Path, List[Path], str, List[str]]] = Field(
         default=None,
         description="[Deprecated] The path to the file. Use file_paths instead.",
@@ -24,6 +26,14 @@ class BaseFileKnowledgeSource(BaseKnowledgeSource, ABC):
     content: Dict[Path, str] = Field(init=False, default_factory=dict)
     storage: Optional[KnowledgeStorage] = Field(default=None)
     safe_file_paths: List[Path] = Field(default_factory=list)
+    streaming: bool = Field(
+        default=False,
+        description="Extract and chunk the files during add() without holding their content in memory.",
+    )
+    max_workers: Optional[int] = Field(
+        default=None,
+        description="Processes used to extract CPU-heavy formats when streaming. Defaults to the CPU count.",
+    )
 
     @field_validator("file_path", "file_paths", mode="before")
     def validate_file_path(cls, v, info):
@@ -39,11 +49,29 @@ class BaseFileKnowledgeSource(BaseKnowledgeSource, ABC):
             raise ValueError("Either file_path or file_paths must be provided")
         return v
 
+    @model_validator(mode="after")
+    def validate_streaming(self):
+        """Validate that the source can extract its files piecewise if streaming is requested."""
+        if (
+            self.streaming
+            and type(self)._extraction_tasks is BaseKnowledgeSource._extraction_tasks
+        ):
+            raise ValueError(
+                f"{type(self).__name__} does not support streaming ingestion"
+            )
+        return self
+
     def model_post_init(self, _):
-        """Post-initialization method to load content."""
+        """Post-initialization method to load content, unless add() loads it."""
         self.safe_file_paths = self._process_file_paths()
         self.validate_content()
-        self.content = self.load_content()
+        if not self.streaming and not self._loads_content_in_add:
+            self.content = self.load_content()
+
+    def _ensure_content(self) -> None:
+        """Loads the files on first use, so sources that are never added are never parsed."""
+        if not self.content:
+            self.content = self.load_content()
 
     @abstractmethod
     def load_content(self) -> Dict[Path, str]:
@@ -67,13 +95,6 @@ class BaseFileKnowledgeSource(BaseKnowledgeSource, ABC):
                     color="red",
                 )
 
-    def _save_documents(self):
-        """Save the documents to the storage."""
-        if self.storage:
-            self.storage.save(self.chunks)
-        else:
-            raise ValueError("No storage found to save documents.")
-
     def convert_to_path(self, path: Union[Path, str]) -> Path:
         """Convert a path to a Path object."""
         return Path(KNOWLEDGE_DIRECTORY + "/" + path) if isinstance(path, str) else path
@@ -1,10 +1,24 @@
+import hashlib
+import os
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from itertools import groupby
+from pathlib import Path
+from typing import Any, ClassVar, Dict, List, Optional, Sequence, Tuple
 
 import numpy as np
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, field_validator
 
-from crewai.knowledge.storage.knowledge_storage import KnowledgeStorage
+from crewai.knowledge.storage.knowledge_storage import KnowledgeStorage, document_id
+from crewai.knowledge.utils.chunking import (
+    ChunkBoundary,
+    ChunkUnit,
+    TextChunk,
+    TextChunker,
+)
+from crewai.knowledge.utils.embedding_matrix import EmbeddingMatrix
+from crewai.knowledge.utils.streaming import ExtractionTask, run_extraction
+
+STREAMING_SAVE_BATCH_SIZE = 100
 
 
 class BaseKnowledgeSource(BaseModel, ABC):
@@ -12,14 +26,38 @@ class BaseKnowledgeSource(BaseModel, ABC):
 
     chunk_size: int = 4000
     chunk_overlap: int = 200
+    chunk_boundary: ChunkBoundary = Field(
+        default="character",
+        description="Where chunks may end: anywhere (character), or between sentences, paragraphs or markdown sections.",
+    )
+    chunk_unit: ChunkUnit = Field(
+        default="characters",
+        description="Whether chunk_size and chunk_overlap count characters or embedding tokens.",
+    )
     chunks: List[str] = Field(default_factory=list)
-    chunk_embeddings: List[np.ndarray] = Field(default_factory=list)
+    chunk_embeddings: EmbeddingMatrix = Field(
+        default_factory=EmbeddingMatrix,
+        exclude=True,
+        description="Embeddings of the chunks, as one contiguous float32 matrix.",
+    )
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
     storage: Optional[KnowledgeStorage] = Field(default=None)
     metadata: Dict[str, Any] = Field(default_factory=dict)  # Currently unused
     collection_name: Optional[str] = Field(default=None)
 
+    # Whether _extraction_tasks are CPU-bound enough to run in worker processes
+    _extracts_in_parallel: ClassVar[bool] = False
+    _chunk_ids: List[str] = PrivateAttr(default_factory=list)
+    _chunk_metadata: List[Dict[str, Any]] = PrivateAttr(default_factory=list)
+
+    @field_validator("chunk_embeddings", mode="before")
+    @classmethod
+    def _to_embedding_matrix(cls, value: Any) -> EmbeddingMatrix:
+        if isinstance(value, EmbeddingMatrix):
+            return value
+        return EmbeddingMatrix(value)
+
     @abstractmethod
     def validate_content(self) -> Any:
         """Load and preprocess content from the source."""
@@ -31,15 +69,123 @@ class BaseKnowledgeSource(BaseModel, ABC):
         pass
 
     def get_embeddings(self) -> List[np.ndarray]:
-        """Return the list of embeddings for the chunks."""
-        return self.chunk_embeddings
+        """Return the list of embeddings for the chunks, as views into chunk_embeddings."""
+        return list(self.chunk_embeddings)
+
+    def manifest_key(self) -> str:
+        """
+        Identifies this source in the ingestion manifest: its files and chunk
+        settings, or its content if it has no files.
+        """
+        files = sorted(str(path) for path in self._source_files())
+        if files:
+            return f"{type(self).__name__}:{self._chunk_settings()}:{'|'.join(files)}"
+        return f"{type(self).__name__}:{self.content_hash()}"
+
+    def file_stats(self) -> List[Tuple[str, float, int]]:
+        """Path, modification time and size of every file this source reads."""
+        stats = []
+        for path in self._source_files():
+            stat = os.stat(path)
+            stats.append((str(path), stat.st_mtime, stat.st_size))
+        return stats
+
+    def content_hash(self) -> str:
+        """Hash of the source's files (or loaded content) and of the settings that decide how it is chunked."""
+        digest = hashlib.sha256(
+            f"{type(self).__name__}:{self._chunk_settings()}".encode("utf-8")
+        )
+        files = self._source_files()
+        if not files:
+            digest.update(repr(getattr(self, "content", None)).encode("utf-8"))
+        for path in files:
+            with open(path, "rb") as f:
+                while block := f.read(1 << 20):
+                    digest.update(block)
+        return digest.hexdigest()
+
+    def _chunk_settings(self) -> str:
+        return repr(
+            (self.chunk_size, self.chunk_overlap, self.chunk_boundary, self.chunk_unit)
+        )
+
+    def chunk_ids(self) -> List[str]:
+        """IDs of the chunks this source saved to storage."""
+        return self._chunk_ids or [document_id(chunk) for chunk in self.chunks]
+
+    def _source_files(self) -> List[Any]:
+        return list(getattr(self, "safe_file_paths", None) or [])
+
+    def _chunker(self) -> TextChunker:
+        return TextChunker(
+            chunk_size=self.chunk_size,
+            chunk_overlap=self.chunk_overlap,
+            boundary=self.chunk_boundary,
+            unit=self.chunk_unit,
+        )
 
     def _chunk_text(self, text: str) -> List[str]:
         """Utility method to split text into chunks."""
-        return [
-            text[i : i + self.chunk_size]
-            for i in range(0, len(text), self.chunk_size - self.chunk_overlap)
-        ]
+        return [chunk.text for chunk in self._chunker().split(text)]
+
+    def _add_chunks(self, text: str, source: Optional[Any] = None) -> None:
+        """Chunks ``text`` and queues the chunks, with their offsets, for saving."""
+        for chunk in self._chunker().split(text):
+            self.chunks.append(chunk.text)
+            self._chunk_metadata.append(self._chunk_metadata_for(chunk, source))
+
+    @staticmethod
+    def _chunk_metadata_for(chunk: TextChunk, source: Optional[Any]) -> Dict[str, Any]:
+        metadata: Dict[str, Any] = {"chunk_start": chunk.start, "chunk_end": chunk.end}
+        if source is not None:
+            metadata["source"] = str(source)
+        return metadata
+
+    def _extraction_tasks(self, path: Path) -> List[ExtractionTask]:
+        """Splits extracting the text of ``path`` into tasks, for streaming ingestion."""
+        raise NotImplementedError(
+            f"{type(self).__name__} does not support streaming ingestion"
+        )
+
+    def _add_streamed(
+        self, paths: Sequence[Path], max_workers: Optional[int] = None
+    ) -> None:
+        """
+        Extracts, chunks and saves ``paths`` without holding their content in
+        memory. Chunks are saved in batches as soon as they are produced, and
+        only their IDs are kept.
+        """
+        if not self.storage:
+            raise ValueError("No storage found to save documents.")
+
+        tasks = []
+        task_paths = []
+        for path in paths:
+            for task in self._extraction_tasks(path):
+                tasks.append(task)
+                task_paths.append(path)
+
+        results = zip(
+            task_paths,
+            run_extraction(tasks, self._extracts_in_parallel, max_workers),
+        )
+        chunker = self._chunker()
+        batch: List[str] = []
+        metadata: List[Dict[str, Any]] = []
+        for path, group in groupby(results, key=lambda result: result[0]):
+            pieces = (piece for _, task_pieces in group for piece in task_pieces)
+            for chunk in chunker.iter_chunks(pieces):
+                batch.append(chunk.text)
+                metadata.append(self._chunk_metadata_for(chunk, path))
+                if len(batch) >= STREAMING_SAVE_BATCH_SIZE:
+                    self._save_chunk_batch(batch, metadata)
+                    batch, metadata = [], []
+        if batch:
+            self._save_chunk_batch(batch, metadata)
+
+    def _save_chunk_batch(self, chunks: List[str], metadata: List[Dict[str, Any]]) -> None:
+        self.storage.save(chunks, metadata)  # type: ignore[union-attr]
+        self._chunk_ids.extend(document_id(chunk) for chunk in chunks)
 
     def _save_documents(self):
         """
@@ -47,6 +193,9 @@ class BaseKnowledgeSource(BaseModel, ABC):
         This method should be called after the chunks and embeddings are generated.
         """
         if self.storage:
-            self.storage.save(self.chunks)
+            if self._chunk_metadata and len(self._chunk_metadata) == len(self.chunks):
+                self.storage.save(self.chunks, self._chunk_metadata)
+            else:
+                self.storage.save(self.chunks)
         else:
             raise ValueError("No storage found to save documents.")
@@ -1,13 +1,16 @@
 import csv
 from pathlib import Path
-from typing import Dict, List
+from typing import ClassVar, Dict, List
 
 from crewai.knowledge.source.base_file_knowledge_source import BaseFileKnowledgeSource
+from crewai.knowledge.utils.streaming import ExtractionTask, iter_csv_rows
 
 
 class CSVKnowledgeSource(BaseFileKnowledgeSource):
     """A knowledge source that stores and queries CSV file content using embeddings."""
 
+    _loads_content_in_add: ClassVar[bool] = True
+
     def load_content(self) -> Dict[Path, str]:
         """Load and preprocess CSV file content."""
         content_dict = {}
@@ -25,16 +28,15 @@ class CSVKnowledgeSource(BaseFileKnowledgeSource):
         Add CSV file content to the knowledge source, chunk it, compute embeddings,
         and save the embeddings.
         """
+        if self.streaming:
+            self._add_streamed(self.safe_file_paths, self.max_workers)
+            return
+        self._ensure_content()
         content_str = (
             str(self.content) if isinstance(self.content, dict) else self.content
         )
-        new_chunks = self._chunk_text(content_str)
-        self.chunks.extend(new_chunks)
+        self._add_chunks(content_str)
         self._save_documents()
 
-    def _chunk_text(self, text: str) -> List[str]:
-        """Utility method to split text into chunks."""
-        return [
-            text[i : i + self.chunk_size]
-            for i in range(0, len(text), self.chunk_size - self.chunk_overlap)
-        ]
+    def _extraction_tasks(self, path: Path) -> List[ExtractionTask]:
+        return [(iter_csv_rows, (path,))]
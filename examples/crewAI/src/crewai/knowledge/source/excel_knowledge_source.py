@@ -1,10 +1,11 @@
 from pathlib import Path
-from typing import Dict, Iterator, List, Optional, Union
+from typing import ClassVar, Dict, Iterator, List, Optional, Union
 from urllib.parse import urlparse
 
 from pydantic import Field, field_validator
 
 from crewai.knowledge.source.base_knowledge_source import BaseKnowledgeSource
+from crewai.knowledge.utils.streaming import ExtractionTask, excel_tasks
 from crewai.utilities.constants import KNOWLEDGE_DIRECTORY
 from crewai.utilities.logger import Logger
 
@@ -26,6 +27,16 @@ class ExcelKnowledgeSource(BaseKnowledgeSource):
     chunks: List[str] = Field(default_factory=list)
     content: Dict[Path, Dict[str, str]] = Field(default_factory=dict)
     safe_file_paths: List[Path] = Field(default_factory=list)
+    streaming: bool = Field(
+        default=False,
+        description="Extract and chunk the files during add() without loading them into memory at construction.",
+    )
+    max_workers: Optional[int] = Field(
+        default=None,
+        description="Processes used to extract CPU-heavy formats when streaming. Defaults to the CPU count.",
+    )
+
+    _extracts_in_parallel: ClassVar[bool] = True
 
     @field_validator("file_path", "file_paths", mode="before")
     def validate_file_path(cls, v, info):
@@ -98,7 +109,6 @@ class ExcelKnowledgeSource(BaseKnowledgeSource):
             self.file_paths = self.file_path
         self.safe_file_paths = self._process_file_paths()
         self.validate_content()
-        self.content = self._load_content()
 
     def _load_content(self) -> Dict[Path, Dict[str, str]]:
         """Load and preprocess Excel file content from multiple sheets.
@@ -147,6 +157,13 @@ class ExcelKnowledgeSource(BaseKnowledgeSource):
         Add Excel file content to the knowledge source, chunk it, compute embeddings,
         and save the embeddings.
         """
+        if self.streaming:
+            self._add_streamed(self.safe_file_paths, self.max_workers)
+            return
+        # The workbooks are only read once they are added
+        if not self.content:
+            self.content = self._load_content()
+
         # Convert dictionary values to a single string if content is a dictionary
         # Updated to account for .xlsx workbooks with multiple tabs/sheets
         content_str = ""
@@ -157,13 +174,9 @@ class ExcelKnowledgeSource(BaseKnowledgeSource):
             else:
                 content_str += str(value) + "\n"
 
-        new_chunks = self._chunk_text(content_str)
-        self.chunks.extend(new_chunks)
+        self._add_chunks(content_str)
         self._save_documents()
 
-    def _chunk_text(self, text: str) -> List[str]:
-        """Utility method to split text into chunks."""
-        return [
-            text[i : i + self.chunk_size]
-            for i in range(0, len(text), self.chunk_size - self.chunk_overlap)
-        ]
+    def _extraction_tasks(self, path: Path) -> List[ExtractionTask]:
+        self._import_dependencies()
+        return excel_tasks(path)
@@ -1,12 +1,16 @@
 from pathlib import Path
-from typing import Dict, List
+from typing import ClassVar, Dict, List
 
 from crewai.knowledge.source.base_file_knowledge_source import BaseFileKnowledgeSource
+from crewai.knowledge.utils.streaming import ExtractionTask, pdf_tasks
 
 
 class PDFKnowledgeSource(BaseFileKnowledgeSource):
     """A knowledge source that stores and queries PDF file content using embeddings."""
 
+    _extracts_in_parallel: ClassVar[bool] = True
+    _loads_content_in_add: ClassVar[bool] = True
+
     def load_content(self) -> Dict[Path, str]:
         """Load and preprocess PDF file content."""
         pdfplumber = self._import_pdfplumber()
@@ -40,14 +44,14 @@ class PDFKnowledgeSource(BaseFileKnowledgeSource):
         Add PDF file content to the knowledge source, chunk it, compute embeddings,
         and save the embeddings.
         """
-        for _, text in self.content.items():
-            new_chunks = self._chunk_text(text)
-            self.chunks.extend(new_chunks)
+        if self.streaming:
+            self._add_streamed(self.safe_file_paths, self.max_workers)
+            return
+        self._ensure_content()
+        for path, text in self.content.items():
+            self._add_chunks(text, source=path)
         self._save_documents()
 
-    def _chunk_text(self, text: str) -> List[str]:
-        """Utility method to split text into chunks."""
-        return [
-            text[i : i + self.chunk_size]
-            for i in range(0, len(text), self.chunk_size - self.chunk_overlap)
-        ]
+    def _extraction_tasks(self, path: Path) -> List[ExtractionTask]:
+        self._import_pdfplumber()
+        return pdf_tasks(path)
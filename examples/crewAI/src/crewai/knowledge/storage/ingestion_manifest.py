@@ -0,0 +1,124 @@
+import json
+import sqlite3
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Tuple
+
+from crewai.utilities import Printer
+
+# (path, mtime, size) of every file a source was loaded from
+FileStats = List[Tuple[str, float, int]]
+
+
+@dataclass
+class ManifestEntry:
+    """What was ingested from one knowledge source the last time it changed."""
+
+    source_key: str
+    files: FileStats = field(default_factory=list)
+    content_hash: str = ""
+    chunk_ids: List[str] = field(default_factory=list)
+    embedder_fingerprint: str = ""
+
+
+class IngestionManifest:
+    """
+    SQLite record of the sources ingested into each knowledge collection, used
+    to skip unchanged sources and to find the chunks of removed ones.
+    """
+
+    def __init__(self, db_path: str) -> None:
+        self.db_path = db_path
+        self._printer: Printer = Printer()
+        self._initialize_db()
+
+    def _initialize_db(self) -> None:
+        try:
+            Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+            with sqlite3.connect(self.db_path) as conn:
+                conn.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS ingested_sources (
+                        collection TEXT NOT NULL,
+                        source_key TEXT NOT NULL,
+                        files TEXT NOT NULL,
+                        content_hash TEXT NOT NULL,
+                        chunk_ids TEXT NOT NULL,
+                        embedder_fingerprint TEXT NOT NULL,
+                        PRIMARY KEY (collection, source_key)
+                    )
+                    """
+                )
+                conn.commit()
+        except sqlite3.Error as e:
+            self._printer.print(
+                content=f"INGESTION MANIFEST ERROR: Could not initialize {self.db_path}: {e}",
+                color="red",
+            )
+
+    def entries(self, collection: str) -> Dict[str, ManifestEntry]:
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                rows = conn.execute(
+                    """
+                    SELECT source_key, files, content_hash, chunk_ids, embedder_fingerprint
+                    FROM ingested_sources WHERE collection = ?
+                    """,
+                    (collection,),
+                ).fetchall()
+        except sqlite3.Error as e:
+            self._printer.print(
+                content=f"INGESTION MANIFEST ERROR: Could not read {self.db_path}: {e}",
+                color="red",
+            )
+            return {}
+
+        return {
+            row[0]: ManifestEntry(
+                source_key=row[0],
+                files=[tuple(stat) for stat in json.loads(row[1])],  # type: ignore[misc]
+                content_hash=row[2],
+                chunk_ids=json.loads(row[3]),
+                embedder_fingerprint=row[4],
+            )
+            for row in rows
+        }
+
+    def save(self, collection: str, entry: ManifestEntry) -> None:
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.execute(
+                    """
+                    INSERT OR REPLACE INTO ingested_sources
+                    (collection, source_key, files, content_hash, chunk_ids, embedder_fingerprint)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                    """,
+                    (
+                        collection,
+                        entry.source_key,
+                        json.dumps(entry.files),
+                        entry.content_hash,
+                        json.dumps(entry.chunk_ids),
+                        entry.embedder_fingerprint,
+                    ),
+                )
+                conn.commit()
+        except sqlite3.Error as e:
+            self._printer.print(
+                content=f"INGESTION MANIFEST ERROR: Could not write {self.db_path}: {e}",
+                color="red",
+            )
+
+    def delete(self, collection: str, source_keys: Iterable[str]) -> None:
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.executemany(
+                    "DELETE FROM ingested_sources WHERE collection = ? AND source_key = ?",
+                    [(collection, key) for key in source_keys],
+                )
+                conn.commit()
+        except sqlite3.Error as e:
+            self._printer.print(
+                content=f"INGESTION MANIFEST ERROR: Could not write {self.db_path}: {e}",
+                color="red",
+            )
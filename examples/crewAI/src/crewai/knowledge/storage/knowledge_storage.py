@@ -4,7 +4,10 @@ import io
 import logging
 import os
 import shutil
-from typing import Any, Dict, List, Optional, Union
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Dict, List, Literal, Optional, Union
 
 import chromadb
 import chromadb.errors
@@ -13,12 +16,24 @@ from chromadb.api.types import OneOrMany
 from chromadb.config import Settings
 
 from crewai.knowledge.storage.base_knowledge_storage import BaseKnowledgeStorage
+from crewai.knowledge.storage.ingestion_manifest import IngestionManifest
+from crewai.knowledge.storage.lexical_index import (
+    RRF_K,
+    LexicalIndex,
+    reciprocal_rank_fusion,
+)
 from crewai.rag.embeddings.configurator import EmbeddingConfigurator
-from crewai.utilities.chromadb import sanitize_collection_name
+from crewai.rag.embeddings.embedding_cache import (
+    embedder_fingerprint,
+    embedder_identity,
+)
+from crewai.utilities.chromadb import (
+    chroma_client_registry,
+    sanitize_collection_name,
+)
 from crewai.utilities.constants import KNOWLEDGE_DIRECTORY
 from crewai.utilities.logger import Logger
 from crewai.utilities.paths import db_storage_path
-from crewai.utilities.chromadb import create_persistent_client
 
 
 @contextlib.contextmanager
@@ -37,6 +52,18 @@ def suppress_logging(
         yield
     logger.setLevel(original_level)
 
+DEFAULT_EMBEDDING_BATCH_SIZE = 100
+DEFAULT_EMBEDDING_CONCURRENCY = 4
+DEFAULT_EMBEDDING_MAX_RETRIES = 3
+EMBEDDING_RETRY_BACKOFF = 0.5
+# Hybrid search fuses this many times ``limit`` candidates from each retriever
+HYBRID_CANDIDATE_MULTIPLIER = 4
+
+
+def document_id(document: str) -> str:
+    """Content-derived ID of a knowledge chunk, so identical chunks are stored once."""
+    return hashlib.sha256(document.encode("utf-8")).hexdigest()
+
 
 class KnowledgeStorage(BaseKnowledgeStorage):
     """
@@ -47,14 +74,33 @@ class KnowledgeStorage(BaseKnowledgeStorage):
     collection: Optional[chromadb.Collection] = None
     collection_name: Optional[str] = "knowledge"
     app: Optional[ClientAPI] = None
+    _manifest: Optional[IngestionManifest] = None
+    _lexical_index: Optional[LexicalIndex] = None
+    _release: Optional[weakref.finalize] = None
 
     def __init__(
         self,
         embedder: Optional[Dict[str, Any]] = None,
         collection_name: Optional[str] = None,
+        embedding_batch_size: Optional[int] = None,
+        embedding_concurrency: Optional[int] = None,
+        embedding_max_retries: Optional[int] = None,
     ):
         self.collection_name = collection_name
         self._set_embedder_config(embedder)
+        # Batching can also be tuned from the embedder config, next to "cache"
+        embedder = embedder or {}
+        self.embedding_batch_size = embedding_batch_size or embedder.get(
+            "batch_size", DEFAULT_EMBEDDING_BATCH_SIZE
+        )
+        self.embedding_concurrency = embedding_concurrency or embedder.get(
+            "max_concurrency", DEFAULT_EMBEDDING_CONCURRENCY
+        )
+        self.embedding_max_retries = (
+            embedding_max_retries
+            if embedding_max_retries is not None
+            else embedder.get("max_retries", DEFAULT_EMBEDDING_MAX_RETRIES)
+        )
 
     def search(
         self,
@@ -62,7 +108,11 @@ class KnowledgeStorage(BaseKnowledgeStorage):
         limit: int = 3,
         filter: Optional[dict] = None,
         score_threshold: float = 0.35,
+        search_mode: Literal["vector", "hybrid"] = "vector",
+        rrf_k: int = RRF_K,
     ) -> List[Dict[str, Any]]:
+        if search_mode == "hybrid":
+            return self._hybrid_search(query, limit, filter, rrf_k)
         with suppress_logging():
             if self.collection:
                 fetched = self.collection.query(
@@ -85,38 +135,167 @@ class KnowledgeStorage(BaseKnowledgeStorage):
                 raise Exception("Collection not initialized")
 
     def initialize_knowledge_storage(self):
-        self.app = create_persistent_client(
-            path=os.path.join(db_storage_path(), "knowledge"),
-            settings=Settings(allow_reset=True),
-        )
+        if not self.app:
+            self._acquire_client()
 
         try:
-            collection_name = (
-                f"knowledge_{self.collection_name}"
-                if self.collection_name
-                else "knowledge"
-            )
             if self.app:
-                self.collection = self.app.get_or_create_collection(
-                    name=sanitize_collection_name(collection_name),
+                self.collection = chroma_client_registry.get_or_create_collection(
+                    self._client_path,
+                    name=self.collection_key,
                     embedding_function=self.embedder,
+                    embedder_key=self._embedder_key,
                 )
             else:
                 raise Exception("Vector Database Client not initialized")
         except Exception:
             raise Exception("Failed to create or get collection")
 
+    @property
+    def _client_path(self) -> str:
+        return os.path.join(db_storage_path(), KNOWLEDGE_DIRECTORY)
+
+    @property
+    def collection_key(self) -> str:
+        """Name of the ChromaDB collection backing this storage."""
+        return sanitize_collection_name(
+            f"knowledge_{self.collection_name}" if self.collection_name else "knowledge"
+        )
+
+    @property
+    def manifest(self) -> IngestionManifest:
+        """Record of the sources already ingested, kept next to the collection."""
+        if self._manifest is None:
+            self._manifest = IngestionManifest(
+                os.path.join(self._client_path, "ingestion_manifest.db")
+            )
+        return self._manifest
+
+    @property
+    def lexical_index(self) -> LexicalIndex:
+        """Keyword index of the stored chunks, kept next to the collection."""
+        if self._lexical_index is None:
+            self._lexical_index = LexicalIndex(
+                os.path.join(self._client_path, "lexical_index.db")
+            )
+        return self._lexical_index
+
+    def delete_documents(self, ids: List[str]) -> None:
+        if not self.collection:
+            raise Exception("Collection not initialized")
+        if ids:
+            self.collection.delete(ids=list(ids))
+            self.lexical_index.delete(self.collection_key, ids)
+
+    def _hybrid_search(
+        self,
+        query: List[str],
+        limit: int,
+        filter: Optional[dict],
+        rrf_k: int,
+    ) -> List[Dict[str, Any]]:
+        """
+        Fuses the vector and BM25 rankings of every query with reciprocal-rank
+        fusion. Scores are fused scores (higher is better), so no distance
+        threshold applies.
+        """
+        if not self.collection:
+            raise Exception("Collection not initialized")
+        candidates = max(limit * HYBRID_CANDIDATE_MULTIPLIER, limit)
+        self._sync_lexical_index()
+
+        with suppress_logging():
+            fetched = self.collection.query(
+                query_texts=query,
+                n_results=candidates,
+                where=filter,
+            )
+        found: Dict[str, Dict[str, Any]] = {}
+        rankings = []
+        for ids, metadatas, documents in zip(
+            fetched["ids"],
+            fetched["metadatas"] or [],  # type: ignore[arg-type]
+            fetched["documents"] or [],  # type: ignore[arg-type]
+        ):
+            rankings.append(ids)
+            for doc_id, metadata, document in zip(ids, metadatas, documents):
+                found[doc_id] = {"id": doc_id, "metadata": metadata, "context": document}
+
+        lexical_rankings = [
+            [
+                doc_id
+                for doc_id, _ in self.lexical_index.search(
+                    self.collection_key, text, candidates
+                )
+            ]
+            for text in query
+        ]
+        missing = list(
+            {doc_id for ranking in lexical_rankings for doc_id in ranking} - found.keys()
+        )
+        if missing:
+            # Fetching through the collection also applies the metadata filter
+            rows = self.collection.get(
+                ids=missing, where=filter, include=["metadatas", "documents"]
+            )
+            for doc_id, metadata, document in zip(
+                rows["ids"], rows["metadatas"] or [], rows["documents"] or []
+            ):
+                found[doc_id] = {"id": doc_id, "metadata": metadata, "context": document}
+        rankings.extend(
+            [doc_id for doc_id in ranking if doc_id in found]
+            for ranking in lexical_rankings
+        )
+
+        return [
+            {**found[doc_id], "score": score}
+            for doc_id, score in reciprocal_rank_fusion(rankings, k=rrf_k)[:limit]
+        ]
+
+    def _sync_lexical_index(self) -> None:
+        """Rebuilds the keyword index if it misses chunks, e.g. saved before it existed."""
+        count = self.collection.count()  # type: ignore[union-attr]
+        if self.lexical_index.count(self.collection_key) == count:
+            return
+        stored = self.collection.get(include=["documents"])  # type: ignore[union-attr]
+        self.lexical_index.clear(self.collection_key)
+        self.lexical_index.add(
+            self.collection_key, stored["ids"], stored["documents"] or []
+        )
+
+    def _acquire_client(self) -> None:
+        self.app = chroma_client_registry.acquire(
+            self._client_path, settings=Settings(allow_reset=True)
+        )
+        # The reference is also released if the storage is dropped without close()
+        self._release = weakref.finalize(
+            self,
+            chroma_client_registry.release,
+            self._client_path,
+            self.collection_key,
+            self._embedder_key,
+        )
+
+    def close(self) -> None:
+        """Releases this storage's reference to the shared ChromaDB client."""
+        if self._release is not None:
+            self._release()
+            self._release = None
+        self.app = None
+        self.collection = None
+
     def reset(self):
-        base_path = os.path.join(db_storage_path(), KNOWLEDGE_DIRECTORY)
+        base_path = self._client_path
         if not self.app:
-            self.app = create_persistent_client(
-                path=base_path, settings=Settings(allow_reset=True)
-            )
+            self._acquire_client()
 
         self.app.reset()
+        # Other storages may still use the client, so only drop this one's reference
+        chroma_client_registry.forget_collections(base_path)
+        self.close()
         shutil.rmtree(base_path)
-        self.app = None
-        self.collection = None
+        self._manifest = None
+        self._lexical_index = None
 
     def save(
         self,
@@ -132,7 +311,7 @@ class KnowledgeStorage(BaseKnowledgeStorage):
 
             # Generate IDs and create a mapping of id -> (document, metadata)
             for idx, doc in enumerate(documents):
-                doc_id = hashlib.sha256(doc.encode("utf-8")).hexdigest()
+                doc_id = document_id(doc)
                 doc_metadata = None
                 if metadata is not None:
                     if isinstance(metadata, list):
@@ -152,16 +331,37 @@ class KnowledgeStorage(BaseKnowledgeStorage):
                 filtered_metadata.append(meta)
                 filtered_ids.append(doc_id)
 
-            # If we have no metadata at all, set it to None
-            final_metadata: Optional[OneOrMany[chromadb.Metadata]] = (
-                None if all(m is None for m in filtered_metadata) else filtered_metadata
-            )
+            # Chunks are keyed by their content, so chunks that are already
+            # stored don't need embedding again; only changed metadata is updated
+            existing = self.collection.get(ids=filtered_ids, include=["metadatas"])
+            existing_metadata = dict(zip(existing["ids"], existing["metadatas"] or []))
+            if existing_metadata:
+                changed = [
+                    (doc_id, meta)
+                    for doc_id, meta in zip(filtered_ids, filtered_metadata)
+                    if doc_id in existing_metadata
+                    and meta is not None
+                    and meta != existing_metadata[doc_id]
+                ]
+                if changed:
+                    self.collection.update(
+                        ids=[doc_id for doc_id, _ in changed],
+                        metadatas=[meta for _, meta in changed],
+                    )
+                new_docs = [
+                    (doc, meta, doc_id)
+                    for doc, meta, doc_id in zip(
+                        filtered_docs, filtered_metadata, filtered_ids
+                    )
+                    if doc_id not in existing_metadata
+                ]
+                if not new_docs:
+                    return
+                filtered_docs, filtered_metadata, filtered_ids = (
+                    list(values) for values in zip(*new_docs)
+                )
 
-            self.collection.upsert(
-                documents=filtered_docs,
-                metadatas=final_metadata,
-                ids=filtered_ids,
-            )
+            self._upsert_in_batches(filtered_docs, filtered_metadata, filtered_ids)
         except chromadb.errors.InvalidDimensionException as e:
             Logger(verbose=True).log(
                 "error",
@@ -177,14 +377,84 @@ class KnowledgeStorage(BaseKnowledgeStorage):
             Logger(verbose=True).log("error", f"Failed to upsert documents: {e}", "red")
             raise
 
-    def _create_default_embedding_function(self):
-        from chromadb.utils.embedding_functions.openai_embedding_function import (
-            OpenAIEmbeddingFunction,
+    def _upsert_in_batches(
+        self,
+        documents: List[str],
+        metadatas: List[Optional[Dict[str, Any]]],
+        ids: List[str],
+    ) -> None:
+        """
+        Embeds documents in batches of ``embedding_batch_size``, with up to
+        ``embedding_concurrency`` batches in flight, and upserts each batch with
+        its precomputed embeddings as soon as it is ready. Batches that still
+        fail after retrying are reported once the others have been stored.
+        """
+        from crewai.utilities.events.crewai_event_bus import crewai_event_bus
+        from crewai.utilities.events.knowledge_events import (
+            KnowledgeEmbeddingProgressEvent,
         )
 
-        return OpenAIEmbeddingFunction(
-            api_key=os.getenv("OPENAI_API_KEY"), model_name="text-embedding-3-small"
-        )
+        batches = [
+            (
+                documents[start : start + self.embedding_batch_size],
+                metadatas[start : start + self.embedding_batch_size],
+                ids[start : start + self.embedding_batch_size],
+            )
+            for start in range(0, len(documents), self.embedding_batch_size)
+        ]
+        total = len(documents)
+        embedded = 0
+        errors: List[Exception] = []
+
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(self.embedding_concurrency, len(batches)))
+        ) as executor:
+            futures = {
+                executor.submit(self._embed_with_retry, batch[0]): batch
+                for batch in batches
+            }
+            for future in as_completed(futures):
+                batch_docs, batch_metadata, batch_ids = futures[future]
+                try:
+                    embeddings = future.result()
+                except Exception as e:
+                    errors.append(e)
+                    continue
+
+                # If we have no metadata at all, set it to None
+                final_metadata: Optional[OneOrMany[chromadb.Metadata]] = (
+                    None
+                    if all(m is None for m in batch_metadata)
+                    else batch_metadata  # type: ignore[assignment]
+                )
+                self.collection.upsert(  # type: ignore[union-attr]
+                    documents=batch_docs,
+                    metadatas=final_metadata,
+                    embeddings=embeddings,
+                    ids=batch_ids,
+                )
+                self.lexical_index.add(self.collection_key, batch_ids, batch_docs)
+                embedded += len(batch_docs)
+                crewai_event_bus.emit(
+                    self,
+                    event=KnowledgeEmbeddingProgressEvent(
+                        collection_name=self.collection_key,
+                        embedded=embedded,
+                        total=total,
+                    ),
+                )
+
+        if errors:
+            raise errors[0]
+
+    def _embed_with_retry(self, documents: List[str]) -> Any:
+        for attempt in range(self.embedding_max_retries + 1):
+            try:
+                return self.embedder(documents)
+            except Exception:
+                if attempt == self.embedding_max_retries:
+                    raise
+                time.sleep(EMBEDDING_RETRY_BACKOFF * 2**attempt)
 
     def _set_embedder_config(self, embedder: Optional[Dict[str, Any]] = None) -> None:
         """Set the embedding configuration for the knowledge storage.
@@ -193,8 +463,6 @@ class KnowledgeStorage(BaseKnowledgeStorage):
             embedder_config (Optional[Dict[str, Any]]): Configuration dictionary for the embedder.
                 If None or empty, defaults to the default embedding function.
         """
-        self.embedder = (
-            EmbeddingConfigurator().configure_embedder(embedder)
-            if embedder
-            else self._create_default_embedding_function()
-        )
+        self.embedder = EmbeddingConfigurator().configure_embedder(embedder or None)
+        self.embedder_fingerprint = embedder_fingerprint(embedder or None)
+        self._embedder_key = embedder_identity(embedder or None)
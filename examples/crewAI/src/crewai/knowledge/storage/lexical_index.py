@@ -0,0 +1,204 @@
+import math
+import re
+import sqlite3
+from collections import Counter, defaultdict
+from pathlib import Path
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+from crewai.utilities import Printer
+
+# Identifiers such as "SKU-1234", "v2.1.0" or "ERR_TIMEOUT" are kept whole,
+# and their parts are indexed as well
+_TOKEN = re.compile(r"\w+(?:[-./:]\w+)*")
+_TOKEN_PART = re.compile(r"[^\W_]+")
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+RRF_K = 60
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercased terms of ``text``, with compound identifiers and their parts."""
+    terms = []
+    for match in _TOKEN.finditer(text.lower()):
+        token = match.group()
+        terms.append(token)
+        parts = _TOKEN_PART.findall(token)
+        if len(parts) > 1:
+            terms.extend(parts)
+    return terms
+
+
+def reciprocal_rank_fusion(
+    rankings: Iterable[Sequence[str]], k: int = RRF_K
+) -> List[Tuple[str, float]]:
+    """
+    Merges ranked lists of ids, scoring each id by the sum of ``1 / (k + rank)``
+    over the lists it appears in. Returns ids by descending fused score.
+    """
+    scores: Dict[str, float] = defaultdict(float)
+    for ranking in rankings:
+        for rank, item_id in enumerate(ranking, start=1):
+            scores[item_id] += 1.0 / (k + rank)
+    return sorted(scores.items(), key=lambda item: item[1], reverse=True)
+
+
+class LexicalIndex:
+    """
+    SQLite inverted index of knowledge chunks, scored with BM25, kept next to
+    the vector collections to find exact terms that embeddings miss.
+    """
+
+    def __init__(self, db_path: str) -> None:
+        self.db_path = db_path
+        self._printer: Printer = Printer()
+        self._initialize_db()
+
+    def _initialize_db(self) -> None:
+        try:
+            Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+            with sqlite3.connect(self.db_path) as conn:
+                conn.executescript(
+                    """
+                    CREATE TABLE IF NOT EXISTS lexical_documents (
+                        collection TEXT NOT NULL,
+                        doc_id TEXT NOT NULL,
+                        length INTEGER NOT NULL,
+                        PRIMARY KEY (collection, doc_id)
+                    );
+                    CREATE TABLE IF NOT EXISTS lexical_postings (
+                        collection TEXT NOT NULL,
+                        term TEXT NOT NULL,
+                        doc_id TEXT NOT NULL,
+                        tf INTEGER NOT NULL,
+                        PRIMARY KEY (collection, term, doc_id)
+                    );
+                    CREATE INDEX IF NOT EXISTS idx_lexical_postings_doc
+                    ON lexical_postings (collection, doc_id);
+                    """
+                )
+        except sqlite3.Error as e:
+            self._printer.print(
+                content=f"LEXICAL INDEX ERROR: Could not initialize {self.db_path}: {e}",
+                color="red",
+            )
+
+    def add(self, collection: str, ids: Sequence[str], documents: Sequence[str]) -> None:
+        """Indexes ``documents`` under ``ids``, replacing any earlier version."""
+        documents_rows = []
+        postings_rows = []
+        for doc_id, document in zip(ids, documents):
+            terms = tokenize(document)
+            documents_rows.append((collection, doc_id, len(terms)))
+            postings_rows.extend(
+                (collection, term, doc_id, tf) for term, tf in Counter(terms).items()
+            )
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.executemany(
+                    "DELETE FROM lexical_postings WHERE collection = ? AND doc_id = ?",
+                    [(collection, doc_id) for doc_id in ids],
+                )
+                conn.executemany(
+                    "INSERT OR REPLACE INTO lexical_documents (collection, doc_id, length) VALUES (?, ?, ?)",
+                    documents_rows,
+                )
+                conn.executemany(
+                    "INSERT INTO lexical_postings (collection, term, doc_id, tf) VALUES (?, ?, ?, ?)",
+                    postings_rows,
+                )
+        except sqlite3.Error as e:
+            self._printer.print(
+                content=f"LEXICAL INDEX ERROR: Could not write {self.db_path}: {e}",
+                color="red",
+            )
+
+    def delete(self, collection: str, ids: Iterable[str]) -> None:
+        rows = [(collection, doc_id) for doc_id in ids]
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.executemany(
+                    "DELETE FROM lexical_postings WHERE collection = ? AND doc_id = ?",
+                    rows,
+                )
+                conn.executemany(
+                    "DELETE FROM lexical_documents WHERE collection = ? AND doc_id = ?",
+                    rows,
+                )
+        except sqlite3.Error as e:
+            self._printer.print(
+                content=f"LEXICAL INDEX ERROR: Could not write {self.db_path}: {e}",
+                color="red",
+            )
+
+    def clear(self, collection: str) -> None:
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.execute(
+                    "DELETE FROM lexical_postings WHERE collection = ?", (collection,)
+                )
+                conn.execute(
+                    "DELETE FROM lexical_documents WHERE collection = ?", (collection,)
+                )
+        except sqlite3.Error as e:
+            self._printer.print(
+                content=f"LEXICAL INDEX ERROR: Could not write {self.db_path}: {e}",
+                color="red",
+            )
+
+    def count(self, collection: str) -> int:
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                return conn.execute(
+                    "SELECT COUNT(*) FROM lexical_documents WHERE collection = ?",
+                    (collection,),
+                ).fetchone()[0]
+        except sqlite3.Error as e:
+            self._printer.print(
+                content=f"LEXICAL INDEX ERROR: Could not read {self.db_path}: {e}",
+                color="red",
+            )
+            return 0
+
+    def search(self, collection: str, query: str, limit: int = 10) -> List[Tuple[str, float]]:
+        """The ``limit`` best matches for ``query`` as (id, BM25 score), best first."""
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms:
+            return []
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                total, average_length = conn.execute(
+                    "SELECT COUNT(*), AVG(length) FROM lexical_documents WHERE collection = ?",
+                    (collection,),
+                ).fetchone()
+                if not total:
+                    return []
+                rows = conn.execute(
+                    f"""
+                    SELECT p.term, p.doc_id, p.tf, d.length
+                    FROM lexical_postings p
+                    JOIN lexical_documents d
+                    ON d.collection = p.collection AND d.doc_id = p.doc_id
+                    WHERE p.collection = ? AND p.term IN ({",".join("?" * len(terms))})
+                    """,
+                    (collection, *terms),
+                ).fetchall()
+        except sqlite3.Error as e:
+            self._printer.print(
+                content=f"LEXICAL INDEX ERROR: Could not read {self.db_path}: {e}",
+                color="red",
+            )
+            return []
+
+        document_frequency = Counter(term for term, _, _, _ in rows)
+        average_length = average_length or 1
+        scores: Dict[str, float] = defaultdict(float)
+        for term, doc_id, tf, length in rows:
+            df = document_frequency[term]
+            idf = math.log(1 + (total - df + 0.5) / (df + 0.5))
+            scores[doc_id] += idf * (
+                tf * (BM25_K1 + 1)
+                / (tf + BM25_K1 * (1 - BM25_B + BM25_B * length / average_length))
+            )
+        ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)
+        return ranked[:limit]
@@ -0,0 +1,201 @@
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, Iterable, Iterator, List, Literal, Optional, Tuple
+
+ChunkBoundary = Literal["character", "sentence", "paragraph", "markdown"]
+ChunkUnit = Literal["characters", "tokens"]
+
+# Separators that end a segment; a chunk only ever ends at the end of a segment
+_BOUNDARY_PATTERNS = {
+    "character": re.compile(r"\s+"),
+    "sentence": re.compile(r"(?<=[.!?])\s+|\n\s*\n"),
+    "paragraph": re.compile(r"\n\s*\n"),
+    "markdown": re.compile(r"\n\s*\n|\n(?=#{1,6}\s)"),
+}
+# Most characters a separator and its incomplete lookahead span at the end of a piece: "\n######"
+_LOOKAHEAD_LENGTH = 7
+_MARKDOWN_HEADING = re.compile(r"#{1,6}\s")
+_WORD = re.compile(r"\S+\s*")
+
+# (offset in the source text, text, measured length)
+_Segment = Tuple[int, str, int]
+
+
+@dataclass
+class TextChunk:
+    """A chunk of a source text with its character offsets in that text."""
+
+    text: str
+    start: int
+    end: int
+
+
+@lru_cache(maxsize=1)
+def _token_counter() -> Callable[[str], int]:
+    try:
+        import tiktoken
+
+        encoding = tiktoken.get_encoding("cl100k_base")
+        return lambda text: len(encoding.encode(text, disallowed_special=()))
+    except Exception:
+        # tiktoken is optional and may not be able to fetch its vocabulary;
+        # about four characters per token is close enough to size chunks
+        return lambda text: max(1, round(len(text) / 4))
+
+
+class TextChunker:
+    """
+    Splits text into overlapping chunks, in a single pass that can consume the
+    text as a stream of pieces.
+
+    With the ``character`` boundary and character units, chunks are the fixed
+    windows knowledge sources have always used. Other boundaries only cut
+    between sentences, paragraphs or markdown sections (starting a new chunk
+    at every heading), falling back to words and then characters for segments
+    that are larger than a chunk. Sizes are measured in characters or, with
+    ``unit="tokens"``, in tokens of the embedding tokenizer.
+    """
+
+    def __init__(
+        self,
+        chunk_size: int = 4000,
+        chunk_overlap: int = 200,
+        boundary: ChunkBoundary = "character",
+        unit: ChunkUnit = "characters",
+        length_function: Optional[Callable[[str], int]] = None,
+    ):
+        if chunk_overlap >= chunk_size:
+            raise ValueError("chunk_overlap must be smaller than chunk_size")
+        self.chunk_size = chunk_size
+        self.chunk_overlap = chunk_overlap
+        self.boundary = boundary
+        self.length_function = length_function or (
+            _token_counter() if unit == "tokens" else len
+        )
+
+    def split(self, text: str) -> List[TextChunk]:
+        return list(self.iter_chunks([text]))
+
+    def iter_chunks(self, pieces: Iterable[str]) -> Iterator[TextChunk]:
+        if self.boundary == "character" and self.length_function is len:
+            yield from self._iter_windows(pieces)
+        else:
+            yield from self._pack(self._iter_segments(pieces), split_oversized=True)
+
+    def _iter_windows(self, pieces: Iterable[str]) -> Iterator[TextChunk]:
+        step = self.chunk_size - self.chunk_overlap
+        buffer = ""
+        offset = 0  # offset of buffer[0] in the source text
+        start = 0  # start of the next window in buffer
+        for piece in pieces:
+            # Drop the consumed prefix only once it is large, so it is copied rarely
+            if start >= self.chunk_size:
+                buffer = buffer[start:]
+                offset += start
+                start = 0
+            buffer += piece
+            while len(buffer) - start >= self.chunk_size:
+                yield TextChunk(
+                    buffer[start : start + self.chunk_size],
+                    offset + start,
+                    offset + start + self.chunk_size,
+                )
+                start += step
+        while start < len(buffer):
+            remaining = len(buffer) - start
+            yield TextChunk(
+                buffer[start : start + self.chunk_size],
+                offset + start,
+                offset + start + min(remaining, self.chunk_size),
+            )
+            if remaining <= step:
+                break
+            start += step
+
+    def _iter_segments(self, pieces: Iterable[str]) -> Iterator[_Segment]:
+        pattern = _BOUNDARY_PATTERNS[self.boundary]
+        buffer = ""
+        offset = 0
+        scan_from = 0
+        for piece in pieces:
+            buffer += piece
+            last = 0
+            for match in pattern.finditer(buffer, scan_from):
+                # A separator at the very end may continue in the next piece
+                if match.end() == len(buffer):
+                    break
+                segment = buffer[last : match.end()]
+                yield offset + last, segment, self.length_function(segment)
+                last = match.end()
+            # Text scanned without a match can only gain one through trailing
+            # whitespace or a heading's lookahead, so the next search resumes there
+            scan_from = len(buffer)
+            while scan_from > last and buffer[scan_from - 1].isspace():
+                scan_from -= 1
+            scan_from = max(last, scan_from - _LOOKAHEAD_LENGTH) - last
+            if last:
+                buffer = buffer[last:]
+                offset += last
+        if buffer:
+            yield offset, buffer, self.length_function(buffer)
+
+    def _pack(
+        self, segments: Iterable[_Segment], split_oversized: bool
+    ) -> Iterator[TextChunk]:
+        current: List[_Segment] = []
+        size = 0
+        for segment in segments:
+            start, text, length = segment
+            if length > self.chunk_size:
+                if current:
+                    yield self._join(current)
+                    current, size = [], 0
+                if split_oversized:
+                    words = (
+                        (start + m.start(), m.group(), self.length_function(m.group()))
+                        for m in _WORD.finditer(text)
+                    )
+                    yield from self._pack(words, split_oversized=False)
+                else:
+                    yield from self._hard_split(segment)
+                continue
+
+            if (
+                current
+                and self.boundary == "markdown"
+                and _MARKDOWN_HEADING.match(text)
+            ):
+                yield self._join(current)
+                current, size = [], 0
+            elif current and size + length > self.chunk_size:
+                yield self._join(current)
+                current, size = self._overlap(current, length)
+
+            current.append(segment)
+            size += length
+        if current:
+            yield self._join(current)
+
+    def _overlap(self, segments: List[_Segment], incoming: int) -> Tuple[List[_Segment], int]:
+        """Trailing segments of the previous chunk to repeat at the start of the next one."""
+        kept: List[_Segment] = []
+        size = 0
+        for segment in reversed(segments):
+            if size + segment[2] > self.chunk_overlap or size + segment[2] + incoming > self.chunk_size:
+                break
+            kept.insert(0, segment)
+            size += segment[2]
+        return kept, size
+
+    def _hard_split(self, segment: _Segment) -> Iterator[TextChunk]:
+        start, text, length = segment
+        width = max(1, len(text) * self.chunk_size // length)
+        for i in range(0, len(text), width):
+            yield TextChunk(text[i : i + width], start + i, start + min(i + width, len(text)))
+
+    @staticmethod
+    def _join(segments: List[_Segment]) -> TextChunk:
+        start = segments[0][0]
+        text = "".join(segment[1] for segment in segments).rstrip()
+        return TextChunk(text, start, start + len(text))
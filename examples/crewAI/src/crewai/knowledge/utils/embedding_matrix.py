@@ -0,0 +1,151 @@
+import os
+from typing import Any, Iterable, Iterator, Optional, Tuple, Union
+
+import numpy as np
+
+# Rows scored at a time, so searching a memory-mapped matrix only pages in a
+# block of it and temporaries stay bounded
+SIMILARITY_BLOCK_ROWS = 65536
+
+
+class EmbeddingMatrix:
+    """
+    Chunk embeddings as one contiguous float32 ``(rows, dimensions)`` matrix.
+
+    Rows are appended into a buffer that grows geometrically. ``save`` writes
+    the matrix to a ``.npy`` file and ``load`` maps it read-only, so worker
+    processes opening (or unpickling) the same file share its pages instead of
+    each holding a copy. Appending to a mapped matrix first copies it into memory.
+    """
+
+    def __init__(self, vectors: Optional[Iterable[Any]] = None) -> None:
+        self._buffer = np.empty((0, 0), dtype=np.float32)
+        self._rows = 0
+        self._norms: Optional[np.ndarray] = None
+        self.path: Optional[str] = None
+        if vectors is not None:
+            self.extend(vectors)
+
+    @classmethod
+    def load(cls, path: str) -> "EmbeddingMatrix":
+        matrix = cls()
+        matrix._buffer = np.load(path, mmap_mode="r")
+        matrix._rows = len(matrix._buffer)
+        matrix.path = os.path.abspath(path)
+        return matrix
+
+    def save(self, path: str) -> None:
+        """Writes the matrix to ``path`` and maps it from there from now on."""
+        if self.path == os.path.abspath(path):
+            return
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        mapped = np.lib.format.open_memmap(
+            path, mode="w+", dtype=np.float32, shape=self.array.shape
+        )
+        mapped[:] = self.array
+        mapped.flush()
+        del mapped
+        self._buffer = np.load(path, mmap_mode="r")
+        self.path = os.path.abspath(path)
+
+    @property
+    def array(self) -> np.ndarray:
+        """The embeddings, as a view without copying."""
+        return self._buffer[: self._rows]
+
+    @property
+    def dimensions(self) -> int:
+        return self._buffer.shape[1]
+
+    def append(self, vector: Any) -> None:
+        self.extend([vector])
+
+    def extend(self, vectors: Iterable[Any]) -> None:
+        block = np.asarray(
+            vectors if isinstance(vectors, np.ndarray) else list(vectors),
+            dtype=np.float32,
+        )
+        if block.size == 0:
+            return
+        block = block.reshape(len(block), -1)
+        if self._rows and block.shape[1] != self.dimensions:
+            raise ValueError(
+                f"Embedding has {block.shape[1]} dimensions, expected {self.dimensions}"
+            )
+
+        needed = self._rows + len(block)
+        if self.path is not None or needed > len(self._buffer):
+            capacity = max(needed, 2 * len(self._buffer), 16)
+            grown = np.empty((capacity, block.shape[1]), dtype=np.float32)
+            if self._rows:
+                grown[: self._rows] = self.array
+            self._buffer = grown
+            self.path = None
+        self._buffer[self._rows : needed] = block
+        self._rows = needed
+        self._norms = None
+
+    def cosine_similarity(self, queries: Any) -> np.ndarray:
+        """Cosine similarity of every query (one or many) to every row, shaped ``(queries, rows)``."""
+        queries = np.atleast_2d(np.asarray(queries, dtype=np.float32))
+        if not self._rows:
+            return np.empty((len(queries), 0), dtype=np.float32)
+        query_norms = np.linalg.norm(queries, axis=1, keepdims=True)
+        queries = queries / np.where(query_norms == 0, 1, query_norms)
+        norms = self._row_norms()
+
+        similarities = np.empty((len(queries), self._rows), dtype=np.float32)
+        for start in range(0, self._rows, SIMILARITY_BLOCK_ROWS):
+            end = min(start + SIMILARITY_BLOCK_ROWS, self._rows)
+            similarities[:, start:end] = (
+                queries @ self.array[start:end].T
+            ) / norms[start:end]
+        return similarities
+
+    def top_k(self, query: Any, k: int = 3) -> Tuple[np.ndarray, np.ndarray]:
+        """Row indices and cosine similarities of the ``k`` rows closest to ``query``, best first."""
+        similarities = self.cosine_similarity(query)[0]
+        k = min(k, len(similarities))
+        if k <= 0:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+        candidates = np.argpartition(-similarities, k - 1)[:k]
+        order = candidates[np.argsort(-similarities[candidates], kind="stable")]
+        return order, similarities[order]
+
+    def _row_norms(self) -> np.ndarray:
+        if self._norms is None:
+            norms = np.empty(self._rows, dtype=np.float32)
+            for start in range(0, self._rows, SIMILARITY_BLOCK_ROWS):
+                end = min(start + SIMILARITY_BLOCK_ROWS, self._rows)
+                norms[start:end] = np.linalg.norm(self.array[start:end], axis=1)
+            self._norms = np.where(norms == 0, 1, norms)
+        return self._norms
+
+    def __len__(self) -> int:
+        return self._rows
+
+    def __iter__(self) -> Iterator[np.ndarray]:
+        return iter(self.array)
+
+    def __getitem__(self, index: Union[int, slice]) -> np.ndarray:
+        return self.array[index]
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, EmbeddingMatrix):
+            return NotImplemented
+        return bool(np.array_equal(self.array, other.array))
+
+    def __reduce__(self) -> Any:
+        # Mapped matrices are reopened from their file instead of being copied
+        if self.path is not None:
+            return (EmbeddingMatrix.load, (self.path,))
+        return (EmbeddingMatrix, (self.array,))
+
+    def __deepcopy__(self, memo: Any) -> "EmbeddingMatrix":
+        if self.path is not None:
+            return EmbeddingMatrix.load(self.path)
+        return EmbeddingMatrix(self.array.copy())
+
+    def __repr__(self) -> str:
+        dimensions = self.dimensions if self._rows else 0
+        return f"EmbeddingMatrix(rows={self._rows}, dimensions={dimensions}, path={self.path!r})"
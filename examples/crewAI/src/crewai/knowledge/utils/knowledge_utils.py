@@ -1,5 +1,19 @@
+import re
 from typing import Any, Dict, List
 
+_KEYWORD = re.compile(r"\w+(?:[-./:]\w+)*")
+_STOPWORDS = frozenset(
+    """
+    a about above after again all also an and any are as at be been before being
+    below between both but by can could did do does doing down during each few for
+    from further had has have having he her here hers him his how i if in into is it
+    its just me more most my no nor not now of off on once only or other our ours out
+    over own please same she should so some such than that the their theirs them then
+    there these they this those through to too under until up very was we were what
+    when where which while who whom why will with would you your yours
+    """.split()
+)
+
 
 def extract_knowledge_context(knowledge_snippets: List[Dict[str, Any]]) -> str:
     """Extract knowledge from the task prompt."""
@@ -10,3 +24,16 @@ def extract_knowledge_context(knowledge_snippets: List[Dict[str, Any]]) -> str:
     ]
     snippet = "\n".join(valid_snippets)
     return f"Additional Information: {snippet}" if valid_snippets else ""
+
+
+def extract_keywords(text: str, max_keywords: int = 16) -> str:
+    """Distinct non-stopword terms of ``text``, in order, as a search query that needs no LLM call."""
+    keywords: Dict[str, None] = {}
+    for match in _KEYWORD.finditer(text):
+        word = match.group()
+        if word.casefold() in _STOPWORDS or (len(word) < 2 and not word.isdigit()):
+            continue
+        keywords.setdefault(word, None)
+        if len(keywords) >= max_keywords:
+            break
+    return " ".join(keywords)
@@ -0,0 +1,130 @@
+import csv
+import json
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Deque, Iterable, Iterator, List, Optional, Tuple
+
+# A unit of extraction work: a module-level function (so it can be sent to a
+# worker process) and its arguments. It returns or yields pieces of text.
+ExtractionTask = Tuple[Callable[..., Iterable[str]], Tuple[Any, ...]]
+
+PDF_PAGES_PER_TASK = 16
+TEXT_BLOCK_SIZE = 1 << 20
+
+
+def run_extraction(
+    tasks: List[ExtractionTask],
+    parallel: bool = False,
+    max_workers: Optional[int] = None,
+) -> Iterator[Iterable[str]]:
+    """
+    Yields the text pieces of each task, in task order.
+
+    CPU-heavy tasks (``parallel=True``) run in a process pool with at most
+    ``2 * max_workers`` results held at once. The workers are spawned rather
+    than forked, as forking a multithreaded process can deadlock. Other tasks run lazily in this
+    process, so each task's iterable must be consumed before the next one is
+    requested.
+    """
+    workers = max_workers or os.cpu_count() or 1
+    if not parallel or workers == 1 or len(tasks) < 2:
+        for fn, args in tasks:
+            yield fn(*args)
+        return
+
+    with ProcessPoolExecutor(
+        max_workers=min(workers, len(tasks)),
+        mp_context=multiprocessing.get_context("spawn"),
+    ) as executor:
+        pending: Deque[Future] = deque()
+        task_iter = iter(tasks)
+        for fn, args in task_iter:
+            pending.append(executor.submit(_materialize, fn, args))
+            if len(pending) >= 2 * workers:
+                break
+        while pending:
+            pieces = pending.popleft().result()
+            next_task = next(task_iter, None)
+            if next_task is not None:
+                pending.append(executor.submit(_materialize, *next_task))
+            yield pieces
+
+
+def _materialize(fn: Callable[..., Iterable[str]], args: Tuple[Any, ...]) -> List[str]:
+    return list(fn(*args))
+
+
+def extract_pdf_pages(path: Path, start: int, end: int) -> List[str]:
+    import pdfplumber
+
+    pages = []
+    with pdfplumber.open(path) as pdf:
+        for page in pdf.pages[start:end]:
+            page_text = page.extract_text()
+            if page_text:
+                pages.append(page_text + "\n")
+            page.close()
+    return pages
+
+
+def pdf_tasks(path: Path) -> List[ExtractionTask]:
+    import pdfplumber
+
+    with pdfplumber.open(path) as pdf:
+        page_count = len(pdf.pages)
+    return [
+        (extract_pdf_pages, (path, start, min(start + PDF_PAGES_PER_TASK, page_count)))
+        for start in range(0, page_count, PDF_PAGES_PER_TASK)
+    ]
+
+
+def read_excel_sheet(path: Path, sheet_name: str) -> List[str]:
+    import pandas as pd
+
+    return [str(pd.read_excel(path, sheet_name).to_csv(index=False)) + "\n"]
+
+
+def excel_tasks(path: Path) -> List[ExtractionTask]:
+    import pandas as pd
+
+    with pd.ExcelFile(path) as xl:
+        sheet_names = list(xl.sheet_names)
+    return [(read_excel_sheet, (path, sheet_name)) for sheet_name in sheet_names]
+
+
+def iter_csv_rows(path: Path) -> Iterator[str]:
+    with open(path, "r", encoding="utf-8") as csvfile:
+        for row in csv.reader(csvfile):
+            yield " ".join(row) + "\n"
+
+
+def iter_json_lines(path: Path) -> Iterator[str]:
+    with open(path, "r", encoding="utf-8") as json_file:
+        data = json.load(json_file)
+    yield from _iter_json_text(data)
+
+
+def _iter_json_text(data: Any, level: int = 0) -> Iterator[str]:
+    """Yields the same text as ``JSONKnowledgeSource._json_to_text``, piece by piece."""
+    indent = "  " * level
+    if isinstance(data, dict):
+        for key, value in data.items():
+            yield f"{indent}{key}: "
+            yield from _iter_json_text(value, level + 1)
+            yield "\n"
+    elif isinstance(data, list):
+        for item in data:
+            yield f"{indent}- "
+            yield from _iter_json_text(item, level + 1)
+            yield "\n"
+    else:
+        yield str(data)
+
+
+def iter_text_blocks(path: Path) -> Iterator[str]:
+    with open(path, "r", encoding="utf-8") as f:
+        while block := f.read(TEXT_BLOCK_SIZE):
+            yield block
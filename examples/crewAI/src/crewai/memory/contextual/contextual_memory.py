@@ -1,4 +1,8 @@
-from typing import Any, Dict, Optional
+import concurrent.futures
+import contextvars
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from crewai.memory import (
     EntityMemory,
@@ -21,32 +25,104 @@ class ContextualMemory:
     ):
         if memory_config is not None:
             self.memory_provider = memory_config.get("provider")
+            self.retrieval_timeout = memory_config.get("retrieval_timeout")
         else:
             self.memory_provider = None
+            self.retrieval_timeout = None
         self.stm = stm
         self.ltm = ltm
         self.em = em
         self.um = um
         self.exm = exm
+        self.retrieval_times: Dict[str, float] = {}
+        self.timed_out_stores: List[str] = []
 
     def build_context_for_task(self, task, context) -> str:
         """
         Automatically builds a minimal, highly relevant set of contextual information
         for a given task.
+
+        All configured memories are queried concurrently. When a
+        ``retrieval_timeout`` (in seconds) is set in the memory config, stores
+        that have not answered by the deadline are dropped from the context and
+        listed in ``timed_out_stores``.
         """
+        self.retrieval_times = {}
+        self.timed_out_stores = []
+
         query = f"{task.description} {context}".strip()
 
         if query == "":
             return ""
 
-        context = []
-        context.append(self._fetch_ltm_context(task.description))
-        context.append(self._fetch_stm_context(query))
-        context.append(self._fetch_entity_context(query))
-        context.append(self._fetch_external_context(query))
+        fetchers: List[Tuple[str, Optional[Any], Callable[[str], Optional[str]], str]] = [
+            ("long_term_memory", self.ltm, self._fetch_ltm_context, task.description),
+            ("short_term_memory", self.stm, self._fetch_stm_context, query),
+            ("entity_memory", self.em, self._fetch_entity_context, query),
+            ("external_memory", self.exm, self._fetch_external_context, query),
+        ]
         if self.memory_provider == "mem0":
-            context.append(self._fetch_user_context(query))
-        return "\n".join(filter(None, context))
+            fetchers.append(("user_memory", self.um, self._fetch_user_context, query))
+
+        fetchers = [fetcher for fetcher in fetchers if fetcher[1] is not None]
+        if not fetchers:
+            return ""
+
+        return "\n".join(filter(None, self._fetch_concurrently(fetchers)))
+
+    def _fetch_concurrently(
+        self,
+        fetchers: List[Tuple[str, Optional[Any], Callable[[str], Optional[str]], str]],
+    ) -> List[Optional[str]]:
+        """
+        Runs every fetcher in its own thread and collects the results in the
+        order the fetchers were given, skipping the ones that missed the deadline.
+
+        Fetchers that miss the deadline keep running in the background, so
+        they record their timings in a dictionary of this call only. Results
+        and ``retrieval_times`` both come from the fetchers done by the
+        deadline, whose timings are recorded before they complete.
+        """
+
+        retrieval_times: Dict[str, float] = {}
+        times_lock = threading.Lock()
+
+        def timed_fetch(
+            name: str, fetch: Callable[[str], Optional[str]], query: str
+        ) -> Optional[str]:
+            start_time = time.time()
+            try:
+                return fetch(query)
+            finally:
+                with times_lock:
+                    retrieval_times[name] = (time.time() - start_time) * 1000
+
+        executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=len(fetchers), thread_name_prefix="crewai-memory"
+        )
+        try:
+            futures = [
+                executor.submit(
+                    contextvars.copy_context().run, timed_fetch, name, fetch, query
+                )
+                for name, _, fetch, query in fetchers
+            ]
+            done, _ = concurrent.futures.wait(
+                futures, timeout=self.retrieval_timeout
+            )
+
+            results: List[Optional[str]] = []
+            self.retrieval_times = {}
+            for (name, _, _, _), future in zip(fetchers, futures):
+                if future not in done:
+                    self.timed_out_stores.append(name)
+                    continue
+                with times_lock:
+                    self.retrieval_times[name] = retrieval_times[name]
+                results.append(future.result())
+            return results
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
 
     def _fetch_stm_context(self, query) -> str:
         """
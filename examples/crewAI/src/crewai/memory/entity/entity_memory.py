@@ -1,19 +1,18 @@
-from typing import Optional
+from typing import List, Optional
+import functools
 import time
 
 from pydantic import PrivateAttr
 
 from crewai.memory.entity.entity_memory_item import EntityMemoryItem
 from crewai.memory.memory import Memory
-from crewai.memory.storage.rag_storage import RAGStorage
+from crewai.memory.storage.mmap_rag_storage import MmapRAGStorage
+from crewai.memory.storage.rag_storage import DEFAULT_BATCH_SIZE, RAGStorage
 from crewai.utilities.events.crewai_event_bus import crewai_event_bus
 from crewai.utilities.events.memory_events import (
     MemoryQueryStartedEvent,
     MemoryQueryCompletedEvent,
     MemoryQueryFailedEvent,
-    MemorySaveStartedEvent,
-    MemorySaveCompletedEvent,
-    MemorySaveFailedEvent,
 )
 
 
@@ -29,8 +28,14 @@ class EntityMemory(Memory):
     def __init__(self, crew=None, embedder_config=None, storage=None, path=None):
         if crew and hasattr(crew, "memory_config") and crew.memory_config is not None:
             memory_provider = crew.memory_config.get("provider")
+            batch_size = crew.memory_config.get("batch_size", DEFAULT_BATCH_SIZE)
+            vector_store = crew.memory_config.get("vector_store")
+            retention = crew.memory_config.get("retention")
         else:
             memory_provider = None
+            batch_size = DEFAULT_BATCH_SIZE
+            vector_store = None
+            retention = None
 
         if memory_provider == "mem0":
             try:
@@ -40,6 +45,18 @@ class EntityMemory(Memory):
                     "Mem0 is not installed. Please install it with `pip install mem0ai`."
                 )
             storage = Mem0Storage(type="entities", crew=crew)
+        elif not storage and vector_store == "mmap":
+            if retention:
+                raise ValueError(
+                    "memory_config['retention'] is not supported by the mmap vector store"
+                )
+            storage = MmapRAGStorage(
+                type="entities",
+                embedder_config=embedder_config,
+                crew=crew,
+                path=path,
+                batch_size=batch_size,
+            )
         else:
             storage = (
                 storage
@@ -50,6 +67,8 @@ class EntityMemory(Memory):
                     embedder_config=embedder_config,
                     crew=crew,
                     path=path,
+                    batch_size=batch_size,
+                    retention=retention,
                 )
             )
 
@@ -58,48 +77,41 @@ class EntityMemory(Memory):
 
     def save(self, item: EntityMemoryItem) -> None:  # type: ignore # BUG?: Signature of "save" incompatible with supertype "Memory"
         """Saves an entity item into the SQLite storage."""
-        crewai_event_bus.emit(
-            self,
-            event=MemorySaveStartedEvent(
-                metadata=item.metadata,
-                source_type="entity_memory",
+        data = self._format_item(item)
+        self._save_with_events(
+            "entity_memory",
+            [{"value": data, "metadata": item.metadata}],
+            functools.partial(super().save, data, item.metadata),
+        )
+
+    def save_many(self, items: List[EntityMemoryItem]) -> None:
+        """Saves several entity items with a single storage write."""
+        if not items:
+            return
+
+        data = [self._format_item(item) for item in items]
+        self._save_with_events(
+            "entity_memory",
+            [
+                {"value": value, "metadata": item.metadata}
+                for item, value in zip(items, data)
+            ],
+            functools.partial(
+                self._save_many_to_storage,
+                data,
+                [dict(item.metadata) for item in items],
             ),
         )
 
-        start_time = time.time()
-        try:
-            if self._memory_provider == "mem0":
-                data = f"""
+    def _format_item(self, item: EntityMemoryItem) -> str:
+        if self._memory_provider == "mem0":
+            return f"""
                 Remember details about the following entity:
                 Name: {item.name}
                 Type: {item.type}
                 Entity Description: {item.description}
                 """
-            else:
-                data = f"{item.name}({item.type}): {item.description}"
-
-            super().save(data, item.metadata)
-
-            # Emit memory save completed event
-            crewai_event_bus.emit(
-                self,
-                event=MemorySaveCompletedEvent(
-                    value=data,
-                    metadata=item.metadata,
-                    save_time_ms=(time.time() - start_time) * 1000,
-                    source_type="entity_memory",
-                ),
-            )
-        except Exception as e:
-            crewai_event_bus.emit(
-                self,
-                event=MemorySaveFailedEvent(
-                    metadata=item.metadata,
-                    error=str(e),
-                    source_type="entity_memory",
-                ),
-            )
-            raise
+        return f"{item.name}({item.type}): {item.description}"
 
     def search(
         self,
@@ -1,7 +1,15 @@
-from typing import Any, Dict, List, Optional
+import time
+from typing import Any, Callable, Dict, List, Optional
 
 from pydantic import BaseModel
 
+from crewai.utilities.events.crewai_event_bus import crewai_event_bus
+from crewai.utilities.events.memory_events import (
+    MemorySaveCompletedEvent,
+    MemorySaveFailedEvent,
+    MemorySaveStartedEvent,
+)
+
 
 class Memory(BaseModel):
     """
@@ -28,6 +36,53 @@ class Memory(BaseModel):
 
         self.storage.save(value, metadata)
 
+    def _save_with_events(
+        self,
+        source_type: str,
+        items: List[Dict[str, Any]],
+        write: Callable[[], None],
+    ) -> None:
+        """
+        Runs ``write``, which saves ``items``, emitting the save started,
+        completed or failed event of each item. Each item holds the ``value``,
+        ``metadata`` and ``agent_role`` its events report.
+        """
+        for item in items:
+            crewai_event_bus.emit(
+                self, event=MemorySaveStartedEvent(**item, source_type=source_type)
+            )
+
+        start_time = time.time()
+        try:
+            write()
+        except Exception as e:
+            for item in items:
+                crewai_event_bus.emit(
+                    self,
+                    event=MemorySaveFailedEvent(
+                        **item, error=str(e), source_type=source_type
+                    ),
+                )
+            raise
+
+        save_time_ms = (time.time() - start_time) * 1000
+        for item in items:
+            crewai_event_bus.emit(
+                self,
+                event=MemorySaveCompletedEvent(
+                    **item, save_time_ms=save_time_ms, source_type=source_type
+                ),
+            )
+
+    def _save_many_to_storage(
+        self, values: List[Any], metadatas: List[Dict[str, Any]]
+    ) -> None:
+        if hasattr(self.storage, "save_many"):
+            self.storage.save_many(values, metadatas)
+        else:
+            for value, metadata in zip(values, metadatas):
+                self.storage.save(value, metadata)
+
     def search(
         self,
         query: str,
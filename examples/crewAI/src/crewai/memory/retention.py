@@ -0,0 +1,87 @@
+import time
+from typing import Any, Dict, List, Literal, Optional
+
+from pydantic import BaseModel, Field
+
+CREATED_AT_KEY = "_created_at"
+LAST_ACCESSED_AT_KEY = "_last_accessed_at"
+RETRIEVAL_COUNT_KEY = "_retrieval_count"
+
+
+class MemoryRetentionPolicy(BaseModel):
+    """
+    Bounds how much a vector memory store keeps.
+
+    Items are stamped with their creation time, last retrieval time and
+    retrieval count when saved. After every write, expired items are deleted
+    and, once the store holds more than ``max_items``, it is pruned down to
+    ``max_items * (1 - prune_ratio)`` so the full scan needed to pick victims
+    only runs once every few writes.
+    """
+
+    max_items: Optional[int] = Field(
+        default=None, gt=0, description="Maximum number of items kept in the store."
+    )
+    ttl_seconds: Optional[float] = Field(
+        default=None, gt=0, description="Items older than this are deleted."
+    )
+    eviction: Literal["fifo", "lru", "score"] = Field(
+        default="lru",
+        description="Which items go first when the store is over max_items: "
+        "oldest saved (fifo), least recently retrieved (lru) or lowest score_key (score).",
+    )
+    score_key: str = Field(
+        default=RETRIEVAL_COUNT_KEY,
+        description="Numeric metadata key ranking items for score-based eviction.",
+    )
+    prune_ratio: float = Field(
+        default=0.1,
+        ge=0,
+        lt=1,
+        description="Fraction of max_items freed each time the cap is exceeded.",
+    )
+
+    def stamp(self, metadata: Optional[Dict[str, Any]], now: Optional[float] = None) -> Dict[str, Any]:
+        """Returns a copy of ``metadata`` with the bookkeeping fields of a new item."""
+        now = time.time() if now is None else now
+        return {
+            **(metadata or {}),
+            CREATED_AT_KEY: now,
+            LAST_ACCESSED_AT_KEY: now,
+            RETRIEVAL_COUNT_KEY: 0,
+        }
+
+    def touch(self, metadata: Optional[Dict[str, Any]], now: Optional[float] = None) -> Dict[str, Any]:
+        """Returns a copy of ``metadata`` recording one more retrieval."""
+        metadata = dict(metadata or {})
+        metadata[LAST_ACCESSED_AT_KEY] = time.time() if now is None else now
+        metadata[RETRIEVAL_COUNT_KEY] = metadata.get(RETRIEVAL_COUNT_KEY, 0) + 1
+        return metadata
+
+    def expiry_cutoff(self, now: Optional[float] = None) -> Optional[float]:
+        if self.ttl_seconds is None:
+            return None
+        return (time.time() if now is None else now) - self.ttl_seconds
+
+    def needs_pruning(self, count: int) -> bool:
+        return self.max_items is not None and count > self.max_items
+
+    def select_evictions(
+        self, ids: List[str], metadatas: List[Optional[Dict[str, Any]]]
+    ) -> List[str]:
+        """Picks the ids to delete to bring the store back under its low-water mark."""
+        if self.max_items is None or len(ids) <= self.max_items:
+            return []
+        keep = int(self.max_items * (1 - self.prune_ratio))
+
+        def rank(item: Any) -> Any:
+            metadata = item[1] or {}
+            created_at = metadata.get(CREATED_AT_KEY, 0)
+            if self.eviction == "fifo":
+                return (created_at,)
+            if self.eviction == "lru":
+                return (metadata.get(LAST_ACCESSED_AT_KEY, created_at), created_at)
+            return (metadata.get(self.score_key, 0), created_at)
+
+        ranked = sorted(zip(ids, metadatas), key=rank)
+        return [item_id for item_id, _ in ranked[: len(ids) - keep]]
@@ -1,19 +1,18 @@
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
+import functools
 import time
 
 from pydantic import PrivateAttr
 
 from crewai.memory.memory import Memory
 from crewai.memory.short_term.short_term_memory_item import ShortTermMemoryItem
-from crewai.memory.storage.rag_storage import RAGStorage
+from crewai.memory.storage.mmap_rag_storage import MmapRAGStorage
+from crewai.memory.storage.rag_storage import DEFAULT_BATCH_SIZE, RAGStorage
 from crewai.utilities.events.crewai_event_bus import crewai_event_bus
 from crewai.utilities.events.memory_events import (
     MemoryQueryStartedEvent,
     MemoryQueryCompletedEvent,
     MemoryQueryFailedEvent,
-    MemorySaveStartedEvent,
-    MemorySaveCompletedEvent,
-    MemorySaveFailedEvent,
 )
 
 
@@ -31,8 +30,14 @@ class ShortTermMemory(Memory):
     def __init__(self, crew=None, embedder_config=None, storage=None, path=None):
         if crew and hasattr(crew, "memory_config") and crew.memory_config is not None:
             memory_provider = crew.memory_config.get("provider")
+            batch_size = crew.memory_config.get("batch_size", DEFAULT_BATCH_SIZE)
+            vector_store = crew.memory_config.get("vector_store")
+            retention = crew.memory_config.get("retention")
         else:
             memory_provider = None
+            batch_size = DEFAULT_BATCH_SIZE
+            vector_store = None
+            retention = None
 
         if memory_provider == "mem0":
             try:
@@ -42,6 +47,18 @@ class ShortTermMemory(Memory):
                     "Mem0 is not installed. Please install it with `pip install mem0ai`."
                 )
             storage = Mem0Storage(type="short_term", crew=crew)
+        elif not storage and vector_store == "mmap":
+            if retention:
+                raise ValueError(
+                    "memory_config['retention'] is not supported by the mmap vector store"
+                )
+            storage = MmapRAGStorage(
+                type="short_term",
+                embedder_config=embedder_config,
+                crew=crew,
+                path=path,
+                batch_size=batch_size,
+            )
         else:
             storage = (
                 storage
@@ -51,6 +68,8 @@ class ShortTermMemory(Memory):
                     embedder_config=embedder_config,
                     crew=crew,
                     path=path,
+                    batch_size=batch_size,
+                    retention=retention,
                 )
             )
         super().__init__(storage=storage)
@@ -62,46 +81,43 @@ class ShortTermMemory(Memory):
         metadata: Optional[Dict[str, Any]] = None,
         agent: Optional[str] = None,
     ) -> None:
-        crewai_event_bus.emit(
-            self,
-            event=MemorySaveStartedEvent(
-                value=value,
-                metadata=metadata,
-                agent_role=agent,
-                source_type="short_term_memory",
+        item = ShortTermMemoryItem(data=value, metadata=metadata, agent=agent)
+        if self._memory_provider == "mem0":
+            item.data = f"Remember the following insights from Agent run: {item.data}"
+
+        self._save_with_events(
+            "short_term_memory",
+            [{"value": value, "metadata": metadata, "agent_role": agent}],
+            functools.partial(
+                super().save, value=item.data, metadata=item.metadata, agent=item.agent
             ),
         )
 
-        start_time = time.time()
-        try:
-            item = ShortTermMemoryItem(data=value, metadata=metadata, agent=agent)
-            if self._memory_provider == "mem0":
-                item.data = f"Remember the following insights from Agent run: {item.data}"
-
-            super().save(value=item.data, metadata=item.metadata, agent=item.agent)
+    def save_many(self, items: List[ShortTermMemoryItem]) -> None:
+        """Saves several short-term memory items with a single storage write."""
+        if not items:
+            return
 
-            crewai_event_bus.emit(
-                self,
-                event=MemorySaveCompletedEvent(
-                    value=value,
-                    metadata=metadata,
-                    agent_role=agent,
-                    save_time_ms=(time.time() - start_time) * 1000,
-                    source_type="short_term_memory",
-                ),
-            )
-        except Exception as e:
-            crewai_event_bus.emit(
-                self,
-                event=MemorySaveFailedEvent(
-                    value=value,
-                    metadata=metadata,
-                    agent_role=agent,
-                    error=str(e),
-                    source_type="short_term_memory",
-                ),
-            )
-            raise
+        values = []
+        metadatas = []
+        for item in items:
+            data = item.data
+            if self._memory_provider == "mem0":
+                data = f"Remember the following insights from Agent run: {data}"
+            metadata = dict(item.metadata)
+            if item.agent:
+                metadata["agent"] = item.agent
+            values.append(data)
+            metadatas.append(metadata)
+
+        self._save_with_events(
+            "short_term_memory",
+            [
+                {"value": item.data, "metadata": item.metadata, "agent_role": item.agent}
+                for item in items
+            ],
+            functools.partial(self._save_many_to_storage, values, metadatas),
+        )
 
     def search(
         self,
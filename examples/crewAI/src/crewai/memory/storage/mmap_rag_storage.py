@@ -0,0 +1,378 @@
+import json
+import logging
+import os
+import shutil
+import sqlite3
+import uuid
+from contextlib import closing
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from crewai.memory.storage.rag_storage import DEFAULT_BATCH_SIZE
+from crewai.rag.embeddings.configurator import EmbeddingConfigurator
+from crewai.rag.storage.base_rag_storage import BaseRAGStorage
+from crewai.utilities.constants import MAX_FILE_NAME_LENGTH
+from crewai.utilities.paths import db_storage_path
+
+VECTORS_FILE = "vectors.f32"
+CENTROIDS_FILE = "centroids.npy"
+METADATA_DB = "metadata.db"
+
+DEFAULT_NLIST = 64
+DEFAULT_NPROBE = 8
+# IVF lists are (re)trained once there are this many vectors per list
+IVF_TRAIN_POINTS_PER_LIST = 32
+IVF_TRAIN_ITERATIONS = 10
+
+
+class MmapRAGStorage(BaseRAGStorage):
+    """
+    In-process vector storage for memories that needs no database client.
+
+    Embeddings are appended to a float32 file that is read through ``np.memmap``,
+    so opening a store only maps the file and worker processes share its pages.
+    Documents and metadata live in SQLite, whose write lock also serializes
+    writers across processes. Search is exact (flat) by default; with
+    ``index_type="ivf"`` vectors are bucketed by k-means centroids and only the
+    ``nprobe`` closest buckets are scanned. Scores are squared L2 distances,
+    like Chroma's default space, so thresholds behave the same as in RAGStorage.
+    """
+
+    def __init__(
+        self,
+        type: str,
+        allow_reset: bool = True,
+        embedder_config: Optional[Dict[str, Any]] = None,
+        crew: Any = None,
+        path: Optional[str] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        index_type: str = "flat",
+        nlist: int = DEFAULT_NLIST,
+        nprobe: int = DEFAULT_NPROBE,
+    ):
+        super().__init__(type, allow_reset, embedder_config, crew)
+        if index_type not in ("flat", "ivf"):
+            raise ValueError(f"Unsupported index type: {index_type}")
+
+        self.path = path or self._build_storage_path(type, self.agents)
+        self.batch_size = batch_size
+        self.index_type = index_type
+        self.nlist = nlist
+        self.nprobe = nprobe
+        self._vectors: Optional[np.ndarray] = None
+        self._centroids: Optional[np.ndarray] = None
+        self._initialize_app()
+
+    def _sanitize_role(self, role: str) -> str:
+        """
+        Sanitizes agent roles to ensure valid directory names.
+        """
+        return role.replace("\n", "").replace(" ", "_").replace("/", "_")
+
+    def _build_storage_path(self, type: str, file_name: str) -> str:
+        if len(file_name) > MAX_FILE_NAME_LENGTH:
+            logging.warning(
+                f"Trimming file name from {len(file_name)} to {MAX_FILE_NAME_LENGTH} characters."
+            )
+            file_name = file_name[:MAX_FILE_NAME_LENGTH]
+        return os.path.join(db_storage_path(), f"{type}_mmap", file_name)
+
+    def _initialize_app(self):
+        self.embedder = EmbeddingConfigurator().configure_embedder(self.embedder_config)
+        os.makedirs(self.path, exist_ok=True)
+        self.app = os.path.join(self.path, METADATA_DB)
+        with closing(self._connect()) as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS items (
+                    row INTEGER PRIMARY KEY,
+                    id TEXT NOT NULL,
+                    document TEXT,
+                    metadata TEXT,
+                    list_id INTEGER
+                )
+                """
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_items_list_id ON items (list_id)"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS settings (key TEXT PRIMARY KEY, value TEXT)"
+            )
+            conn.commit()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.app, timeout=30, isolation_level=None)  # type: ignore[arg-type]
+        conn.execute("PRAGMA journal_mode=WAL")
+        return conn
+
+    @property
+    def dimension(self) -> Optional[int]:
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT value FROM settings WHERE key = 'dimension'"
+            ).fetchone()
+        return int(row[0]) if row else None
+
+    def count(self) -> int:
+        with closing(self._connect()) as conn:
+            return conn.execute("SELECT COUNT(*) FROM items").fetchone()[0]
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Returns the number of stored items and their size on disk, with the
+        keys of RAGStorage.stats(). Items are never pruned from this store.
+        """
+        disk_bytes = sum(
+            os.path.getsize(os.path.join(self.path, file))
+            for file in os.listdir(self.path)
+            if os.path.isfile(os.path.join(self.path, file))
+        )
+        return {
+            "items": self.count(),
+            "disk_bytes": disk_bytes,
+            "expired": 0,
+            "evicted": 0,
+        }
+
+    def save(self, value: Any, metadata: Dict[str, Any]) -> None:
+        self.save_many([value], [metadata])
+
+    def save_many(self, values: List[Any], metadatas: List[Dict[str, Any]]) -> None:
+        for start in range(0, len(values), self.batch_size):
+            end = start + self.batch_size
+            try:
+                self._add(values[start:end], metadatas[start:end])
+            except Exception as e:
+                logging.error(f"Error during {self.type} save: {str(e)}")
+        if self.index_type == "ivf":
+            self._maybe_train_ivf()
+
+    def _generate_embedding(self, text: str, metadata: Optional[Dict[str, Any]] = None) -> Any:
+        return self._add([text], [metadata or {}])
+
+    def _add(self, texts: List[str], metadatas: List[Dict[str, Any]]) -> None:
+        if not texts:
+            return
+        vectors = np.asarray(self.embedder(texts), dtype=np.float32)
+
+        conn = self._connect()
+        try:
+            # BEGIN IMMEDIATE takes SQLite's write lock, which also guards the
+            # vector file against concurrent writers in other processes
+            conn.execute("BEGIN IMMEDIATE")
+            dimension = conn.execute(
+                "SELECT value FROM settings WHERE key = 'dimension'"
+            ).fetchone()
+            if dimension is None:
+                conn.execute(
+                    "INSERT INTO settings (key, value) VALUES ('dimension', ?)",
+                    (str(vectors.shape[1]),),
+                )
+            elif int(dimension[0]) != vectors.shape[1]:
+                raise ValueError(
+                    f"Embedding dimension mismatch: store has {dimension[0]}, got {vectors.shape[1]}"
+                )
+
+            first_row = conn.execute(
+                "SELECT COALESCE(MAX(row) + 1, 0) FROM items"
+            ).fetchone()[0]
+            self._write_vectors(first_row, vectors)
+
+            list_ids = self._assign_lists(vectors)
+            conn.executemany(
+                "INSERT INTO items (row, id, document, metadata, list_id) VALUES (?, ?, ?, ?, ?)",
+                [
+                    (
+                        first_row + i,
+                        str(uuid.uuid4()),
+                        text,
+                        json.dumps(metadata or {}),
+                        list_id,
+                    )
+                    for i, (text, metadata, list_id) in enumerate(
+                        zip(texts, metadatas, list_ids)
+                    )
+                ],
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+    def _write_vectors(self, first_row: int, vectors: np.ndarray) -> None:
+        vectors_path = os.path.join(self.path, VECTORS_FILE)
+        mode = "r+b" if os.path.exists(vectors_path) else "w+b"
+        with open(vectors_path, mode) as f:
+            f.seek(first_row * vectors.shape[1] * 4)
+            f.write(vectors.tobytes())
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _load_vectors(self, rows: int, dimension: int) -> np.ndarray:
+        if self._vectors is None or self._vectors.shape != (rows, dimension):
+            self._vectors = np.memmap(
+                os.path.join(self.path, VECTORS_FILE),
+                dtype=np.float32,
+                mode="r",
+                shape=(rows, dimension),
+            )
+        return self._vectors
+
+    def _load_centroids(self) -> Optional[np.ndarray]:
+        centroids_path = os.path.join(self.path, CENTROIDS_FILE)
+        if self._centroids is None and os.path.exists(centroids_path):
+            self._centroids = np.load(centroids_path, mmap_mode="r")
+        return self._centroids
+
+    def _assign_lists(self, vectors: np.ndarray) -> List[Optional[int]]:
+        centroids = self._load_centroids() if self.index_type == "ivf" else None
+        if centroids is None:
+            return [None] * len(vectors)
+        return [int(i) for i in _squared_l2(vectors, centroids).argmin(axis=1)]
+
+    def _maybe_train_ivf(self) -> None:
+        rows = self.count()
+        centroids = self._load_centroids()
+        trained_on = 0 if centroids is None else self._trained_on()
+        if rows < self.nlist * IVF_TRAIN_POINTS_PER_LIST or (
+            trained_on and rows < 2 * trained_on
+        ):
+            return
+        dimension = self.dimension
+        if dimension is None:
+            return
+
+        vectors = np.asarray(self._load_vectors(rows, dimension))
+        centroids = _kmeans(vectors, self.nlist, IVF_TRAIN_ITERATIONS)
+        assignments = _squared_l2(vectors, centroids).argmin(axis=1)
+
+        np.save(os.path.join(self.path, CENTROIDS_FILE), centroids)
+        self._centroids = None
+        # The connection's own context manager rolls back if an update fails
+        with closing(self._connect()) as conn, conn:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.executemany(
+                "UPDATE items SET list_id = ? WHERE row = ?",
+                [(int(list_id), row) for row, list_id in enumerate(assignments)],
+            )
+            conn.execute(
+                "INSERT OR REPLACE INTO settings (key, value) VALUES ('ivf_trained_on', ?)",
+                (str(rows),),
+            )
+            conn.execute("COMMIT")
+
+    def _trained_on(self) -> int:
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT value FROM settings WHERE key = 'ivf_trained_on'"
+            ).fetchone()
+        return int(row[0]) if row else 0
+
+    def search(
+        self,
+        query: str,
+        limit: int = 3,
+        filter: Optional[dict] = None,
+        score_threshold: float = 0.35,
+    ) -> List[Any]:
+        try:
+            rows = self.count()
+            dimension = self.dimension
+            if not rows or dimension is None:
+                return []
+
+            vectors = self._load_vectors(rows, dimension)
+            query_vector = np.asarray(self.embedder([query]), dtype=np.float32)
+
+            candidates = self._candidate_rows(query_vector)
+            if candidates is None:
+                distances = _squared_l2(query_vector, vectors)[0]
+                candidates = np.arange(rows)
+            else:
+                distances = _squared_l2(query_vector, vectors[candidates])[0]
+
+            k = min(limit, len(candidates))
+            if k == 0:
+                return []
+            nearest = np.argpartition(distances, k - 1)[:k]
+            nearest = nearest[np.argsort(distances[nearest])]
+
+            return [
+                result
+                for result in self._fetch_items(
+                    [int(candidates[i]) for i in nearest],
+                    [float(distances[i]) for i in nearest],
+                )
+                if result["score"] >= score_threshold
+            ]
+        except Exception as e:
+            logging.error(f"Error during {self.type} search: {str(e)}")
+            return []
+
+    def _candidate_rows(self, query_vector: np.ndarray) -> Optional[np.ndarray]:
+        if self.index_type != "ivf":
+            return None
+        centroids = self._load_centroids()
+        if centroids is None:
+            return None
+
+        probes = _squared_l2(query_vector, centroids)[0].argsort()[: self.nprobe]
+        with closing(self._connect()) as conn:
+            placeholders = ",".join("?" for _ in probes)
+            rows = conn.execute(
+                f"SELECT row FROM items WHERE list_id IN ({placeholders}) OR list_id IS NULL",  # nosec
+                [int(p) for p in probes],
+            ).fetchall()
+        return np.array([row[0] for row in rows], dtype=np.int64)
+
+    def _fetch_items(self, rows: List[int], scores: List[float]) -> List[Dict[str, Any]]:
+        with closing(self._connect()) as conn:
+            placeholders = ",".join("?" for _ in rows)
+            fetched = {
+                row: (item_id, document, metadata)
+                for row, item_id, document, metadata in conn.execute(
+                    f"SELECT row, id, document, metadata FROM items WHERE row IN ({placeholders})",  # nosec
+                    rows,
+                )
+            }
+        return [
+            {
+                "id": fetched[row][0],
+                "metadata": json.loads(fetched[row][2]),
+                "context": fetched[row][1],
+                "score": score,
+            }
+            for row, score in zip(rows, scores)
+            if row in fetched
+        ]
+
+    def reset(self) -> None:
+        if not self.allow_reset:
+            return
+        self._vectors = None
+        self._centroids = None
+        shutil.rmtree(self.path, ignore_errors=True)
+        self._initialize_app()
+
+
+def _squared_l2(queries: np.ndarray, vectors: np.ndarray) -> np.ndarray:
+    """Squared euclidean distances between every query and every vector."""
+    query_norms = np.einsum("ij,ij->i", queries, queries)[:, None]
+    vector_norms = np.einsum("ij,ij->i", vectors, vectors)[None, :]
+    return np.maximum(query_norms - 2 * queries @ vectors.T + vector_norms, 0.0)
+
+
+def _kmeans(vectors: np.ndarray, k: int, iterations: int) -> np.ndarray:
+    rng = np.random.default_rng(0)
+    centroids = vectors[rng.choice(len(vectors), size=k, replace=False)].copy()
+    for _ in range(iterations):
+        assignments = _squared_l2(vectors, centroids).argmin(axis=1)
+        for i in range(k):
+            members = vectors[assignments == i]
+            if len(members):
+                centroids[i] = members.mean(axis=0)
+    return centroids.astype(np.float32)
@@ -4,15 +4,20 @@ import logging
 import os
 import shutil
 import uuid
+import weakref
 
 from typing import Any, Dict, List, Optional
 from chromadb.api import ClientAPI
+from crewai.memory.retention import CREATED_AT_KEY, MemoryRetentionPolicy
 from crewai.rag.storage.base_rag_storage import BaseRAGStorage
 from crewai.rag.embeddings.configurator import EmbeddingConfigurator
-from crewai.utilities.chromadb import create_persistent_client
+from crewai.rag.embeddings.embedding_cache import embedder_identity
+from crewai.utilities.chromadb import chroma_client_registry
 from crewai.utilities.constants import MAX_FILE_NAME_LENGTH
 from crewai.utilities.paths import db_storage_path
 
+DEFAULT_BATCH_SIZE = 100
+
 
 @contextlib.contextmanager
 def suppress_logging(
@@ -38,9 +43,17 @@ class RAGStorage(BaseRAGStorage):
     """
 
     app: ClientAPI | None = None
+    _release: Optional[weakref.finalize] = None
 
     def __init__(
-        self, type, allow_reset=True, embedder_config=None, crew=None, path=None
+        self,
+        type,
+        allow_reset=True,
+        embedder_config=None,
+        crew=None,
+        path=None,
+        batch_size=DEFAULT_BATCH_SIZE,
+        retention: Optional[MemoryRetentionPolicy | Dict[str, Any]] = None,
     ):
         super().__init__(type, allow_reset, embedder_config, crew)
         agents = crew.agents if crew else []
@@ -53,10 +66,19 @@ class RAGStorage(BaseRAGStorage):
 
         self.allow_reset = allow_reset
         self.path = path
+        self.batch_size = batch_size
+        self.retention = (
+            MemoryRetentionPolicy(**retention)
+            if isinstance(retention, dict)
+            else retention
+        )
+        self._expired_count = 0
+        self._evicted_count = 0
         self._initialize_app()
 
     def _set_embedder_config(self):
         configurator = EmbeddingConfigurator()
+        self._embedder_key = embedder_identity(self.embedder_config)
         self.embedder_config = configurator.configure_embedder(self.embedder_config)
 
     def _initialize_app(self):
@@ -64,16 +86,39 @@ class RAGStorage(BaseRAGStorage):
 
         self._set_embedder_config()
 
-        self.app = create_persistent_client(
-            path=self.path if self.path else self.storage_file_name,
-            settings=Settings(allow_reset=self.allow_reset),
+        self.close()
+        self.app = chroma_client_registry.acquire(
+            self._client_path, settings=Settings(allow_reset=self.allow_reset)
+        )
+        # The reference is also released if the storage is dropped without close()
+        self._release = weakref.finalize(
+            self,
+            chroma_client_registry.release,
+            self._client_path,
+            self.type,
+            self._embedder_key,
         )
 
-        self.collection = self.app.get_or_create_collection(
-            name=self.type, embedding_function=self.embedder_config
+        self.collection = chroma_client_registry.get_or_create_collection(
+            self._client_path,
+            name=self.type,
+            embedding_function=self.embedder_config,
+            embedder_key=self._embedder_key,
         )
         logging.info(f"Collection found or created: {self.collection}")
 
+    @property
+    def _client_path(self) -> str:
+        return self.path if self.path else self.storage_file_name
+
+    def close(self) -> None:
+        """Releases this storage's reference to the shared ChromaDB client."""
+        if self._release is not None:
+            self._release()
+            self._release = None
+        self.app = None
+        self.collection = None
+
     def _sanitize_role(self, role: str) -> str:
         """
         Sanitizes agent roles to ensure valid directory names.
@@ -98,9 +143,69 @@ class RAGStorage(BaseRAGStorage):
         if not hasattr(self, "app") or not hasattr(self, "collection"):
             self._initialize_app()
         try:
+            if self.retention:
+                metadata = self.retention.stamp(metadata)
             self._generate_embedding(value, metadata)
         except Exception as e:
             logging.error(f"Error during {self.type} save: {str(e)}")
+        self._enforce_retention()
+
+    def save_many(self, values: List[Any], metadatas: List[Dict[str, Any]]) -> None:
+        """
+        Saves several values at once. Each batch of ``batch_size`` items costs a
+        single embedding request and a single insert.
+        """
+        if not hasattr(self, "app") or not hasattr(self, "collection"):
+            self._initialize_app()
+        if self.retention:
+            metadatas = [self.retention.stamp(metadata) for metadata in metadatas]
+        for start in range(0, len(values), self.batch_size):
+            end = start + self.batch_size
+            try:
+                self._generate_embeddings(values[start:end], metadatas[start:end])
+            except Exception as e:
+                logging.error(f"Error during {self.type} save: {str(e)}")
+        self._enforce_retention()
+
+    def _enforce_retention(self) -> None:
+        """
+        Deletes expired items, then evicts items per the retention policy if the
+        collection grew past its cap.
+        """
+        if not self.retention:
+            return
+        try:
+            cutoff = self.retention.expiry_cutoff()
+            if cutoff is not None:
+                before = self.collection.count()
+                self.collection.delete(where={CREATED_AT_KEY: {"$lt": cutoff}})
+                self._expired_count += before - self.collection.count()
+
+            if self.retention.needs_pruning(self.collection.count()):
+                stored = self.collection.get(include=["metadatas"])
+                evicted = self.retention.select_evictions(
+                    stored["ids"], stored["metadatas"]
+                )
+                if evicted:
+                    self.collection.delete(ids=evicted)
+                    self._evicted_count += len(evicted)
+        except Exception as e:
+            logging.error(f"Error enforcing {self.type} retention: {str(e)}")
+
+    def stats(self) -> Dict[str, Any]:
+        """Returns the number of stored items, their size on disk and how many were pruned."""
+        path = self.path if self.path else self.storage_file_name
+        disk_bytes = 0
+        for root, _, files in os.walk(path):
+            for file in files:
+                with contextlib.suppress(OSError):
+                    disk_bytes += os.path.getsize(os.path.join(root, file))
+        return {
+            "items": self.collection.count() if getattr(self, "collection", None) else 0,
+            "disk_bytes": disk_bytes,
+            "expired": self._expired_count,
+            "evicted": self._evicted_count,
+        }
 
     def search(
         self,
@@ -127,11 +232,22 @@ class RAGStorage(BaseRAGStorage):
                 if result["score"] >= score_threshold:
                     results.append(result)
 
+            if self.retention and results:
+                self._record_retrievals(results)
             return results
         except Exception as e:
             logging.error(f"Error during {self.type} search: {str(e)}")
             return []
 
+    def _record_retrievals(self, results: List[Dict[str, Any]]) -> None:
+        try:
+            self.collection.update(
+                ids=[result["id"] for result in results],
+                metadatas=[self.retention.touch(result["metadata"]) for result in results],  # type: ignore[union-attr]
+            )
+        except Exception as e:
+            logging.error(f"Error updating {self.type} retrieval stats: {str(e)}")
+
     def _generate_embedding(self, text: str, metadata: Dict[str, Any]) -> None:  # type: ignore
         if not hasattr(self, "app") or not hasattr(self, "collection"):
             self._initialize_app()
@@ -142,13 +258,26 @@ class RAGStorage(BaseRAGStorage):
             ids=[str(uuid.uuid4())],
         )
 
+    def _generate_embeddings(
+        self, texts: List[str], metadatas: List[Dict[str, Any]]
+    ) -> None:
+        self.collection.add(
+            documents=texts,
+            embeddings=self.embedder_config(texts),
+            metadatas=[metadata or None for metadata in metadatas],
+            ids=[str(uuid.uuid4()) for _ in texts],
+        )
+
     def reset(self) -> None:
         try:
             if self.app:
                 self.app.reset()
+                # Other storages may still use the client, so only drop this one's reference
+                chroma_client_registry.forget_collections(self._client_path)
+                self.close()
                 shutil.rmtree(f"{db_storage_path()}/{self.type}")
-                self.app = None
-                self.collection = None
+                self._expired_count = 0
+                self._evicted_count = 0
         except Exception as e:
             if "attempt to write a readonly database" in str(e):
                 # Ignore this specific error
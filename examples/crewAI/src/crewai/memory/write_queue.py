@@ -0,0 +1,185 @@
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from crewai.utilities.printer import Printer
+
+DEFAULT_MAX_QUEUE_SIZE = 1000
+DEFAULT_MAX_BATCH_SIZE = 64
+WORKER_IDLE_TIMEOUT = 1.0
+
+
+class _SaveJob:
+    """A memory item waiting to be written through ``memory.save_many``."""
+
+    def __init__(self, memory: Any, item: Any):
+        self.memory = memory
+        self.item = item
+
+
+class _CallJob:
+    """Arbitrary deferred memory work, such as evaluating a task for long-term memory."""
+
+    def __init__(self, fn: Callable[..., Any], args: Tuple[Any, ...], kwargs: Dict[str, Any]):
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+
+
+class MemoryWriteQueue:
+    """
+    Write-behind queue that persists memories on a background thread so the
+    crew does not wait for embeddings, vector inserts or LLM evaluations
+    before starting the next task.
+
+    Consecutive saves to the same memory are coalesced into one ``save_many``
+    call. The queue is bounded: when it is full, ``submit`` blocks until the
+    worker catches up, and the time spent blocked is reported in ``stats()``.
+    """
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_MAX_QUEUE_SIZE,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+    ):
+        self.max_size = max_size
+        self.max_batch_size = max_batch_size
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=max_size)
+        self._lock = threading.Lock()
+        self._worker: Optional[threading.Thread] = None
+        self._printer = Printer()
+        self._stats: Dict[str, float] = {
+            "submitted": 0,
+            "processed": 0,
+            "failed": 0,
+            "batches": 0,
+            "max_depth": 0,
+            "blocked_submissions": 0,
+            "blocked_time_ms": 0.0,
+        }
+
+    def submit_save(self, memory: Any, item: Any) -> None:
+        """Queues ``item`` to be saved into ``memory``, batched with other saves to it."""
+        self._put(_SaveJob(memory, item))
+
+    def submit(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> None:
+        """Queues an arbitrary call to run on the background worker."""
+        self._put(_CallJob(fn, args, kwargs))
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Blocks until every queued write has been processed.
+
+        Returns:
+            bool: False if the timeout expired before the queue drained.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._queue.all_tasks_done.wait(remaining)
+        return True
+
+    def stats(self) -> Dict[str, float]:
+        """Returns throughput and backpressure counters, plus the current queue depth."""
+        with self._lock:
+            stats = dict(self._stats)
+        stats["depth"] = self._queue.qsize()
+        return stats
+
+    def _put(self, job: Any) -> None:
+        try:
+            self._queue.put_nowait(job)
+        except queue.Full:
+            start_time = time.time()
+            self._ensure_worker()
+            self._queue.put(job)
+            with self._lock:
+                self._stats["blocked_submissions"] += 1
+                self._stats["blocked_time_ms"] += (time.time() - start_time) * 1000
+
+        with self._lock:
+            self._stats["submitted"] += 1
+            self._stats["max_depth"] = max(
+                self._stats["max_depth"], self._queue.qsize()
+            )
+        self._ensure_worker()
+
+    def _ensure_worker(self) -> None:
+        with self._lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(
+                    target=self._run, name="crewai-memory-writer", daemon=True
+                )
+                self._worker.start()
+
+    def _run(self) -> None:
+        while True:
+            try:
+                job = self._queue.get(timeout=WORKER_IDLE_TIMEOUT)
+            except queue.Empty:
+                with self._lock:
+                    if self._queue.empty():
+                        self._worker = None
+                        return
+                continue
+
+            jobs = [job]
+            while len(jobs) < self.max_batch_size:
+                try:
+                    jobs.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            try:
+                self._process(jobs)
+            finally:
+                for _ in jobs:
+                    self._queue.task_done()
+
+    def _process(self, jobs: List[Any]) -> None:
+        pending: Dict[int, Tuple[Any, List[Any]]] = {}
+
+        def write_pending() -> None:
+            for memory, items in pending.values():
+                self._run_job(
+                    len(items),
+                    self._save_items,
+                    memory,
+                    items,
+                )
+            pending.clear()
+
+        for job in jobs:
+            if isinstance(job, _SaveJob):
+                pending.setdefault(id(job.memory), (job.memory, []))[1].append(job.item)
+            else:
+                # Keep ordering between saves and deferred calls
+                write_pending()
+                self._run_job(1, job.fn, *job.args, **job.kwargs)
+        write_pending()
+
+    @staticmethod
+    def _save_items(memory: Any, items: List[Any]) -> None:
+        if hasattr(memory, "save_many"):
+            memory.save_many(items)
+        else:
+            for item in items:
+                memory.save(item)
+
+    def _run_job(self, count: int, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> None:
+        try:
+            fn(*args, **kwargs)
+            with self._lock:
+                self._stats["processed"] += count
+                self._stats["batches"] += 1
+        except Exception as e:
+            with self._lock:
+                self._stats["failed"] += count
+            self._printer.print(
+                content=f"Failed to persist memory in the background: {e}",
+                color="red",
+            )
@@ -4,6 +4,12 @@ from typing import Any, Dict, Optional, cast
 from chromadb import Documents, EmbeddingFunction, Embeddings
 from chromadb.api.types import validate_embedding_function
 
+from crewai.rag.embeddings.embedding_cache import (
+    CachedEmbeddingFunction,
+    disk_embedding_cache,
+    embedder_fingerprint,
+)
+
 
 class EmbeddingConfigurator:
     def __init__(self):
@@ -25,9 +31,15 @@ class EmbeddingConfigurator:
         self,
         embedder_config: Optional[Dict[str, Any]] = None,
     ) -> EmbeddingFunction:
-        """Configures and returns an embedding function based on the provided config."""
+        """Configures and returns an embedding function based on the provided config.
+
+        Unless the config sets ``"cache": False``, the embedding function is
+        wrapped with the process-wide embedding cache. With ``"cache": "disk"``
+        the embeddings of this embedder are cached in a file in the CrewAI
+        storage directory instead, so they survive restarts.
+        """
         if embedder_config is None:
-            return self._create_default_embedding_function()
+            return self._with_cache(self._create_default_embedding_function(), None)
 
         provider = embedder_config.get("provider")
         config = embedder_config.get("config", {})
@@ -46,10 +58,28 @@ class EmbeddingConfigurator:
                 f"{missing_package} is not installed. Please install it with: pip install {missing_package}"
             )
 
-        return (
-            embedding_function(config)
-            if provider == "custom"
-            else embedding_function(config, model_name)
+        return self._with_cache(
+            (
+                embedding_function(config)
+                if provider == "custom"
+                else embedding_function(config, model_name)
+            ),
+            embedder_config,
+        )
+
+    @staticmethod
+    def _with_cache(
+        embedding_function: EmbeddingFunction,
+        embedder_config: Optional[Dict[str, Any]],
+    ) -> EmbeddingFunction:
+        cache = (embedder_config or {}).get("cache", True)
+        if not cache:
+            return embedding_function
+
+        return CachedEmbeddingFunction(
+            embedding_function,
+            embedder_fingerprint(embedder_config),
+            disk_embedding_cache() if cache == "disk" else None,
         )
 
     @staticmethod
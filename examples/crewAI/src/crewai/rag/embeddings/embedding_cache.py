@@ -0,0 +1,337 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import weakref
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+from uuid import uuid4
+
+import numpy as np
+from chromadb import Documents, EmbeddingFunction, Embeddings
+
+from crewai.utilities import Printer
+from crewai.utilities.paths import db_storage_path
+
+DEFAULT_MAX_ENTRIES = 10_000
+
+# Config keys that identify the caller rather than the embedding model, so two
+# embedders that only differ in them produce the same vectors.
+_NON_MODEL_CONFIG_KEYS = {"api_key", "session", "default_headers", "organization_id"}
+
+
+# Random tokens identifying custom embedder instances that describe neither
+# themselves (get_config) nor are named by the user
+_instance_tokens: "weakref.WeakKeyDictionary[Any, str]" = weakref.WeakKeyDictionary()
+
+
+def _describe_object(obj: Any, named: bool) -> Dict[str, Any]:
+    """
+    Describes an object found in an embedder config, such as the embedding
+    function of a custom embedder. The class alone is enough when the user
+    named the embedder; otherwise the instance's get_config() is used, and as
+    a last resort a token unique to the instance.
+    """
+    description: Dict[str, Any] = {
+        "class": f"{type(obj).__module__}.{type(obj).__qualname__}"
+    }
+    if named:
+        return description
+
+    get_config = getattr(type(obj), "get_config", None)
+    if get_config is not None and get_config is not EmbeddingFunction.get_config:
+        try:
+            config = obj.get_config()
+            if isinstance(config, dict):
+                description["config"] = json.loads(
+                    json.dumps(config, sort_keys=True, default=str)
+                )
+                return description
+        except Exception:
+            pass
+
+    try:
+        token = _instance_tokens.get(obj)
+        if token is None:
+            token = _instance_tokens[obj] = uuid4().hex
+    except TypeError:
+        # Neither weak-referenceable nor hashable: never share cache entries
+        token = uuid4().hex
+    description["instance"] = token
+    return description
+
+
+def embedder_fingerprint(embedder_config: Optional[Dict[str, Any]]) -> str:
+    """
+    Returns a stable identifier for the embedding model described by an
+    embedder config. Credentials are left out. Custom embedders are identified
+    by the ``name`` in their config if given, else by their ``get_config()``,
+    else per instance.
+    """
+    if embedder_config is None:
+        embedder_config = {
+            "provider": "openai",
+            "config": {"model": "text-embedding-3-small"},
+        }
+
+    config = {
+        key: value
+        for key, value in (embedder_config.get("config") or {}).items()
+        if key not in _NON_MODEL_CONFIG_KEYS
+    }
+    named = "name" in config
+    payload = json.dumps(
+        {"provider": embedder_config.get("provider"), "config": config},
+        sort_keys=True,
+        default=lambda obj: _describe_object(obj, named),
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def embedder_identity(embedder_config: Optional[Dict[str, Any]]) -> str:
+    """
+    Returns a stable identifier for the embedding function an embedder config
+    builds. Unlike ``embedder_fingerprint``, embedders that only differ in
+    their credentials or caching are told apart.
+    """
+    payload = json.dumps(
+        embedder_config,
+        sort_keys=True,
+        default=lambda obj: _describe_object(obj, named=False),
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class EmbeddingCache:
+    """
+    Thread-safe LRU cache of embeddings keyed by embedder fingerprint and text
+    hash, optionally backed by a SQLite file so entries survive restarts.
+    """
+
+    def __init__(
+        self, max_entries: int = DEFAULT_MAX_ENTRIES, db_path: Optional[str] = None
+    ) -> None:
+        self.max_entries = max_entries
+        self.db_path: Optional[str] = None
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._printer: Printer = Printer()
+        if db_path is not None:
+            self.enable_persistence(db_path)
+
+    @staticmethod
+    def make_key(fingerprint: str, text: str) -> str:
+        text_hash = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        return f"{fingerprint}:{text_hash}"
+
+    def enable_persistence(self, db_path: Optional[str] = None) -> None:
+        """Backs the cache with a SQLite file, by default in the CrewAI storage directory."""
+        if db_path is None:
+            db_path = str(Path(db_storage_path()) / "embedding_cache.db")
+        if self.db_path == db_path:
+            return
+
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        try:
+            with sqlite3.connect(db_path) as conn:
+                conn.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS embeddings (
+                        key TEXT PRIMARY KEY,
+                        vector BLOB
+                    )
+                    """
+                )
+                conn.commit()
+            self.db_path = db_path
+        except sqlite3.Error as e:
+            self._printer.print(
+                content=f"EMBEDDING CACHE ERROR: Could not initialize {db_path}: {e}",
+                color="red",
+            )
+
+    def get_many(self, keys: List[str]) -> Dict[str, np.ndarray]:
+        found: Dict[str, np.ndarray] = {}
+        with self._lock:
+            for key in keys:
+                vector = self._entries.get(key)
+                if vector is not None:
+                    self._entries.move_to_end(key)
+                    found[key] = vector
+
+        missing = [key for key in dict.fromkeys(keys) if key not in found]
+        if missing and self.db_path:
+            from_disk = self._load(missing)
+            if from_disk:
+                self._remember(from_disk)
+                found.update(from_disk)
+
+        hits = sum(1 for key in keys if key in found)
+        with self._lock:
+            self.hits += hits
+            self.misses += len(keys) - hits
+        return found
+
+    def set_many(self, vectors: Dict[str, np.ndarray]) -> None:
+        self._remember(vectors)
+        if self.db_path:
+            self._store(vectors)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+        if self.db_path:
+            try:
+                with sqlite3.connect(self.db_path) as conn:
+                    conn.execute("DELETE FROM embeddings")
+                    conn.commit()
+            except sqlite3.Error as e:
+                self._printer.print(
+                    content=f"EMBEDDING CACHE ERROR: Could not clear {self.db_path}: {e}",
+                    color="red",
+                )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remember(self, vectors: Dict[str, np.ndarray]) -> None:
+        with self._lock:
+            for key, vector in vectors.items():
+                self._entries[key] = vector
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _load(self, keys: List[str]) -> Dict[str, np.ndarray]:
+        try:
+            with sqlite3.connect(self.db_path) as conn:  # type: ignore[arg-type]
+                placeholders = ",".join("?" for _ in keys)
+                rows = conn.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})",  # nosec
+                    keys,
+                ).fetchall()
+        except sqlite3.Error as e:
+            self._printer.print(
+                content=f"EMBEDDING CACHE ERROR: Could not read {self.db_path}: {e}",
+                color="red",
+            )
+            return {}
+        return {key: np.frombuffer(blob, dtype=np.float32) for key, blob in rows}
+
+    def _store(self, vectors: Dict[str, np.ndarray]) -> None:
+        try:
+            with sqlite3.connect(self.db_path) as conn:  # type: ignore[arg-type]
+                conn.executemany(
+                    "INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)",
+                    [(key, vector.tobytes()) for key, vector in vectors.items()],
+                )
+                conn.commit()
+        except sqlite3.Error as e:
+            self._printer.print(
+                content=f"EMBEDDING CACHE ERROR: Could not write {self.db_path}: {e}",
+                color="red",
+            )
+
+
+# Process-wide cache shared by every memory and knowledge storage.
+embedding_cache = EmbeddingCache()
+
+# Disk-backed caches by database path, used by the embedders configured with
+# "cache": "disk" only
+_disk_caches: Dict[str, EmbeddingCache] = {}
+_disk_caches_lock = threading.Lock()
+
+
+def disk_embedding_cache(db_path: Optional[str] = None) -> EmbeddingCache:
+    """
+    Returns the cache persisted in ``db_path``, by default in the CrewAI
+    storage directory, shared by the embedders that opt into disk caching.
+    """
+    if db_path is None:
+        db_path = str(Path(db_storage_path()) / "embedding_cache.db")
+    with _disk_caches_lock:
+        cache = _disk_caches.get(db_path)
+        if cache is None:
+            cache = _disk_caches[db_path] = EmbeddingCache(db_path=db_path)
+        return cache
+
+
+class CachedEmbeddingFunction(EmbeddingFunction[Documents]):
+    """
+    Wraps an embedding function so that texts already embedded by the same
+    model are served from an EmbeddingCache. All cache misses of a call are
+    sent to the wrapped function in a single batch.
+    """
+
+    def __init__(
+        self,
+        embedding_function: EmbeddingFunction,
+        fingerprint: str,
+        cache: Optional[EmbeddingCache] = None,
+    ) -> None:
+        self.embedding_function = embedding_function
+        self.fingerprint = fingerprint
+        self.cache = cache if cache is not None else embedding_cache
+
+    def __call__(self, input: Documents) -> Embeddings:
+        return self._embed(input, self.embedding_function, self.fingerprint)
+
+    def embed_query(self, input: Documents) -> Embeddings:
+        embed_query = getattr(self.embedding_function, "embed_query", None)
+        if embed_query is None or (
+            getattr(type(self.embedding_function), "embed_query", None)
+            is EmbeddingFunction.embed_query
+        ):
+            return self(input)
+        return self._embed(input, embed_query, f"{self.fingerprint}:query")
+
+    def name(self) -> str:  # type: ignore[override]
+        return self.embedding_function.name()
+
+    def get_config(self) -> Dict[str, Any]:
+        return self.embedding_function.get_config()
+
+    def build_from_config(self, config: Dict[str, Any]) -> EmbeddingFunction:  # type: ignore[override]
+        return self.embedding_function.build_from_config(config)
+
+    def is_legacy(self) -> bool:
+        is_legacy = getattr(self.embedding_function, "is_legacy", None)
+        return is_legacy() if is_legacy else True
+
+    def default_space(self):  # type: ignore[no-untyped-def]
+        return self.embedding_function.default_space()
+
+    def supported_spaces(self):  # type: ignore[no-untyped-def]
+        return self.embedding_function.supported_spaces()
+
+    def _embed(
+        self,
+        input: Documents,
+        embed: Callable[[Documents], Embeddings],
+        fingerprint: str,
+    ) -> Embeddings:
+        texts = [input] if isinstance(input, str) else list(input)
+        if not all(isinstance(text, str) for text in texts):
+            return embed(input)
+
+        keys = [EmbeddingCache.make_key(fingerprint, text) for text in texts]
+        vectors = self.cache.get_many(keys)
+
+        missing = {
+            key: text for key, text in zip(keys, texts) if key not in vectors
+        }
+        if missing:
+            embedded = embed(list(missing.values()))
+            fresh = {
+                key: np.asarray(vector, dtype=np.float32)
+                for key, vector in zip(missing.keys(), embedded)
+            }
+            self.cache.set_many(fresh)
+            vectors.update(fresh)
+
+        return [vectors[key] for key in keys]
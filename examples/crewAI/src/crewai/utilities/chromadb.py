@@ -1,8 +1,12 @@
+import atexit
+import os
 import re
+import threading
 import portalocker
-from chromadb import PersistentClient
+from chromadb import Collection, PersistentClient
+from chromadb.api import ClientAPI
 from hashlib import md5
-from typing import Optional
+from typing import Any, Dict, Optional, Tuple
 
 
 MIN_COLLECTION_LENGTH = 3
@@ -77,3 +81,121 @@ def create_persistent_client(path: str, **kwargs):
         client = PersistentClient(path=path, **kwargs)
 
     return client
+
+
+class ChromaClientRegistry:
+    """
+    Hands out one shared ChromaDB client per storage path for the whole process.
+
+    Clients are reference counted: ``acquire`` creates the client on first use
+    (taking the cross-process creation lock only then) and ``release`` closes it
+    once its last user is done. Collection handles are cached per client,
+    collection name and embedder key, so storages with the same embedder
+    config share a handle, while storages with their own embedding function,
+    e.g. other credentials, never get each other's. A storage drops its
+    handle when it releases the client.
+    """
+
+    def __init__(self):
+        # Reentrant, as storages release their reference when garbage collected
+        self._lock = threading.RLock()
+        self._clients: Dict[str, ClientAPI] = {}
+        self._refcounts: Dict[str, int] = {}
+        self._collections: Dict[Tuple[str, str, str], Collection] = {}
+
+    def acquire(self, path: str, **kwargs) -> ClientAPI:
+        """Returns the client for ``path``, creating it if needed, and takes a reference to it."""
+        key = os.path.abspath(path)
+        with self._lock:
+            if key not in self._clients:
+                self._clients[key] = create_persistent_client(path=path, **kwargs)
+                self._refcounts[key] = 0
+            self._refcounts[key] += 1
+            return self._clients[key]
+
+    def release(
+        self,
+        path: str,
+        collection_name: Optional[str] = None,
+        embedder_key: Optional[str] = None,
+    ) -> None:
+        """
+        Drops a reference to the client for ``path`` and closes it if it was
+        the last one. The cached handle of the releasing storage's collection,
+        if given with its embedder key, is dropped too, so it doesn't keep the
+        storage's embedder alive.
+        """
+        key = os.path.abspath(path)
+        with self._lock:
+            if collection_name is not None and embedder_key is not None:
+                self._collections.pop((key, collection_name, embedder_key), None)
+            if key not in self._refcounts:
+                return
+            self._refcounts[key] -= 1
+            if self._refcounts[key] <= 0:
+                self._close(key)
+
+    def forget_collections(self, path: str) -> None:
+        """Drops the cached collection handles of ``path``, e.g. after its client was reset."""
+        key = os.path.abspath(path)
+        with self._lock:
+            self._forget_collections(key)
+
+    def get_or_create_collection(
+        self,
+        path: str,
+        name: str,
+        embedding_function: Any = None,
+        embedder_key: Optional[str] = None,
+    ) -> Collection:
+        """
+        Returns a cached handle to collection ``name`` of the client acquired
+        for ``path``. Handles are only shared between callers passing the same
+        ``embedder_key``, e.g. the ``embedder_identity`` of their config.
+        """
+        key = os.path.abspath(path)
+        # Without a key, handles are only reused for the same embedding function,
+        # which the cached collection keeps alive so its id() stays unique
+        collection_key = (
+            key,
+            name,
+            embedder_key if embedder_key is not None else f"id:{id(embedding_function)}",
+        )
+        with self._lock:
+            collection = self._collections.get(collection_key)
+            if collection is None:
+                client = self._clients.get(key)
+                if client is None:
+                    raise ValueError(f"No ChromaDB client acquired for {path}")
+                collection = client.get_or_create_collection(
+                    name=name, embedding_function=embedding_function
+                )
+                self._collections[collection_key] = collection
+            return collection
+
+    def close_all(self) -> None:
+        with self._lock:
+            for key in list(self._clients):
+                self._close(key)
+
+    def __contains__(self, path: str) -> bool:
+        return os.path.abspath(path) in self._clients
+
+    def _close(self, key: str) -> None:
+        client = self._clients.pop(key, None)
+        self._refcounts.pop(key, None)
+        self._forget_collections(key)
+        close = getattr(client, "close", None)
+        if close is not None:
+            try:
+                close()
+            except Exception:
+                pass
+
+    def _forget_collections(self, key: str) -> None:
+        for collection_key in [k for k in self._collections if k[0] == key]:
+            del self._collections[collection_key]
+
+
+chroma_client_registry = ChromaClientRegistry()
+atexit.register(chroma_client_registry.close_all)
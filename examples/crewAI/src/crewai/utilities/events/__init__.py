@@ -31,7 +31,9 @@ from .flow_events import (
     FlowCreatedEvent,
     FlowStartedEvent,
     FlowFinishedEvent,
+    FlowFailedEvent,
     FlowPlotEvent,
+    FlowMapProgressEvent,
     MethodExecutionStartedEvent,
     MethodExecutionFinishedEvent,
     MethodExecutionFailedEvent,
@@ -87,7 +89,9 @@ __all__ = [
     "FlowCreatedEvent",
     "FlowStartedEvent",
     "FlowFinishedEvent",
+    "FlowFailedEvent",
     "FlowPlotEvent",
+    "FlowMapProgressEvent",
     "MethodExecutionStartedEvent",
     "MethodExecutionFinishedEvent",
     "MethodExecutionFailedEvent",
@@ -51,6 +51,7 @@ from .crew_events import (
 )
 from .flow_events import (
     FlowCreatedEvent,
+    FlowFailedEvent,
     FlowFinishedEvent,
     FlowStartedEvent,
     MethodExecutionFailedEvent,
@@ -94,6 +95,9 @@ class EventListener(BaseEventListener):
             self._telemetry = Telemetry()
             self._telemetry.set_tracer()
             self.execution_spans = {}
+            # Flow trees by flow ID, so events of flows running concurrently
+            # update their own tree
+            self.flow_trees = {}
             self._initialized = True
             self.formatter = ConsoleFormatter(verbose=True)
 
@@ -255,19 +259,38 @@ class EventListener(BaseEventListener):
             self._telemetry.flow_execution_span(
                 event.flow_name, list(source._methods.keys())
             )
-            self.formatter.start_flow(event.flow_name, str(source.flow_id))
+            self.flow_trees[str(source.flow_id)] = self.formatter.start_flow(
+                event.flow_name, str(source.flow_id)
+            )
 
         @crewai_event_bus.on(FlowFinishedEvent)
         def on_flow_finished(source, event: FlowFinishedEvent):
             self.formatter.update_flow_status(
-                self.formatter.current_flow_tree, event.flow_name, source.flow_id
+                self.flow_trees.pop(
+                    str(source.flow_id), self.formatter.current_flow_tree
+                ),
+                event.flow_name,
+                source.flow_id,
+            )
+
+        @crewai_event_bus.on(FlowFailedEvent)
+        def on_flow_failed(source, event: FlowFailedEvent):
+            self.formatter.update_flow_status(
+                self.flow_trees.pop(
+                    str(source.flow_id), self.formatter.current_flow_tree
+                ),
+                event.flow_name,
+                source.flow_id,
+                "failed",
             )
 
         @crewai_event_bus.on(MethodExecutionStartedEvent)
         def on_method_execution_started(source, event: MethodExecutionStartedEvent):
             self.formatter.update_method_status(
                 self.formatter.current_method_branch,
-                self.formatter.current_flow_tree,
+                self.flow_trees.get(
+                    str(source.flow_id), self.formatter.current_flow_tree
+                ),
                 event.method_name,
                 "running",
             )
@@ -276,7 +299,9 @@ class EventListener(BaseEventListener):
         def on_method_execution_finished(source, event: MethodExecutionFinishedEvent):
             self.formatter.update_method_status(
                 self.formatter.current_method_branch,
-                self.formatter.current_flow_tree,
+                self.flow_trees.get(
+                    str(source.flow_id), self.formatter.current_flow_tree
+                ),
                 event.method_name,
                 "completed",
             )
@@ -285,7 +310,9 @@ class EventListener(BaseEventListener):
         def on_method_execution_failed(source, event: MethodExecutionFailedEvent):
             self.formatter.update_method_status(
                 self.formatter.current_method_branch,
-                self.formatter.current_flow_tree,
+                self.flow_trees.get(
+                    str(source.flow_id), self.formatter.current_flow_tree
+                ),
                 event.method_name,
                 "failed",
             )
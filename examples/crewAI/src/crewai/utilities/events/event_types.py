@@ -18,7 +18,9 @@ from .crew_events import (
     CrewTrainStartedEvent,
 )
 from .flow_events import (
+    FlowFailedEvent,
     FlowFinishedEvent,
+    FlowMapProgressEvent,
     FlowStartedEvent,
     MethodExecutionFailedEvent,
     MethodExecutionFinishedEvent,
@@ -56,6 +58,7 @@ from .knowledge_events import (
     KnowledgeQueryCompletedEvent,
     KnowledgeQueryFailedEvent,
     KnowledgeSearchQueryFailedEvent,
+    KnowledgeEmbeddingProgressEvent,
 )
 
 from .memory_events import (
@@ -87,6 +90,8 @@ EventTypes = Union[
     TaskFailedEvent,
     FlowStartedEvent,
     FlowFinishedEvent,
+    FlowFailedEvent,
+    FlowMapProgressEvent,
     MethodExecutionStartedEvent,
     MethodExecutionFinishedEvent,
     MethodExecutionFailedEvent,
@@ -109,6 +114,7 @@ EventTypes = Union[
     KnowledgeQueryCompletedEvent,
     KnowledgeQueryFailedEvent,
     KnowledgeSearchQueryFailedEvent,
+    KnowledgeEmbeddingProgressEvent,
     MemorySaveStartedEvent,
     MemorySaveCompletedEvent,
     MemorySaveFailedEvent,
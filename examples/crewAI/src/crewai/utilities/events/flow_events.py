@@ -1,10 +1,31 @@
-from typing import Any, Dict, Optional, Union
+from typing import Any, Callable, Dict, Optional, Union
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, PrivateAttr, computed_field
 
 from .base_events import BaseEvent
 
 
+class StateSnapshot:
+    """
+    A copy of a flow's state that is only made the first time it is read, so
+    emitting an event whose state no handler looks at costs nothing.
+    """
+
+    def __init__(self, take: Callable[[], Union[Dict[str, Any], BaseModel]]) -> None:
+        self._take: Optional[Callable[[], Union[Dict[str, Any], BaseModel]]] = take
+        self._value: Union[Dict[str, Any], BaseModel, None] = None
+
+    @property
+    def taken(self) -> bool:
+        return self._take is None
+
+    def get(self) -> Union[Dict[str, Any], BaseModel]:
+        if self._take is not None:
+            self._value = self._take()
+            self._take = None
+        return self._value  # type: ignore[return-value]
+
+
 class FlowEvent(BaseEvent):
     """Base class for all flow events"""
 
@@ -27,23 +48,42 @@ class FlowCreatedEvent(FlowEvent):
     type: str = "flow_created"
 
 
-class MethodExecutionStartedEvent(FlowEvent):
+class FlowStateEvent(FlowEvent):
+    """Base class for flow events carrying a snapshot of the flow state"""
+
+    _state: Union[Dict[str, Any], BaseModel, StateSnapshot] = PrivateAttr()
+
+    def __init__(
+        self, state: Union[Dict[str, Any], BaseModel, StateSnapshot], **data: Any
+    ):
+        super().__init__(**data)
+        self._state = state
+
+    @computed_field  # type: ignore[misc]
+    @property
+    def state(self) -> Union[Dict[str, Any], BaseModel]:
+        """The flow state when the event was emitted, copied on first read if lazy."""
+        if isinstance(self._state, StateSnapshot):
+            return self._state.get()
+        return self._state
+
+
+class MethodExecutionStartedEvent(FlowStateEvent):
     """Event emitted when a flow method starts execution"""
 
     flow_name: str
     method_name: str
-    state: Union[Dict[str, Any], BaseModel]
     params: Optional[Dict[str, Any]] = None
     type: str = "method_execution_started"
 
 
-class MethodExecutionFinishedEvent(FlowEvent):
+class MethodExecutionFinishedEvent(FlowStateEvent):
     """Event emitted when a flow method completes execution"""
 
     flow_name: str
     method_name: str
     result: Any = None
-    state: Union[Dict[str, Any], BaseModel]
+    cached: bool = False
     type: str = "method_execution_finished"
 
 
@@ -58,6 +98,18 @@ class MethodExecutionFailedEvent(FlowEvent):
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
 
+class FlowMapProgressEvent(FlowEvent):
+    """Event emitted each time an item of a Flow.map fan-out finishes"""
+
+    flow_name: str
+    map_name: str
+    item_key: str
+    completed: int
+    total: int
+    resumed: bool = False
+    type: str = "flow_map_progress"
+
+
 class FlowFinishedEvent(FlowEvent):
     """Event emitted when a flow completes execution"""
 
@@ -66,6 +118,16 @@ class FlowFinishedEvent(FlowEvent):
     type: str = "flow_finished"
 
 
+class FlowFailedEvent(FlowEvent):
+    """Event emitted when a flow stops because of an error or cancellation"""
+
+    flow_name: str
+    error: BaseException
+    type: str = "flow_failed"
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+
 class FlowPlotEvent(FlowEvent):
     """Event emitted when a flow plot is created"""
 
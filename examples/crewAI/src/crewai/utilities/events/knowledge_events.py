@@ -54,3 +54,12 @@ class KnowledgeSearchQueryFailedEvent(BaseEvent):
     type: str = "knowledge_search_query_failed"
     agent: BaseAgent
     error: str
+
+
+class KnowledgeEmbeddingProgressEvent(BaseEvent):
+    """Event emitted each time a batch of knowledge chunks is embedded and stored."""
+
+    type: str = "knowledge_embedding_progress"
+    collection_name: str
+    embedded: int
+    total: int
@@ -1,4 +1,4 @@
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 from crewai.utilities.events.base_events import BaseEvent
 
@@ -76,3 +76,5 @@ class MemoryRetrievalCompletedEvent(BaseEvent):
     task_id: Optional[str] = None
     memory_content: str
     retrieval_time_ms: float
+    store_retrieval_times_ms: Dict[str, float] = {}
+    timed_out_stores: List[str] = []
@@ -2154,6 +2154,87 @@ def test_get_knowledge_search_query():
         )
 
 
+def test_set_knowledge_is_lazy_and_reused_until_sources_change():
+    from crewai.knowledge.storage.knowledge_storage import KnowledgeStorage
+
+    string_source = StringKnowledgeSource(content="The capital of France is Paris.")
+    agent = Agent(
+        role="Information Agent",
+        goal="Provide information based on knowledge sources",
+        backstory="I have access to knowledge sources",
+        llm=LLM(model="gpt-4o-mini"),
+        knowledge_sources=[string_source],
+    )
+
+    with patch.object(
+        KnowledgeStorage, "initialize_knowledge_storage"
+    ) as mock_initialize, patch.object(
+        Knowledge, "add_sources"
+    ) as mock_add_sources, patch.object(KnowledgeStorage, "close") as mock_close:
+        agent.set_knowledge()
+        knowledge = agent.knowledge
+        agent.set_knowledge()
+
+        assert agent.knowledge is knowledge
+        mock_initialize.assert_not_called()
+        mock_add_sources.assert_not_called()
+        mock_close.assert_not_called()
+
+        agent.knowledge_sources = [
+            StringKnowledgeSource(content="The capital of Spain is Madrid.")
+        ]
+        agent.set_knowledge()
+
+        assert agent.knowledge is not knowledge
+        # The replaced knowledge releases its client
+        mock_close.assert_called_once()
+
+
+def test_knowledge_search_query_is_cached_per_prompt():
+    agent = Agent(
+        role="Information Agent",
+        goal="Provide information based on knowledge sources",
+        backstory="I have access to knowledge sources",
+        llm=LLM(model="gpt-4o-mini"),
+    )
+
+    with patch.object(agent.llm, "call", return_value="Capital of France") as mock_llm_call:
+        first = agent._get_knowledge_search_query("What is the capital of France?")
+        second = agent._get_knowledge_search_query("What is the  capital\nof France? ")
+        agent._get_knowledge_search_query("What is the capital of Spain?")
+
+    assert first == second == "Capital of France"
+    assert mock_llm_call.call_count == 2
+
+
+@pytest.mark.parametrize(
+    "query_rewrite, expected",
+    [
+        ("keywords", "status order SKU-99812"),
+        ("description", "What is the status of order SKU-99812?"),
+    ],
+)
+def test_knowledge_search_query_without_llm(query_rewrite, expected):
+    agent = Agent(
+        role="Information Agent",
+        goal="Provide information based on knowledge sources",
+        backstory="I have access to knowledge sources",
+        llm=LLM(model="gpt-4o-mini"),
+        knowledge_config=KnowledgeConfig(query_rewrite=query_rewrite),
+    )
+    task = Task(
+        description="What is the status of order SKU-99812?",
+        expected_output="The order status.",
+        agent=agent,
+    )
+
+    with patch.object(agent.llm, "call") as mock_llm_call:
+        query = agent._resolve_knowledge_search_query(task, task.prompt())
+
+    assert query == expected
+    mock_llm_call.assert_not_called()
+
+
 @pytest.fixture
 def mock_get_auth_token():
     with patch(
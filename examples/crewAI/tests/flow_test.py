@@ -1,14 +1,28 @@
 """Test Flow creation and execution basic functionality."""
 
 import asyncio
-from datetime import datetime
+import threading
+import time
+from datetime import datetime, timedelta
 
 import pytest
 from pydantic import BaseModel
 
-from crewai.flow.flow import Flow, and_, listen, or_, router, start
+from crewai.flow.flow import (
+    Flow,
+    and_,
+    cached,
+    concurrency,
+    listen,
+    or_,
+    router,
+    start,
+)
+from crewai.flow.persistence import SQLiteFlowPersistence
+from crewai.flow.utils import calculate_node_levels, get_flow_graph
 from crewai.utilities.events import (
     FlowFinishedEvent,
+    FlowMapProgressEvent,
     FlowStartedEvent,
     MethodExecutionFinishedEvent,
     MethodExecutionStartedEvent,
@@ -565,6 +579,72 @@ def test_structured_flow_event_emission():
     assert isinstance(received_events[5].timestamp, datetime)
 
 
+def test_flow_state_snapshots_are_copied_only_when_read():
+    copies = []
+
+    class CountingFlow(Flow):
+        @start()
+        def first(self):
+            self.state["counter"] = 1
+
+        @listen(first)
+        def second(self):
+            self.state["counter"] = 2
+
+        def _copy_state(self):
+            copies.append(self.state["counter"] if "counter" in self.state else 0)
+            return super()._copy_state()
+
+    with crewai_event_bus.scoped_handlers():
+
+        @crewai_event_bus.on(MethodExecutionStartedEvent)
+        def ignore_state(source, event):
+            pass
+
+        CountingFlow().kickoff()
+        assert copies == []
+
+        read_states = []
+
+        @crewai_event_bus.on(MethodExecutionFinishedEvent)
+        def read_state(source, event):
+            read_states.append(event.state)
+
+        CountingFlow().kickoff()
+
+    assert copies == [1, 2]
+    assert [state["counter"] for state in read_states] == [1, 2]
+
+
+def test_flow_shared_state_snapshots():
+    class ListState(BaseModel):
+        items: list = []
+        count: int = 0
+
+    class SharedFlow(Flow[ListState]):
+        state_snapshots = "shared"
+
+        @start()
+        def add(self):
+            self.state.items.append("a")
+            self.state.count = 1
+
+    snapshots = []
+    with crewai_event_bus.scoped_handlers():
+
+        @crewai_event_bus.on(MethodExecutionFinishedEvent)
+        def keep_state(source, event):
+            snapshots.append(event.state)
+
+        flow = SharedFlow()
+        flow.kickoff()
+        flow.state.count = 2
+
+    assert snapshots[0] is not flow.state
+    assert snapshots[0].count == 1
+    assert snapshots[0].items is flow.state.items
+
+
 def test_stateless_flow_event_emission():
     """Test that the correct events are emitted stateless during flow execution
     with all fields validated."""
@@ -656,6 +736,54 @@ def test_flow_plotting():
     assert isinstance(received_events[0].timestamp, datetime)
 
 
+def test_flow_structure_is_analysed_once_per_class():
+    class RetryFlow(Flow):
+        @start()
+        def fetch(self):
+            pass
+
+        @listen(or_(fetch, "retry"))
+        def parse(self):
+            self.crew()
+
+        @router(parse)
+        def check(self):
+            if self.state:
+                return "done"
+            return "retry"
+
+        @listen(and_(fetch, "done"))
+        def report(self):
+            pass
+
+    first, second = RetryFlow(), RetryFlow()
+    graph = get_flow_graph(first)
+    assert get_flow_graph(second) is graph
+    # plot() and the runtime share the trigger index compiled by FlowMeta
+    assert graph.dependents is RetryFlow._dependents
+
+    levels = calculate_node_levels(first)
+    assert levels == {"fetch": 0, "parse": 1, "check": 2, "report": 3}
+    levels["fetch"] = 42  # callers get a copy of the cached levels
+    assert calculate_node_levels(second)["fetch"] == 0
+
+    assert sorted(RetryFlow._router_paths["check"]) == ["done", "retry"]
+    assert graph.is_cycle_edge("parse", "check")
+    assert graph.is_cycle_edge("check", "parse")
+    assert not graph.is_cycle_edge("fetch", "parse")
+    assert not graph.is_cycle_edge("check", "report")
+
+
+def test_node_levels_of_a_long_flow():
+    body = {"step_0": start()(lambda self: None)}
+    for i in range(1, 2000):
+        body[f"step_{i}"] = listen(f"step_{i - 1}")(lambda self: None)
+    LongFlow = type("LongFlow", (Flow,), body)
+
+    levels = calculate_node_levels(LongFlow())
+    assert levels == {f"step_{i}": i for i in range(2000)}
+
+
 def test_multiple_routers_from_same_trigger():
     """Test that multiple routers triggered by the same method all activate their listeners."""
     execution_order = []
@@ -767,3 +895,368 @@ def test_flow_name():
 
     flow = MyFlow()
     assert flow.name == "MyFlow"
+
+
+def test_sync_listeners_run_in_parallel_threads():
+    # Both listeners must be inside the barrier at once, or it times out
+    barrier = threading.Barrier(2, timeout=5)
+
+    class ParallelFlow(Flow):
+        sync_methods = "thread"
+
+        @start()
+        def begin(self):
+            return "go"
+
+        @listen(begin)
+        def branch_a(self):
+            barrier.wait()
+            with self.state_lock:
+                self.state["done"] = self.state.get("done", 0) + 1
+
+        @listen(begin)
+        def branch_b(self):
+            barrier.wait()
+            with self.state_lock:
+                self.state["done"] = self.state.get("done", 0) + 1
+
+        @router(and_(branch_a, branch_b))
+        def route(self):
+            return "finished"
+
+        @listen("finished")
+        def summarize(self):
+            return self.state["done"]
+
+    assert ParallelFlow().kickoff() == 2
+
+
+def test_sync_methods_run_inline_by_default():
+    threads = set()
+
+    class InlineFlow(Flow):
+        @start()
+        def first(self):
+            threads.add(threading.current_thread())
+
+        @start()
+        def second(self):
+            threads.add(threading.current_thread())
+
+        @listen(first)
+        @concurrency(run="thread")
+        def threaded(self):
+            return threading.current_thread()
+
+    assert InlineFlow().kickoff() is not threading.main_thread()
+    assert threads == {threading.main_thread()}
+
+
+def test_concurrency_limit_and_inline_methods():
+    running = []
+    peak = []
+    threads = set()
+
+    class LimitedFlow(Flow):
+        sync_methods = "thread"
+
+        @start()
+        def first(self):
+            return "first"
+
+        @start()
+        def second(self):
+            return "second"
+
+        # Triggered by both starts at once, but only runs one at a time
+        @listen(or_(first, second))
+        @concurrency(limit=1)
+        def fetch(self):
+            running.append(1)
+            peak.append(len(running))
+            time.sleep(0.05)
+            running.pop()
+
+        @listen(first)
+        @concurrency(run="inline")
+        def on_loop(self):
+            threads.add(threading.current_thread())
+
+    LimitedFlow().kickoff()
+
+    assert peak == [1, 1]
+    assert threads == {threading.main_thread()}
+
+    with pytest.raises(ValueError):
+        concurrency(limit=0)
+
+
+def test_triggered_methods_are_resolved_through_the_trigger_index():
+    class IndexedFlow(Flow):
+        @start()
+        def fetch(self):
+            pass
+
+        @start()
+        def parse(self):
+            pass
+
+        @listen(or_(fetch, fetch, parse))
+        def log(self):
+            pass
+
+        @listen(and_(fetch, parse))
+        def merge(self):
+            pass
+
+        @router(merge)
+        def check(self):
+            return "done"
+
+        @listen("done")
+        def finish(self):
+            pass
+
+    assert IndexedFlow._listener_triggers == {
+        "fetch": ["log", "merge"],
+        "parse": ["log", "merge"],
+        "done": ["finish"],
+    }
+    assert IndexedFlow._router_triggers == {"merge": ["check"]}
+    assert IndexedFlow._dependents == {
+        "fetch": ["log", "merge"],
+        "parse": ["log", "merge"],
+        "merge": ["check"],
+        "done": ["finish"],
+    }
+
+    flow = IndexedFlow()
+    assert flow._find_triggered_methods("fetch", router_only=False) == ["log"]
+    assert flow._find_triggered_methods("unknown", router_only=False) == []
+
+    # AND conditions left over from before the run do not fire merge early
+    flow._pending_and_listeners["merge"] = set()
+    flow.kickoff()
+    assert flow._pending_and_listeners == {}
+    assert flow.method_outputs[-1] is None
+    assert flow._method_execution_counts["finish"] == 1
+
+
+def test_flow_map_bounds_concurrency_and_streams_results():
+    running = []
+    peak = []
+    progress = []
+
+    class FanOutFlow(Flow):
+        @start()
+        async def score(self):
+            self.state["scores"] = []
+
+            async def score_one(item):
+                running.append(item)
+                peak.append(len(running))
+                await asyncio.sleep(0.01 * (item % 3))
+                running.remove(item)
+                return item * 10
+
+            return await self.map(
+                range(10),
+                score_one,
+                max_concurrency=3,
+                on_result=lambda item, score: self.state["scores"].append(score),
+            )
+
+    with crewai_event_bus.scoped_handlers():
+
+        @crewai_event_bus.on(FlowMapProgressEvent)
+        def handle(source, event):
+            progress.append((event.map_name, event.completed, event.total))
+
+        flow = FanOutFlow()
+        results = flow.kickoff()
+
+    assert results == [item * 10 for item in range(10)]
+    assert max(peak) == 3
+    assert sorted(flow.state["scores"]) == results
+    assert progress[-1] == ("score_one", 10, 10)
+    assert [completed for _, completed, _ in progress] == list(range(1, 11))
+
+
+def test_flow_map_resumes_unfinished_items(tmp_path):
+    persistence = SQLiteFlowPersistence(str(tmp_path / "flows.db"))
+    calls = []
+
+    class ResumableFlow(Flow):
+        fail_on = "c"
+
+        @start()
+        async def translate(self):
+            self.state["done"] = []
+
+            def translate_one(word):
+                calls.append(word)
+                if word == self.fail_on:
+                    raise RuntimeError(f"failed on {word}")
+                return word.upper()
+
+            return await self.map(
+                ["a", "b", "c", "d"],
+                translate_one,
+                max_concurrency=1,
+                on_result=lambda word, result: self.state["done"].append(result),
+                key=lambda word: word,
+            )
+
+    with pytest.raises(RuntimeError):
+        ResumableFlow(persistence=persistence).kickoff(inputs={"id": "run-1"})
+    assert persistence.load_progress("run-1", "translate_one") == {"a": "A", "b": "B"}
+
+    calls.clear()
+    flow = ResumableFlow(persistence=persistence)
+    flow.fail_on = None
+    assert flow.kickoff(inputs={"id": "run-1"}) == ["A", "B", "C", "D"]
+    assert calls == ["c", "d"]
+    assert flow.state["done"] == ["A", "B", "C", "D"]
+    assert persistence.load_progress("run-1", "translate_one") == {}
+
+
+
+def test_cached_methods_reuse_results_of_unchanged_inputs(tmp_path):
+    persistence = SQLiteFlowPersistence(str(tmp_path / "flows.db"))
+    calls = []
+    finished = []
+
+    class BookState(BaseModel):
+        topic: str = ""
+        goal: str = ""
+        reviewer: str = ""
+        outline: list[str] = []
+        chapters: int = 0
+
+    class BookFlow(Flow[BookState]):
+        @start()
+        @cached(keys=["topic", "goal"])
+        def generate_book_outline(self):
+            calls.append("outline")
+            self.state.outline = [f"{self.state.topic}: part {i}" for i in range(3)]
+            return len(self.state.outline)
+
+        @listen(generate_book_outline)
+        @cached(keys=["outline"])
+        def write_chapters(self, parts):
+            calls.append("chapters")
+            self.state.chapters = parts
+            return f"{parts} chapters"
+
+        @listen(write_chapters)
+        def review(self, summary):
+            calls.append("review")
+            return f"{self.state.reviewer} reviewed {summary}"
+
+    with crewai_event_bus.scoped_handlers():
+
+        @crewai_event_bus.on(MethodExecutionFinishedEvent)
+        def on_finished(source, event):
+            finished.append((event.method_name, event.cached))
+
+        inputs = {"topic": "AI", "goal": "intro", "reviewer": "Ann"}
+        assert BookFlow(persistence=persistence).kickoff(inputs) == "Ann reviewed 3 chapters"
+        assert calls == ["outline", "chapters", "review"]
+        assert ("write_chapters", False) in finished
+
+        # Fields the cached methods don't depend on can change
+        calls.clear()
+        finished.clear()
+        flow = BookFlow(persistence=persistence)
+        inputs["reviewer"] = "Bob"
+        assert flow.kickoff(inputs) == "Bob reviewed 3 chapters"
+        assert calls == ["review"]
+        assert flow.state.outline == ["AI: part 0", "AI: part 1", "AI: part 2"]
+        assert flow.state.chapters == 3
+        assert ("generate_book_outline", True) in finished
+        assert ("write_chapters", True) in finished
+
+    calls.clear()
+    inputs["topic"] = "Robots"
+    assert BookFlow(persistence=persistence).kickoff(inputs) == "Bob reviewed 3 chapters"
+    assert calls == ["outline", "chapters", "review"]
+
+    # Without a persistence backend the methods always run
+    calls.clear()
+    BookFlow().kickoff(inputs)
+    assert calls == ["outline", "chapters", "review"]
+
+    with pytest.raises(ValueError):
+        cached(keys="topic")
+
+
+def test_cached_results_are_invalidated_by_code_and_version(tmp_path):
+    persistence = SQLiteFlowPersistence(str(tmp_path / "flows.db"))
+    calls = []
+
+    class DraftFlow(Flow):
+        @start()
+        @cached()
+        def draft(self):
+            calls.append("v1")
+            return "v1"
+
+    class EditedFlow(Flow):
+        @start()
+        @cached()
+        def draft(self):
+            calls.append("v2")
+            return "v2"
+
+    class VersionedFlow(Flow):
+        @start()
+        @cached(version="2")
+        def draft(self):
+            calls.append("v1")
+            return "v1"
+
+    # The same method, edited
+    EditedFlow.__qualname__ = VersionedFlow.__qualname__ = DraftFlow.__qualname__
+
+    for flow_class in [DraftFlow, EditedFlow, VersionedFlow, DraftFlow]:
+        flow_class(persistence=persistence).kickoff()
+    assert calls == ["v1", "v2", "v1"]
+
+    persistence.clear_cached_results(older_than=timedelta(hours=1))
+    persistence.clear_cached_results(method_name="other")
+    DraftFlow(persistence=persistence).kickoff()
+    assert calls == ["v1", "v2", "v1"]
+
+    persistence.clear_cached_results(method_name="draft")
+    DraftFlow(persistence=persistence).kickoff()
+    assert calls == ["v1", "v2", "v1", "v1"]
+
+
+def test_cached_methods_running_alongside_others_are_not_recorded(tmp_path):
+    persistence = SQLiteFlowPersistence(str(tmp_path / "flows.db"))
+    calls = []
+
+    class BranchFlow(Flow):
+        @start()
+        def begin(self):
+            return "go"
+
+        @listen(begin)
+        @cached(keys=[])
+        async def summarize(self):
+            calls.append("summarize")
+            await asyncio.sleep(0.05)
+            self.state["summary"] = "short"
+
+        @listen(begin)
+        async def count(self):
+            await asyncio.sleep(0.02)
+            self.state["count"] = 1
+
+    for _ in range(2):
+        flow = BranchFlow(persistence=persistence)
+        flow.kickoff()
+        assert flow.state["summary"] == "short"
+
+    # A recorded patch would also have set "count", which summarize doesn't do
+    assert calls == ["summarize", "summarize"]
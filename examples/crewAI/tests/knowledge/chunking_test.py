@@ -0,0 +1,139 @@
+import pytest
+
+from crewai.knowledge.source.string_knowledge_source import StringKnowledgeSource
+from crewai.knowledge.utils.chunking import TextChunker
+
+
+def words(text):
+    return len(text.split())
+
+
+def test_character_chunks_keep_fixed_windows():
+    text = "abcdefghijklmnopqrstuvwxyz"
+
+    chunks = TextChunker(chunk_size=10, chunk_overlap=2).split(text)
+
+    assert [chunk.text for chunk in chunks] == [
+        "abcdefghij",
+        "ijklmnopqr",
+        "qrstuvwxyz",
+        "yz",
+    ]
+    assert [(chunk.start, chunk.end) for chunk in chunks] == [
+        (0, 10),
+        (8, 18),
+        (16, 26),
+        (24, 26),
+    ]
+
+
+def test_sentence_chunks_never_cut_a_sentence():
+    text = "One two three. Four five six. Seven eight. Nine ten eleven twelve."
+
+    chunks = TextChunker(
+        chunk_size=6, chunk_overlap=2, boundary="sentence", length_function=words
+    ).split(text)
+
+    assert [chunk.text for chunk in chunks] == [
+        "One two three. Four five six.",
+        "Seven eight. Nine ten eleven twelve.",
+    ]
+    assert all(text[chunk.start : chunk.end] == chunk.text for chunk in chunks)
+
+
+def test_overlap_repeats_whole_trailing_sentences():
+    text = "A b. C d. E f."
+
+    chunks = TextChunker(
+        chunk_size=4, chunk_overlap=2, boundary="sentence", length_function=words
+    ).split(text)
+
+    assert [chunk.text for chunk in chunks] == ["A b. C d.", "C d. E f."]
+
+
+def test_markdown_chunks_start_at_headings():
+    text = "# Intro\nHello there.\n\n## Usage\nRun it.\n## Notes\nNone."
+
+    chunks = TextChunker(chunk_size=500, chunk_overlap=0, boundary="markdown").split(
+        text
+    )
+
+    assert [chunk.text for chunk in chunks] == [
+        "# Intro\nHello there.",
+        "## Usage\nRun it.",
+        "## Notes\nNone.",
+    ]
+
+
+def test_oversized_paragraphs_fall_back_to_words():
+    text = "short paragraph\n\n" + " ".join(f"w{i}" for i in range(10))
+
+    chunks = TextChunker(
+        chunk_size=4, chunk_overlap=0, boundary="paragraph", length_function=words
+    ).split(text)
+
+    assert [chunk.text for chunk in chunks] == [
+        "short paragraph",
+        "w0 w1 w2 w3",
+        "w4 w5 w6 w7",
+        "w8 w9",
+    ]
+
+
+def test_streamed_pieces_give_the_same_chunks():
+    text = "First paragraph here.\n\nSecond one. It has two sentences.\n\nThird."
+    chunker = TextChunker(chunk_size=30, chunk_overlap=10, boundary="sentence")
+
+    whole = chunker.split(text)
+    streamed = list(chunker.iter_chunks(text[i : i + 7] for i in range(0, len(text), 7)))
+
+    assert streamed == whole
+
+
+@pytest.mark.parametrize("boundary", ["character", "sentence", "paragraph", "markdown"])
+@pytest.mark.parametrize("piece_size", [1, 2, 5])
+def test_separators_split_across_pieces_give_the_same_chunks(boundary, piece_size):
+    text = (
+        "# Title\nIntro line. Next one!\n \n## Part\nBody text?  More.\n\n"
+        "###### Deep\nEnd.\n\n\n#Not a heading\n" * 3
+    )
+    chunker = TextChunker(chunk_size=40, chunk_overlap=10, boundary=boundary)
+
+    whole = chunker.split(text)
+    streamed = list(
+        chunker.iter_chunks(
+            text[i : i + piece_size] for i in range(0, len(text), piece_size)
+        )
+    )
+
+    assert streamed == whole
+    assert all(text[chunk.start : chunk.end] == chunk.text for chunk in whole)
+
+
+def test_overlap_must_be_smaller_than_chunk():
+    with pytest.raises(ValueError):
+        TextChunker(chunk_size=10, chunk_overlap=10)
+
+
+def test_sources_save_chunk_offsets():
+    saved = {}
+
+    class Storage:
+        def save(self, documents, metadata=None):
+            saved["documents"] = documents
+            saved["metadata"] = metadata
+
+    source = StringKnowledgeSource(
+        content="Alpha beta. Gamma delta.",
+        chunk_size=12,
+        chunk_overlap=0,
+        chunk_boundary="sentence",
+    )
+    source.storage = Storage()
+    source.add()
+
+    assert saved["documents"] == ["Alpha beta.", "Gamma delta."]
+    assert saved["metadata"] == [
+        {"chunk_start": 0, "chunk_end": 11},
+        {"chunk_start": 12, "chunk_end": 24},
+    ]
@@ -0,0 +1,67 @@
+import copy
+import pickle
+
+import numpy as np
+import pytest
+
+from crewai.knowledge.source.string_knowledge_source import StringKnowledgeSource
+from crewai.knowledge.utils.embedding_matrix import EmbeddingMatrix
+
+
+def test_rows_are_stored_contiguously_as_float32():
+    matrix = EmbeddingMatrix([[1, 0, 0], [0, 1, 0]])
+    for i in range(40):
+        matrix.append(np.full(3, i, dtype=np.float64))
+
+    assert len(matrix) == 42
+    assert matrix.array.dtype == np.float32
+    assert matrix.array.flags["C_CONTIGUOUS"]
+    np.testing.assert_array_equal(matrix[41], [39, 39, 39])
+
+    with pytest.raises(ValueError):
+        matrix.append([1, 2])
+
+
+def test_similarity_helpers():
+    matrix = EmbeddingMatrix([[1, 0], [0, 1], [1, 1], [0, 0]])
+
+    similarities = matrix.cosine_similarity([[2, 0], [0, 3]])
+    np.testing.assert_allclose(
+        similarities,
+        [[1, 0, np.sqrt(0.5), 0], [0, 1, np.sqrt(0.5), 0]],
+        rtol=1e-6,
+    )
+
+    indices, scores = matrix.top_k([1, 0.2], k=2)
+    assert indices.tolist() == [0, 2]
+    assert scores[0] > scores[1]
+    assert EmbeddingMatrix().top_k([1, 0])[0].size == 0
+
+
+def test_saved_matrix_is_shared_through_its_file(tmp_path):
+    path = str(tmp_path / "embeddings.npy")
+    matrix = EmbeddingMatrix(np.ones((1000, 64)))
+    matrix.save(path)
+
+    payload = pickle.dumps(matrix)
+    assert len(payload) < 1000  # only the path travels, not the 256 KB of vectors
+
+    reopened = pickle.loads(payload)
+    assert reopened == matrix
+    assert copy.deepcopy(matrix).path == matrix.path
+
+    # Appending to a mapped matrix copies it instead of writing to the file
+    reopened.append(np.zeros(64))
+    assert reopened.path is None
+    assert len(EmbeddingMatrix.load(path)) == 1000
+
+
+def test_knowledge_sources_keep_embeddings_in_a_matrix():
+    source = StringKnowledgeSource(
+        content="Brandon's favorite color is red.",
+        chunk_embeddings=[np.array([0.1, 0.2]), np.array([0.3, 0.4])],
+    )
+
+    assert isinstance(source.chunk_embeddings, EmbeddingMatrix)
+    assert len(source.get_embeddings()) == 2
+    assert "chunk_embeddings" not in source.model_dump()
@@ -0,0 +1,110 @@
+import numpy as np
+import pytest
+from chromadb import Documents, EmbeddingFunction, Embeddings
+
+from crewai.knowledge.storage.knowledge_storage import KnowledgeStorage, document_id
+from crewai.knowledge.storage.lexical_index import (
+    LexicalIndex,
+    reciprocal_rank_fusion,
+    tokenize,
+)
+
+
+class LengthEmbeddingFunction(EmbeddingFunction):
+    """Embeds texts by their length, so vector search only finds similarly long texts."""
+
+    def __call__(self, input: Documents) -> Embeddings:
+        return [np.array([len(text), 1, 1, 1], dtype=np.float32) for text in input]
+
+
+@pytest.fixture(autouse=True)
+def storage_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        "crewai.knowledge.storage.knowledge_storage.db_storage_path",
+        lambda: str(tmp_path),
+    )
+
+
+@pytest.fixture
+def storage():
+    storage = KnowledgeStorage(
+        embedder={
+            "provider": "custom",
+            "config": {"embedder": LengthEmbeddingFunction()},
+            "cache": False,
+        },
+        collection_name="hybrid",
+    )
+    storage.initialize_knowledge_storage()
+    storage.save(
+        [
+            "Shipping takes a week.",
+            "Returns are accepted.",
+            "Part SKU-99812 is the replacement filter for the X200 vacuum cleaner.",
+        ]
+    )
+    return storage
+
+
+def test_tokenize_keeps_identifiers_and_their_parts():
+    assert tokenize("Order SKU-99812, error E_TIMEOUT.") == [
+        "order",
+        "sku-99812",
+        "sku",
+        "99812",
+        "error",
+        "e_timeout",
+        "e",
+        "timeout",
+    ]
+
+
+def test_reciprocal_rank_fusion_rewards_agreement():
+    fused = reciprocal_rank_fusion([["a", "b", "c"], ["c", "b"]], k=1)
+
+    assert [item_id for item_id, _ in fused] == ["c", "b", "a"]
+    assert fused[0][1] == pytest.approx(1 / 4 + 1 / 2)
+
+
+def test_lexical_index_ranks_by_bm25_and_deletes(tmp_path):
+    index = LexicalIndex(str(tmp_path / "lexical.db"))
+    index.add("docs", ["1", "2", "3"], ["apple pie", "apple apple tart", "cherry pie"])
+
+    assert [doc_id for doc_id, _ in index.search("docs", "apple")] == ["2", "1"]
+    assert index.search("docs", "pie", limit=1)[0][0] in {"1", "3"}
+    assert index.search("other", "apple") == []
+
+    index.delete("docs", ["2"])
+
+    assert [doc_id for doc_id, _ in index.search("docs", "apple")] == ["1"]
+    assert index.count("docs") == 2
+
+
+def test_hybrid_search_finds_exact_identifiers(storage):
+    sku = "Part SKU-99812 is the replacement filter for the X200 vacuum cleaner."
+
+    vector = storage.search(["SKU-99812"], limit=1, score_threshold=0)
+    hybrid = storage.search(["SKU-99812"], limit=1, search_mode="hybrid")
+
+    assert vector[0]["context"] != sku
+    assert hybrid[0]["context"] == sku
+    assert hybrid[0]["id"] == document_id(sku)
+
+
+def test_hybrid_search_rebuilds_a_missing_index(storage):
+    storage.lexical_index.clear(storage.collection_key)
+
+    results = storage.search(["X200"], limit=1, search_mode="hybrid")
+
+    assert "X200" in results[0]["context"]
+    assert storage.lexical_index.count(storage.collection_key) == 3
+
+
+def test_deleted_documents_leave_the_index(storage):
+    sku = "Part SKU-99812 is the replacement filter for the X200 vacuum cleaner."
+
+    storage.delete_documents([document_id(sku)])
+
+    assert storage.lexical_index.search(storage.collection_key, "SKU-99812") == []
+    results = storage.search(["SKU-99812"], limit=3, search_mode="hybrid")
+    assert sku not in [result["context"] for result in results]
@@ -0,0 +1,174 @@
+import numpy as np
+import pytest
+from chromadb import Documents, EmbeddingFunction, Embeddings
+
+from crewai.knowledge.knowledge import Knowledge
+from crewai.knowledge.source.base_file_knowledge_source import BaseFileKnowledgeSource
+from crewai.knowledge.source.string_knowledge_source import StringKnowledgeSource
+from crewai.knowledge.source.text_file_knowledge_source import TextFileKnowledgeSource
+
+
+class CountingEmbeddingFunction(EmbeddingFunction):
+    def __init__(self, dimensions=4):
+        self.dimensions = dimensions
+        self.embedded = []
+
+    def __call__(self, input: Documents) -> Embeddings:
+        self.embedded.extend(input)
+        return [np.full(self.dimensions, len(text), dtype=np.float32) for text in input]
+
+
+@pytest.fixture(autouse=True)
+def storage_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        "crewai.knowledge.storage.knowledge_storage.db_storage_path",
+        lambda: str(tmp_path / "storage"),
+    )
+    return tmp_path
+
+
+def build_knowledge(sources, embedder):
+    knowledge = Knowledge(
+        collection_name="manifest",
+        sources=sources,
+        embedder={
+            "provider": "custom",
+            "config": {"embedder": embedder},
+            "cache": False,
+        },
+    )
+    knowledge.add_sources()
+    return knowledge
+
+
+def stored_documents(knowledge):
+    return sorted(knowledge.storage.collection.get()["documents"])
+
+
+def test_unchanged_sources_are_not_embedded_again():
+    embedder = CountingEmbeddingFunction()
+    build_knowledge([StringKnowledgeSource(content="alpha")], embedder)
+
+    knowledge = build_knowledge([StringKnowledgeSource(content="alpha")], embedder)
+
+    assert embedder.embedded == ["alpha"]
+    assert stored_documents(knowledge) == ["alpha"]
+
+
+def test_removed_sources_are_deleted():
+    embedder = CountingEmbeddingFunction()
+    build_knowledge(
+        [StringKnowledgeSource(content="alpha"), StringKnowledgeSource(content="beta")],
+        embedder,
+    )
+
+    knowledge = build_knowledge([StringKnowledgeSource(content="beta")], embedder)
+
+    assert stored_documents(knowledge) == ["beta"]
+
+
+def test_changed_files_replace_their_chunks(storage_dir):
+    embedder = CountingEmbeddingFunction()
+    path = storage_dir / "notes.txt"
+    path.write_text("first draft")
+    build_knowledge([TextFileKnowledgeSource(file_paths=[path])], embedder)
+
+    path.write_text("second draft, longer")
+    knowledge = build_knowledge([TextFileKnowledgeSource(file_paths=[path])], embedder)
+
+    assert stored_documents(knowledge) == ["second draft, longer"]
+    assert embedder.embedded == ["first draft", "second draft, longer"]
+
+
+def test_changed_chunk_settings_replace_the_chunks(storage_dir):
+    embedder = CountingEmbeddingFunction()
+    path = storage_dir / "notes.txt"
+    path.write_text("abcdefghij")
+    build_knowledge(
+        [TextFileKnowledgeSource(file_paths=[path], chunk_size=20, chunk_overlap=0)],
+        embedder,
+    )
+
+    knowledge = build_knowledge(
+        [TextFileKnowledgeSource(file_paths=[path], chunk_size=5, chunk_overlap=0)],
+        embedder,
+    )
+
+    assert stored_documents(knowledge) == ["abcde", "fghij"]
+
+
+def test_unchanged_files_are_not_parsed_again(storage_dir, monkeypatch):
+    embedder = CountingEmbeddingFunction()
+    path = storage_dir / "notes.txt"
+    path.write_text("first draft")
+    build_knowledge([TextFileKnowledgeSource(file_paths=[path])], embedder)
+
+    loaded = []
+    load_content = TextFileKnowledgeSource.load_content
+
+    def counting_load_content(self):
+        loaded.append(self)
+        return load_content(self)
+
+    monkeypatch.setattr(TextFileKnowledgeSource, "load_content", counting_load_content)
+    source = TextFileKnowledgeSource(file_paths=[path])
+    assert source.content == {}
+    build_knowledge([source], embedder)
+
+    assert loaded == []
+    assert embedder.embedded == ["first draft"]
+
+
+def test_custom_file_sources_still_load_at_construction(storage_dir):
+    class NotesSource(BaseFileKnowledgeSource):
+        def load_content(self):
+            return {path: path.read_text() for path in self.safe_file_paths}
+
+        def add(self):
+            for path, text in self.content.items():
+                self._add_chunks(text, source=path)
+            self._save_documents()
+
+    path = storage_dir / "notes.txt"
+    path.write_text("custom notes")
+    source = NotesSource(file_paths=[path])
+    assert source.content == {path: "custom notes"}
+
+    knowledge = build_knowledge([source], CountingEmbeddingFunction())
+
+    assert stored_documents(knowledge) == ["custom notes"]
+
+
+def test_new_embedder_reingests_everything():
+    build_knowledge([StringKnowledgeSource(content="alpha")], CountingEmbeddingFunction())
+
+    class OtherEmbeddingFunction(CountingEmbeddingFunction):
+        pass
+
+    other = OtherEmbeddingFunction()
+    knowledge = build_knowledge([StringKnowledgeSource(content="alpha")], other)
+
+    assert other.embedded == ["alpha"]
+    assert stored_documents(knowledge) == ["alpha"]
+
+
+def test_sources_are_ingested_on_first_query():
+    embedder = CountingEmbeddingFunction()
+    knowledge = Knowledge(
+        collection_name="manifest",
+        sources=[StringKnowledgeSource(content="alpha")],
+        embedder={
+            "provider": "custom",
+            "config": {"embedder": embedder},
+            "cache": False,
+        },
+    )
+
+    assert knowledge.storage.collection is None
+    assert embedder.embedded == []
+
+    knowledge.query(["alpha"], score_threshold=0)
+    knowledge.query(["alpha"], score_threshold=0)
+
+    assert stored_documents(knowledge) == ["alpha"]
+    assert embedder.embedded == ["alpha", "alpha", "alpha"]  # the chunk, then each query
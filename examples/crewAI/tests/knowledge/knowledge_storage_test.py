@@ -0,0 +1,106 @@
+import threading
+
+import numpy as np
+import pytest
+from chromadb import Documents, EmbeddingFunction, Embeddings
+
+from crewai.knowledge.storage.knowledge_storage import KnowledgeStorage
+from crewai.utilities.events.crewai_event_bus import crewai_event_bus
+from crewai.utilities.events.knowledge_events import KnowledgeEmbeddingProgressEvent
+
+
+class FlakyEmbeddingFunction(EmbeddingFunction):
+    def __init__(self, failures=0):
+        self.failures = failures
+        self.batches = []
+        self.lock = threading.Lock()
+
+    def __call__(self, input: Documents) -> Embeddings:
+        with self.lock:
+            if self.failures:
+                self.failures -= 1
+                raise RuntimeError("rate limited")
+            self.batches.append(list(input))
+        return [np.full(4, len(text), dtype=np.float32) for text in input]
+
+
+@pytest.fixture(autouse=True)
+def storage_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        "crewai.knowledge.storage.knowledge_storage.db_storage_path",
+        lambda: str(tmp_path),
+    )
+    monkeypatch.setattr(
+        "crewai.knowledge.storage.knowledge_storage.EMBEDDING_RETRY_BACKOFF", 0
+    )
+
+
+def make_storage(embedder, **kwargs):
+    storage = KnowledgeStorage(
+        embedder={
+            "provider": "custom",
+            "config": {"embedder": embedder},
+            "cache": False,
+        },
+        collection_name="batching",
+        **kwargs,
+    )
+    storage.initialize_knowledge_storage()
+    return storage
+
+
+def test_save_embeds_in_batches_and_reports_progress():
+    embedder = FlakyEmbeddingFunction()
+    storage = make_storage(embedder, embedding_batch_size=2, embedding_concurrency=2)
+    progress = []
+
+    with crewai_event_bus.scoped_handlers():
+
+        @crewai_event_bus.on(KnowledgeEmbeddingProgressEvent)
+        def on_progress(source, event):
+            progress.append((event.embedded, event.total))
+
+        storage.save(["a", "bb", "ccc", "dddd", "eeeee"])
+
+    assert sorted(len(batch) for batch in embedder.batches) == [1, 2, 2]
+    assert storage.collection.count() == 5
+    assert [total for _, total in progress] == [5, 5, 5]
+    assert sorted(embedded for embedded, _ in progress)[-1] == 5
+
+
+def test_failed_batches_are_retried():
+    embedder = FlakyEmbeddingFunction(failures=2)
+    storage = make_storage(embedder, embedding_batch_size=10, embedding_max_retries=2)
+
+    storage.save(["alpha", "beta"])
+
+    assert storage.collection.count() == 2
+
+
+def test_batches_that_keep_failing_raise_after_storing_the_rest():
+    embedder = FlakyEmbeddingFunction(failures=1)
+    storage = make_storage(
+        embedder,
+        embedding_batch_size=1,
+        embedding_concurrency=1,
+        embedding_max_retries=0,
+    )
+
+    with pytest.raises(RuntimeError):
+        storage.save(["alpha", "beta", "gamma"])
+
+    assert storage.collection.count() == 2
+
+
+def test_batching_can_be_set_in_embedder_config():
+    storage = KnowledgeStorage(
+        embedder={
+            "provider": "custom",
+            "config": {"embedder": FlakyEmbeddingFunction()},
+            "batch_size": 16,
+            "max_concurrency": 2,
+        }
+    )
+
+    assert storage.embedding_batch_size == 16
+    assert storage.embedding_concurrency == 2
@@ -0,0 +1,124 @@
+import json
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from crewai.knowledge.source.base_file_knowledge_source import BaseFileKnowledgeSource
+from crewai.knowledge.source.base_knowledge_source import BaseKnowledgeSource
+from crewai.knowledge.source.csv_knowledge_source import CSVKnowledgeSource
+from crewai.knowledge.source.excel_knowledge_source import ExcelKnowledgeSource
+from crewai.knowledge.source.json_knowledge_source import JSONKnowledgeSource
+from crewai.knowledge.source.pdf_knowledge_source import PDFKnowledgeSource
+from crewai.knowledge.source.text_file_knowledge_source import TextFileKnowledgeSource
+from crewai.knowledge.utils.chunking import TextChunker
+from crewai.knowledge.utils.streaming import run_extraction
+
+
+class StubSource(BaseKnowledgeSource):
+    def validate_content(self):
+        pass
+
+    def add(self):
+        pass
+
+
+def saved_chunks(storage):
+    return [chunk for call in storage.save.call_args_list for chunk in call.args[0]]
+
+
+@pytest.mark.parametrize("length", [0, 5, 10, 11, 23, 40])
+@pytest.mark.parametrize("piece_size", [1, 3, 100])
+def test_streamed_chunks_match_whole_text_chunks(length, piece_size):
+    text = "".join(chr(ord("a") + i % 26) for i in range(length))
+    pieces = [text[i : i + piece_size] for i in range(0, len(text), piece_size)]
+    source = StubSource(chunk_size=10, chunk_overlap=3)
+
+    chunks = list(TextChunker(10, 3).iter_chunks(pieces))
+
+    assert [chunk.text for chunk in chunks] == source._chunk_text(text)
+    assert all(text[chunk.start : chunk.end] == chunk.text for chunk in chunks)
+
+
+def test_run_extraction_keeps_task_order_across_processes():
+    tasks = [(str.split, (f"{i} {i}",)) for i in range(6)]
+
+    results = [list(pieces) for pieces in run_extraction(tasks, True, max_workers=2)]
+
+    assert results == [[str(i), str(i)] for i in range(6)]
+
+
+def test_streaming_sources_defer_loading(tmp_path):
+    path = tmp_path / "notes.txt"
+    path.write_text("hello world")
+
+    source = TextFileKnowledgeSource(file_paths=[path], streaming=True)
+    source.storage = MagicMock()
+    source.add()
+
+    assert source.content == {}
+    assert saved_chunks(source.storage) == ["hello world"]
+    assert len(source.chunk_ids()) == 1
+
+
+def test_streaming_is_rejected_by_sources_that_cannot_stream(tmp_path):
+    class NotesSource(BaseFileKnowledgeSource):
+        def load_content(self):
+            return {}
+
+        def add(self):
+            pass
+
+    path = tmp_path / "notes.txt"
+    path.write_text("hello world")
+
+    with pytest.raises(ValueError, match="does not support streaming"):
+        NotesSource(file_paths=[path], streaming=True)
+    assert NotesSource(file_paths=[path]).content == {}
+
+
+def test_streaming_csv_and_json_match_their_text(tmp_path):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text("Name,Age\nBrandon,30\n")
+    json_path = tmp_path / "data.json"
+    json_path.write_text(json.dumps({"people": [{"name": "Alice"}]}))
+
+    csv_source = CSVKnowledgeSource(file_paths=[csv_path], streaming=True)
+    csv_source.storage = MagicMock()
+    csv_source.add()
+    json_source = JSONKnowledgeSource(file_paths=[json_path], streaming=True)
+    json_source.storage = MagicMock()
+    json_source.add()
+
+    assert saved_chunks(csv_source.storage) == ["Name Age\nBrandon 30\n"]
+    assert saved_chunks(json_source.storage) == [
+        json_source._json_to_text({"people": [{"name": "Alice"}]})
+    ]
+
+
+def test_streaming_excel_reads_every_sheet(tmp_path):
+    import pandas as pd
+
+    path = tmp_path / "data.xlsx"
+    with pd.ExcelWriter(path) as writer:
+        pd.DataFrame({"Name": ["Brandon"]}).to_excel(writer, sheet_name="a", index=False)
+        pd.DataFrame({"City": ["Chicago"]}).to_excel(writer, sheet_name="b", index=False)
+
+    source = ExcelKnowledgeSource(file_paths=[path], streaming=True, max_workers=1)
+    source.storage = MagicMock()
+    source.add()
+
+    assert saved_chunks(source.storage) == ["Name\nBrandon\n\nCity\nChicago\n\n"]
+
+
+def test_streaming_pdf_matches_eager_loading():
+    pdf_path = Path(__file__).parent / "crewai_quickstart.pdf"
+
+    eager = PDFKnowledgeSource(file_paths=[pdf_path])
+    eager.storage = MagicMock()
+    eager.add()
+    streamed = PDFKnowledgeSource(file_paths=[pdf_path], streaming=True)
+    streamed.storage = MagicMock()
+    streamed.add()
+
+    assert saved_chunks(streamed.storage) == eager.chunks
@@ -0,0 +1,103 @@
+import concurrent.futures
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from crewai.memory.contextual.contextual_memory import ContextualMemory
+
+
+@pytest.fixture
+def task():
+    task = MagicMock()
+    task.description = "Research AI trends"
+    return task
+
+
+def _memory_returning(results, delay=0.0, barrier=None):
+    memory = MagicMock()
+
+    def search(query, **kwargs):
+        if barrier is not None:
+            barrier.wait(timeout=5)
+        time.sleep(delay)
+        return results
+
+    memory.search.side_effect = search
+    return memory
+
+
+def test_build_context_queries_stores_concurrently(task):
+    barrier = threading.Barrier(3)
+    stm = _memory_returning([{"context": "recent insight"}], barrier=barrier)
+    em = _memory_returning([{"context": "entity info"}], barrier=barrier)
+    exm = _memory_returning([{"memory": "external info"}], barrier=barrier)
+
+    contextual_memory = ContextualMemory(None, stm, None, em, None, exm)
+    result = contextual_memory.build_context_for_task(task, "")
+
+    assert result == (
+        "Recent Insights:\n- recent insight\n"
+        "Entities:\n- entity info\n"
+        "External memories:\n- external info"
+    )
+    assert set(contextual_memory.retrieval_times) == {
+        "short_term_memory",
+        "entity_memory",
+        "external_memory",
+    }
+    assert contextual_memory.timed_out_stores == []
+
+
+def test_build_context_drops_stores_past_the_deadline(task):
+    stm = _memory_returning([{"context": "recent insight"}])
+    em = _memory_returning([{"context": "slow entity"}], delay=1.0)
+
+    contextual_memory = ContextualMemory(
+        {"retrieval_timeout": 0.2}, stm, None, em, None, None
+    )
+    start_time = time.time()
+    result = contextual_memory.build_context_for_task(task, "")
+
+    assert time.time() - start_time < 1.0
+    assert result == "Recent Insights:\n- recent insight"
+    assert contextual_memory.timed_out_stores == ["entity_memory"]
+    retrieval_times = contextual_memory.retrieval_times
+    assert set(retrieval_times) == {"short_term_memory"}
+
+    # The late store finishing afterwards doesn't touch the reported timings
+    time.sleep(1.0)
+    assert contextual_memory.retrieval_times is retrieval_times
+    assert set(retrieval_times) == {"short_term_memory"}
+
+
+def test_stores_finishing_after_the_deadline_are_dropped_consistently(
+    task, monkeypatch
+):
+    stm = _memory_returning([{"context": "recent insight"}])
+    em = _memory_returning([{"context": "late entity"}], delay=0.3)
+    wait = concurrent.futures.wait
+
+    def wait_then_let_everything_finish(futures, timeout=None):
+        result = wait(futures, timeout=timeout)
+        wait(futures)
+        return result
+
+    monkeypatch.setattr(concurrent.futures, "wait", wait_then_let_everything_finish)
+    contextual_memory = ContextualMemory(
+        {"retrieval_timeout": 0.1}, stm, None, em, None, None
+    )
+
+    result = contextual_memory.build_context_for_task(task, "")
+
+    assert result == "Recent Insights:\n- recent insight"
+    assert contextual_memory.timed_out_stores == ["entity_memory"]
+    assert set(contextual_memory.retrieval_times) == {"short_term_memory"}
+
+
+def test_build_context_without_memories(task):
+    contextual_memory = ContextualMemory(None, None, None, None, None, None)
+
+    assert contextual_memory.build_context_for_task(task, "") == ""
+    assert contextual_memory.retrieval_times == {}
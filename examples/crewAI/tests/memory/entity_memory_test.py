@@ -0,0 +1,57 @@
+from collections import defaultdict
+from unittest.mock import MagicMock
+
+from crewai.memory.entity.entity_memory import EntityMemory
+from crewai.memory.entity.entity_memory_item import EntityMemoryItem
+from crewai.utilities.events import crewai_event_bus
+from crewai.utilities.events.memory_events import (
+    MemorySaveCompletedEvent,
+    MemorySaveStartedEvent,
+)
+
+
+def test_entity_memory_save_many_writes_once():
+    storage = MagicMock()
+    entity_memory = EntityMemory(storage=storage)
+    items = [
+        EntityMemoryItem(
+            name=f"Entity {i}",
+            type="Company",
+            description=f"Description {i}",
+            relationships="- none",
+        )
+        for i in range(3)
+    ]
+    events = defaultdict(list)
+
+    with crewai_event_bus.scoped_handlers():
+
+        @crewai_event_bus.on(MemorySaveStartedEvent)
+        def on_save_started(source, event):
+            events["started"].append(event)
+
+        @crewai_event_bus.on(MemorySaveCompletedEvent)
+        def on_save_completed(source, event):
+            events["completed"].append(event)
+
+        entity_memory.save_many(items)
+
+    storage.save_many.assert_called_once_with(
+        [
+            "Entity 0(Company): Description 0",
+            "Entity 1(Company): Description 1",
+            "Entity 2(Company): Description 2",
+        ],
+        [{"relationships": "- none"}] * 3,
+    )
+    storage.save.assert_not_called()
+    assert len(events["started"]) == 3
+    assert len(events["completed"]) == 3
+
+
+def test_entity_memory_save_many_with_no_items():
+    storage = MagicMock()
+
+    EntityMemory(storage=storage).save_many([])
+
+    storage.save_many.assert_not_called()
@@ -0,0 +1,37 @@
+from crewai.memory.retention import MemoryRetentionPolicy
+
+
+def stamped(policy, created_at, **extra):
+    return {**policy.stamp({}, now=created_at), **extra}
+
+
+def test_lru_evicts_least_recently_retrieved():
+    policy = MemoryRetentionPolicy(max_items=2, prune_ratio=0.5)
+    metadatas = [
+        policy.touch(stamped(policy, 1), now=10),
+        stamped(policy, 2),
+        stamped(policy, 3),
+    ]
+
+    assert policy.select_evictions(["a", "b", "c"], metadatas) == ["b", "c"]
+
+
+def test_score_evicts_lowest_scores_first():
+    policy = MemoryRetentionPolicy(
+        max_items=2, eviction="score", score_key="quality", prune_ratio=0
+    )
+    metadatas = [
+        stamped(policy, 1, quality=9),
+        stamped(policy, 2, quality=1),
+        stamped(policy, 3, quality=5),
+    ]
+
+    assert policy.select_evictions(["a", "b", "c"], metadatas) == ["b"]
+
+
+def test_nothing_is_evicted_under_the_cap():
+    policy = MemoryRetentionPolicy(max_items=5)
+
+    assert not policy.needs_pruning(5)
+    assert policy.select_evictions(["a"], [stamped(policy, 1)]) == []
+    assert policy.expiry_cutoff() is None
@@ -160,3 +160,18 @@ def test_save_and_search(short_term_memory):
         find = short_term_memory.search("test value", score_threshold=0.01)[0]
         assert find["context"] == memory.data, "Data value mismatch."
         assert find["metadata"]["agent"] == "test_agent", "Agent value mismatch."
+
+
+def test_short_term_memory_save_many(short_term_memory):
+    items = [
+        ShortTermMemoryItem(data=f"insight {i}", agent="test_agent", metadata={"i": i})
+        for i in range(3)
+    ]
+
+    with patch.object(short_term_memory.storage, "save_many") as mock_save_many:
+        short_term_memory.save_many(items)
+
+    mock_save_many.assert_called_once_with(
+        ["insight 0", "insight 1", "insight 2"],
+        [{"i": i, "agent": "test_agent"} for i in range(3)],
+    )
@@ -0,0 +1,108 @@
+import threading
+import time
+from unittest.mock import MagicMock
+
+from crewai.agent import Agent
+from crewai.crew import Crew
+from crewai.memory.write_queue import MemoryWriteQueue
+from crewai.task import Task
+
+
+class RecordingMemory:
+    def __init__(self, calls, delay=0.0):
+        self.calls = calls
+        self.delay = delay
+
+    def save_many(self, items):
+        time.sleep(self.delay)
+        self.calls.append(("save_many", list(items)))
+
+
+def test_consecutive_saves_are_batched_per_memory():
+    calls = []
+    blocker = threading.Event()
+    memory = RecordingMemory(calls)
+    write_queue = MemoryWriteQueue()
+
+    write_queue.submit(blocker.wait, 5)
+    for i in range(5):
+        write_queue.submit_save(memory, i)
+    blocker.set()
+
+    assert write_queue.flush(timeout=5)
+    assert calls == [("save_many", [0, 1, 2, 3, 4])]
+
+    stats = write_queue.stats()
+    assert stats["submitted"] == 6
+    assert stats["processed"] == 6
+    assert stats["depth"] == 0
+
+
+def test_deferred_calls_keep_their_order_with_saves():
+    calls = []
+    blocker = threading.Event()
+    memory = RecordingMemory(calls)
+    write_queue = MemoryWriteQueue()
+
+    write_queue.submit(blocker.wait, 5)
+    write_queue.submit_save(memory, "a")
+    write_queue.submit(lambda: calls.append("call"))
+    write_queue.submit_save(memory, "b")
+    blocker.set()
+
+    assert write_queue.flush(timeout=5)
+    assert calls == [("save_many", ["a"]), "call", ("save_many", ["b"])]
+
+
+def test_full_queue_applies_backpressure():
+    calls = []
+    memory = RecordingMemory(calls, delay=0.05)
+    write_queue = MemoryWriteQueue(max_size=1, max_batch_size=1)
+
+    for i in range(4):
+        write_queue.submit_save(memory, i)
+
+    assert write_queue.flush(timeout=5)
+    assert [items for _, items in calls] == [[0], [1], [2], [3]]
+    assert write_queue.stats()["blocked_submissions"] >= 1
+    assert write_queue.stats()["blocked_time_ms"] > 0
+
+
+def test_failed_writes_do_not_stop_the_worker():
+    calls = []
+    failing = MagicMock()
+    failing.save_many.side_effect = RuntimeError("boom")
+    write_queue = MemoryWriteQueue()
+
+    write_queue.submit_save(failing, "lost")
+    assert write_queue.flush(timeout=5)
+    write_queue.submit_save(RecordingMemory(calls), "kept")
+    assert write_queue.flush(timeout=5)
+
+    assert calls == [("save_many", ["kept"])]
+    assert write_queue.stats()["failed"] == 1
+
+
+def test_flush_times_out_while_work_is_pending():
+    blocker = threading.Event()
+    write_queue = MemoryWriteQueue()
+    write_queue.submit(blocker.wait, 5)
+
+    assert write_queue.flush(timeout=0.05) is False
+    blocker.set()
+    assert write_queue.flush(timeout=5)
+
+
+def test_crew_creates_write_queue_from_memory_config():
+    agent = Agent(role="Researcher", goal="Research", backstory="Researcher")
+    task = Task(description="Research", expected_output="Findings", agent=agent)
+
+    crew = Crew(
+        agents=[agent],
+        tasks=[task],
+        memory_config={"write_behind": {"max_size": 10}},
+    )
+    default_crew = Crew(agents=[agent], tasks=[task])
+
+    assert crew._memory_write_queue.max_size == 10
+    assert default_crew._memory_write_queue is None
@@ -0,0 +1,159 @@
+import sqlite3
+
+import numpy as np
+import pytest
+from chromadb import Documents, EmbeddingFunction, Embeddings
+
+from crewai.agent import Agent
+from crewai.crew import Crew
+from crewai.memory.entity.entity_memory import EntityMemory
+from crewai.memory.short_term.short_term_memory import ShortTermMemory
+from crewai.memory.storage.mmap_rag_storage import MmapRAGStorage
+from crewai.task import Task
+
+
+class PositionEmbeddingFunction(EmbeddingFunction):
+    """Embeds "x,y" strings as 2-D points so distances are predictable."""
+
+    def __call__(self, input: Documents) -> Embeddings:
+        return [np.array(text.split(","), dtype=np.float32) for text in input]
+
+
+@pytest.fixture
+def embedder_config():
+    return {
+        "provider": "custom",
+        "config": {"embedder": PositionEmbeddingFunction()},
+        "cache": False,
+    }
+
+
+def test_search_returns_nearest_items(tmp_path, embedder_config):
+    storage = MmapRAGStorage(
+        type="short_term", embedder_config=embedder_config, path=str(tmp_path)
+    )
+    storage.save_many(["0,0", "1,0", "5,5"], [{"n": 0}, {"n": 1}, {}])
+
+    results = storage.search("0.9,0", limit=2, score_threshold=0)
+
+    assert [r["context"] for r in results] == ["1,0", "0,0"]
+    assert results[0]["metadata"] == {"n": 1}
+    assert results[0]["score"] == pytest.approx(0.01, abs=1e-5)
+
+
+def test_items_survive_reopening(tmp_path, embedder_config):
+    MmapRAGStorage(
+        type="short_term", embedder_config=embedder_config, path=str(tmp_path)
+    ).save("3,4", {"kept": True})
+
+    reopened = MmapRAGStorage(
+        type="short_term", embedder_config=embedder_config, path=str(tmp_path)
+    )
+    reopened.save("9,9", {})
+
+    assert reopened.count() == 2
+    assert reopened.search("3,4", limit=1, score_threshold=0)[0]["metadata"] == {
+        "kept": True
+    }
+
+
+def test_ivf_index_finds_neighbours(tmp_path, embedder_config):
+    storage = MmapRAGStorage(
+        type="short_term",
+        embedder_config=embedder_config,
+        path=str(tmp_path),
+        index_type="ivf",
+        nlist=2,
+        nprobe=1,
+    )
+    points = [f"{x},0" for x in range(32)] + [f"{x},100" for x in range(32)]
+    storage.save_many(points, [{} for _ in points])
+
+    results = storage.search("3.2,100", limit=3, score_threshold=0)
+
+    assert [r["context"] for r in results] == ["3,100", "4,100", "2,100"]
+    assert storage._load_centroids() is not None
+
+
+def test_connections_are_closed_after_use(tmp_path, embedder_config):
+    storage = MmapRAGStorage(
+        type="short_term",
+        embedder_config=embedder_config,
+        path=str(tmp_path),
+        index_type="ivf",
+        nlist=2,
+        nprobe=1,
+    )
+    connections = []
+    connect = storage._connect
+
+    def tracking_connect():
+        conn = connect()
+        connections.append(conn)
+        return conn
+
+    storage._connect = tracking_connect
+    points = [f"{x},0" for x in range(32)]
+    storage.save_many(points, [{} for _ in points])
+    storage.search("1,0", limit=2, score_threshold=0)
+    assert storage.count() == 32
+    assert storage.dimension == 2
+
+    assert connections
+    for conn in connections:
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
+
+
+def test_reset_removes_items(tmp_path, embedder_config):
+    storage = MmapRAGStorage(
+        type="short_term", embedder_config=embedder_config, path=str(tmp_path)
+    )
+    storage.save("1,1", {})
+
+    storage.reset()
+
+    assert storage.count() == 0
+    assert storage.search("1,1", score_threshold=0) == []
+
+
+def test_memory_config_selects_mmap_store(tmp_path, embedder_config):
+    agent = Agent(role="Researcher", goal="Research", backstory="Researcher")
+    task = Task(description="Research", expected_output="Findings", agent=agent)
+    crew = Crew(
+        agents=[agent],
+        tasks=[task],
+        memory_config={"vector_store": "mmap"},
+    )
+
+    memory = ShortTermMemory(
+        crew=crew, embedder_config=embedder_config, path=str(tmp_path)
+    )
+
+    assert isinstance(memory.storage, MmapRAGStorage)
+
+
+def test_stats_have_the_keys_of_rag_storage(tmp_path, embedder_config):
+    storage = MmapRAGStorage(
+        type="short_term", embedder_config=embedder_config, path=str(tmp_path)
+    )
+    storage.save("1,1", {})
+
+    stats = storage.stats()
+
+    assert (stats["items"], stats["expired"], stats["evicted"]) == (1, 0, 0)
+    assert stats["disk_bytes"] > 0
+
+
+@pytest.mark.parametrize("memory_class", [ShortTermMemory, EntityMemory])
+def test_retention_is_rejected_with_mmap_store(tmp_path, embedder_config, memory_class):
+    agent = Agent(role="Researcher", goal="Research", backstory="Researcher")
+    task = Task(description="Research", expected_output="Findings", agent=agent)
+    crew = Crew(
+        agents=[agent],
+        tasks=[task],
+        memory_config={"vector_store": "mmap", "retention": {"max_items": 10}},
+    )
+
+    with pytest.raises(ValueError, match="retention"):
+        memory_class(crew=crew, embedder_config=embedder_config, path=str(tmp_path))
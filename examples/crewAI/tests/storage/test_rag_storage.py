@@ -0,0 +1,149 @@
+import gc
+
+import numpy as np
+import pytest
+from chromadb import Documents, EmbeddingFunction, Embeddings
+
+from crewai.memory.storage.rag_storage import RAGStorage
+from crewai.utilities.chromadb import chroma_client_registry
+
+
+class CountingEmbeddingFunction(EmbeddingFunction):
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, input: Documents) -> Embeddings:
+        self.calls.append(list(input))
+        return [np.full(4, len(text), dtype=np.float32) for text in input]
+
+
+@pytest.fixture
+def embedder():
+    return CountingEmbeddingFunction()
+
+
+def make_storage(tmp_path, embedder, batch_size):
+    return RAGStorage(
+        type="entities",
+        embedder_config={
+            "provider": "custom",
+            "config": {"embedder": embedder},
+            "cache": False,
+        },
+        path=str(tmp_path / "entities"),
+        batch_size=batch_size,
+    )
+
+
+def test_save_many_embeds_and_inserts_in_batches(tmp_path, embedder):
+    storage = make_storage(tmp_path, embedder, batch_size=2)
+
+    storage.save_many(
+        ["alpha", "beta", "gamma", "delta", "epsilon"],
+        [{"i": i} for i in range(5)],
+    )
+
+    assert embedder.calls == [["alpha", "beta"], ["gamma", "delta"], ["epsilon"]]
+    assert storage.collection.count() == 5
+
+
+def test_save_many_stores_metadata(tmp_path, embedder):
+    storage = make_storage(tmp_path, embedder, batch_size=10)
+
+    storage.save_many(["alpha", "beta"], [{"kind": "a"}, {}])
+
+    stored = storage.collection.get(include=["documents", "metadatas"])
+    assert sorted(stored["documents"]) == ["alpha", "beta"]
+    assert {"kind": "a"} in stored["metadatas"]
+    assert None in stored["metadatas"]
+
+
+def make_retained_storage(tmp_path, embedder, **retention):
+    return RAGStorage(
+        type="short_term",
+        embedder_config={
+            "provider": "custom",
+            "config": {"embedder": embedder},
+            "cache": False,
+        },
+        path=str(tmp_path / "short_term"),
+        retention=retention,
+    )
+
+
+def test_retention_caps_item_count(tmp_path, embedder):
+    storage = make_retained_storage(
+        tmp_path, embedder, max_items=10, eviction="fifo", prune_ratio=0.2
+    )
+
+    for i in range(11):
+        storage.save(f"item {i:02d}", {"i": i})
+
+    stored = storage.collection.get(include=["documents"])
+    assert len(stored["documents"]) == 8
+    assert "item 00" not in stored["documents"]
+    assert "item 10" in stored["documents"]
+    assert storage.stats()["evicted"] == 3
+
+
+def test_retention_expires_old_items(tmp_path, embedder, monkeypatch):
+    storage = make_retained_storage(tmp_path, embedder, ttl_seconds=60)
+    storage.save("old", {})
+
+    monkeypatch.setattr("crewai.memory.retention.time.time", lambda: 10**10)
+    storage.save("new", {})
+
+    assert storage.collection.get()["documents"] == ["new"]
+    assert storage.stats()["expired"] == 1
+
+
+def test_search_records_retrievals(tmp_path, embedder):
+    storage = make_retained_storage(tmp_path, embedder, max_items=100)
+    storage.save("hello", {"kind": "greeting"})
+
+    storage.search("hello", score_threshold=0)
+    metadata = storage.collection.get(include=["metadatas"])["metadatas"][0]
+
+    assert metadata["kind"] == "greeting"
+    assert metadata["_retrieval_count"] == 1
+
+
+def test_stats_report_size(tmp_path, embedder):
+    storage = make_storage(tmp_path, embedder, batch_size=10)
+    storage.save_many(["alpha", "beta"], [{}, {}])
+
+    stats = storage.stats()
+
+    assert stats["items"] == 2
+    assert stats["disk_bytes"] > 0
+
+
+def test_storages_release_the_shared_client(tmp_path, embedder):
+    first = make_storage(tmp_path, embedder, batch_size=10)
+    second = make_storage(tmp_path, embedder, batch_size=10)
+    path = first._client_path
+    assert first.app is second.app
+
+    first.close()
+    first.close()
+    assert path in chroma_client_registry
+    second.save("alpha", {})
+
+    # Dropping a storage without closing it releases its reference as well
+    del second
+    gc.collect()
+    assert path not in chroma_client_registry
+
+
+def test_storages_share_collection_handles_until_closed(tmp_path, embedder):
+    first = make_storage(tmp_path, embedder, batch_size=10)
+    second = make_storage(tmp_path, embedder, batch_size=10)
+    assert first.collection is second.collection
+
+    collection = second.collection
+    second.close()
+    third = make_storage(tmp_path, embedder, batch_size=10)
+
+    assert third.collection is not collection
+    first.close()
+    third.close()
@@ -0,0 +1,132 @@
+"""Test running flows in worker processes."""
+
+import os
+import sqlite3
+import time
+
+import pytest
+
+from crewai.flow.distributed import DistributedFlowRunner
+from crewai.flow.flow import Flow, and_, listen, router, start
+from crewai.flow.persistence import SQLiteFlowPersistence, persist
+
+
+class FanInFlow(Flow):
+    @start()
+    def begin(self):
+        self.state["started"] = True
+        return 3
+
+    @listen(begin)
+    def double(self, value):
+        self.state["doubled"] = value * 2
+        self.state["pids"] = [os.getpid()]
+
+    @listen(begin)
+    def square(self, value):
+        self.state["squared"] = value**2
+
+    @router(and_(double, square))
+    def check(self):
+        return "big" if self.state["doubled"] + self.state["squared"] > 10 else "small"
+
+    @listen("big")
+    def report(self):
+        return f"{self.state['doubled']} + {self.state['squared']}"
+
+
+@persist()
+class PersistedBranchesFlow(Flow):
+    @start()
+    def begin(self):
+        self.state["started"] = True
+
+    @listen(begin)
+    def left(self):
+        self.state["left"] = True
+
+    @listen(begin)
+    def right(self):
+        time.sleep(0.2)
+        self.state["right"] = True
+
+    @listen(and_(left, right))
+    def join(self):
+        return sorted(key for key in ("left", "right") if self.state.get(key))
+
+
+class CrashingFlow(Flow):
+    @start()
+    def work(self):
+        marker = self.state["marker"]
+        if not os.path.exists(marker):
+            open(marker, "w").close()
+            os._exit(1)  # The worker dies on the first attempt
+        self.state["attempted"] = True
+        return "survived"
+
+
+class FailingFlow(Flow):
+    @start()
+    def work(self):
+        raise ValueError("bad input")
+
+
+def make_runner(flow_class, tmp_path, workers=1):
+    return DistributedFlowRunner(
+        flow_class,
+        workers=workers,
+        db_path=str(tmp_path / "queue.db"),
+        persistence=SQLiteFlowPersistence(str(tmp_path / "states.db")),
+    )
+
+
+def test_distributed_runner_merges_state_from_workers(tmp_path):
+    runner = make_runner(FanInFlow, tmp_path, workers=2)
+
+    assert runner.kickoff(inputs={"id": "run-1"}) == "6 + 9"
+
+    state = runner.flow.state
+    assert state["id"] == "run-1"
+    assert (state["started"], state["doubled"], state["squared"]) == (True, 6, 9)
+    assert os.getpid() not in state["pids"]
+    assert runner.persistence.load_state("run-1") == state
+
+
+def test_distributed_runner_is_the_only_writer_of_persisted_flows(tmp_path):
+    # The workers' @persist() default backend opens this same database
+    runner = DistributedFlowRunner(
+        PersistedBranchesFlow,
+        workers=2,
+        db_path=str(tmp_path / "queue.db"),
+        persistence=SQLiteFlowPersistence(),
+    )
+
+    assert runner.kickoff(inputs={"id": "run-1"}) == ["left", "right"]
+
+    with sqlite3.connect(runner.persistence.db_path) as conn:
+        saved = [
+            row[0]
+            for row in conn.execute(
+                "SELECT method_name FROM flow_states WHERE flow_uuid = ? ORDER BY id",
+                ("run-1",),
+            )
+        ]
+    # One merged save per method, none of the workers' partial states
+    assert saved == ["kickoff", "begin", "left", "right", "join"]
+    state = runner.persistence.load_state("run-1")
+    assert (state["left"], state["right"]) == (True, True)
+
+
+def test_distributed_runner_survives_worker_crash(tmp_path):
+    runner = make_runner(CrashingFlow, tmp_path)
+
+    assert runner.kickoff(inputs={"marker": str(tmp_path / "crashed")}) == "survived"
+    assert runner.flow.state["attempted"] is True
+
+
+def test_distributed_runner_reports_failed_methods(tmp_path):
+    runner = make_runner(FailingFlow, tmp_path)
+
+    with pytest.raises(RuntimeError, match="bad input"):
+        runner.kickoff()
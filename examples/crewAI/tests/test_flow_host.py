@@ -0,0 +1,130 @@
+"""Test running many flows concurrently on one event loop."""
+
+import asyncio
+import threading
+
+import pytest
+from pydantic import BaseModel
+
+from crewai.flow import FlowHost, get_current_flow
+from crewai.flow.flow import Flow, listen, start
+from crewai.flow.flow_trackable import FlowTrackable
+from crewai.utilities.events import (
+    FlowFailedEvent,
+    FlowStartedEvent,
+    crewai_event_bus,
+)
+from crewai.utilities.events.event_listener import event_listener
+
+
+class Tracked(FlowTrackable, BaseModel):
+    pass
+
+
+def create_tracked(depth):
+    # Deeper than the call stack inspected by FlowTrackable
+    if depth:
+        return create_tracked(depth - 1)
+    return Tracked()
+
+
+class EchoFlow(Flow):
+    sync_methods = "thread"
+    running = 0
+    peak = 0
+
+    @start()
+    async def receive(self):
+        EchoFlow.running += 1
+        EchoFlow.peak = max(EchoFlow.peak, EchoFlow.running)
+        await asyncio.sleep(0.02)
+        EchoFlow.running -= 1
+        assert get_current_flow() is self
+        return self.state["payload"]
+
+    @listen(receive)
+    def reply(self, payload):
+        tracked = create_tracked(10)
+        self.state["thread"] = threading.current_thread().name
+        self.state["tracked_by_self"] = tracked.parent_flow is self
+        self.state["current_is_self"] = get_current_flow() is self
+        return f"reply to {payload}"
+
+
+def test_host_runs_flows_concurrently_with_a_global_limit():
+    EchoFlow.running = EchoFlow.peak = 0
+    started = []
+
+    with crewai_event_bus.scoped_handlers():
+
+        @crewai_event_bus.on(FlowStartedEvent)
+        def on_started(source, event):
+            started.append(source.flow_id)
+
+        async def serve():
+            async with FlowHost(max_concurrent_flows=5, max_workers=4) as host:
+                flows = [EchoFlow() for _ in range(40)]
+                results = await asyncio.gather(
+                    *(host.run(flow, {"payload": i}) for i, flow in enumerate(flows))
+                )
+                assert host.active_flows == 0
+                return flows, results
+
+        flows, results = asyncio.run(serve())
+
+    assert results == [f"reply to {i}" for i in range(40)]
+    assert 1 < EchoFlow.peak <= 5
+    assert sorted(started) == sorted(flow.flow_id for flow in flows)
+    for flow in flows:
+        assert flow.state["thread"].startswith("flow-host")
+        assert flow.state["tracked_by_self"]
+        assert flow.state["current_is_self"]
+    assert get_current_flow() is None
+
+
+def test_host_isolates_failures_and_rejects_reused_flows():
+    class FailingFlow(Flow):
+        @start()
+        def fail(self):
+            raise ValueError("bad payload")
+
+    async def serve():
+        host = FlowHost()
+        flow = EchoFlow()
+        task = host.start(flow, {"payload": "ok"})
+        with pytest.raises(RuntimeError, match="already running"):
+            host.start(flow)
+        with pytest.raises(ValueError, match="bad payload"):
+            await host.run(FailingFlow())
+        assert await task == "reply to ok"
+
+        await host.close()
+        with pytest.raises(RuntimeError, match="closed"):
+            host.start(EchoFlow())
+
+    asyncio.run(serve())
+
+    with pytest.raises(ValueError):
+        FlowHost(max_concurrent_flows=0)
+
+
+def test_failed_flows_release_their_console_tree():
+    class FailingFlow(Flow):
+        @start()
+        def fail(self):
+            raise ValueError("bad payload")
+
+    failures = []
+    flow = FailingFlow()
+
+    @crewai_event_bus.on(FlowFailedEvent)
+    def on_failed(source, event):
+        failures.append((source, event.error))
+
+    with pytest.raises(ValueError, match="bad payload"):
+        flow.kickoff()
+
+    assert len(failures) == 1
+    source, error = failures[0]
+    assert source is flow and isinstance(error, ValueError)
+    assert str(flow.flow_id) not in event_listener.flow_trees
@@ -1,13 +1,17 @@
 """Test flow state persistence functionality."""
 
 import os
+import pickle
+import sqlite3
+import threading
+import time
 from typing import Dict
 
 import pytest
 from pydantic import BaseModel
 
-from crewai.flow.flow import Flow, FlowState, listen, start
-from crewai.flow.persistence import persist
+from crewai.flow.flow import Flow, FlowState, listen, router, start
+from crewai.flow.persistence import FlowPersistence, persist
 from crewai.flow.persistence.sqlite import SQLiteFlowPersistence
 
 
@@ -208,3 +212,190 @@ def test_persist_decorator_verbose_logging(tmp_path, caplog):
     flow = VerboseFlow(persistence=persistence)
     flow.kickoff()
     assert "Saving flow state" in caplog.text
+
+
+def test_sqlite_persistence_stores_deltas_between_checkpoints(tmp_path):
+    db_path = os.path.join(tmp_path, "test_flows.db")
+    persistence = SQLiteFlowPersistence(
+        db_path, checkpoint_every=3, compress=True, keep_last=3
+    )
+
+    states = []
+    state = {"id": "flow-1", "log": [], "meta": {"a/b": 1, "gone": True}}
+    for step in range(7):
+        state = {
+            "id": "flow-1",
+            "log": state["log"] + [step],
+            "meta": {"a/b": step, "step~": None},
+        }
+        states.append(state)
+        persistence.save_state("flow-1", f"step_{step}", state)
+        assert persistence.load_state("flow-1") == state
+
+    with sqlite3.connect(db_path) as conn:
+        rows = conn.execute(
+            "SELECT method_name, kind, encoding FROM flow_states ORDER BY id"
+        ).fetchall()
+    # Three states kept, plus the checkpoint the oldest kept delta is based on
+    assert [row[0] for row in rows] == ["step_3", "step_4", "step_5", "step_6"]
+    assert [row[1] for row in rows] == ["full", "delta", "delta", "full"]
+    assert {row[2] for row in rows} == {"zlib"}
+
+    # A fresh instance, or one in another process, reads the same history
+    reopened = pickle.loads(pickle.dumps(persistence))
+    assert reopened.load_state("flow-1") == states[-1]
+    assert reopened.load_state("unknown") is None
+
+
+def test_sqlite_persistence_upgrades_existing_databases(tmp_path):
+    db_path = os.path.join(tmp_path, "test_flows.db")
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            """
+            CREATE TABLE flow_states (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                flow_uuid TEXT NOT NULL,
+                method_name TEXT NOT NULL,
+                timestamp DATETIME NOT NULL,
+                state_json TEXT NOT NULL
+            )
+            """
+        )
+        conn.execute("CREATE INDEX idx_flow_states_uuid ON flow_states(flow_uuid)")
+        conn.execute(
+            "INSERT INTO flow_states (flow_uuid, method_name, timestamp, state_json) "
+            "VALUES ('old', 'step', '2025-01-01', '{\"id\": \"old\"}')"
+        )
+
+    persistence = SQLiteFlowPersistence(db_path, checkpoint_every=2)
+
+    assert persistence.load_state("old") == {"id": "old"}
+    persistence.save_state("old", "next", {"id": "old", "done": True})
+    assert persistence.load_state("old") == {"id": "old", "done": True}
+    with sqlite3.connect(db_path) as conn:
+        indexes = {row[1] for row in conn.execute("PRAGMA index_list(flow_states)")}
+    assert indexes == {"idx_flow_states_uuid_id"}
+
+
+class RecordingPersistence(FlowPersistence):
+    """Keeps saved states in memory, with the method and thread that saved them."""
+
+    def __init__(self):
+        self.saves = []
+
+    def init_db(self):
+        pass
+
+    def save_state(self, flow_uuid, method_name, state_data):
+        self.saves.append(
+            (method_name, state_data.counter, threading.current_thread())
+        )
+
+    def load_state(self, flow_uuid):
+        return None
+
+
+def make_policy_flow(persistence, **persist_kwargs):
+    @persist(persistence, **persist_kwargs)
+    class PolicyFlow(Flow[TestState]):
+        @start()
+        async def step_1(self):
+            self.state.counter = 1
+
+        @router(step_1)
+        async def check(self):
+            self.state.counter = 2
+            return "next"
+
+        @listen("next")
+        async def step_2(self):
+            self.state.counter = 3
+
+        @listen(step_2)
+        async def step_3(self):
+            self.state.counter = 4
+            if self.state.message == "fail":
+                raise RuntimeError("step_3 failed")
+
+    return PolicyFlow
+
+
+@pytest.mark.parametrize(
+    "write_policy,max_writes",
+    [("every_method", 4), ("routers", 2), ("interval", 2), ("flow_end", 1)],
+)
+def test_persist_write_policies(write_policy, max_writes):
+    persistence = RecordingPersistence()
+    flow = make_policy_flow(
+        persistence, write_policy=write_policy, write_interval=60
+    )()
+    flow.kickoff()
+
+    # Requests made while a write is queued are merged into it, so background
+    # policies may write less often than requested
+    if write_policy == "every_method":
+        assert len(persistence.saves) == max_writes
+    else:
+        assert 1 <= len(persistence.saves) <= max_writes
+        assert threading.main_thread() not in {t for _, _, t in persistence.saves}
+    # The last write always has the final state
+    assert persistence.saves[-1][:2] == ("step_3", 4)
+
+
+def test_persist_writes_the_state_as_of_the_request():
+    class SlowPersistence(RecordingPersistence):
+        def save_state(self, flow_uuid, method_name, state_data):
+            # Writes only run once the flow has moved on
+            deadline = time.monotonic() + 5
+            while self.flow.state.counter < 4 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            super().save_state(flow_uuid, method_name, state_data)
+
+    persistence = SlowPersistence()
+    flow = make_policy_flow(persistence, write_policy="routers")()
+    persistence.flow = flow
+    flow.kickoff()
+
+    assert [(method, counter) for method, counter, _ in persistence.saves] == [
+        ("check", 2),
+        ("step_3", 4),
+    ]
+
+
+def test_persist_only_fails_the_run_when_the_last_write_fails():
+    class FlakyPersistence(RecordingPersistence):
+        def __init__(self, failures):
+            super().__init__()
+            self.failures = failures
+
+        def save_state(self, flow_uuid, method_name, state_data):
+            if self.failures.pop(0):
+                raise OSError("disk full")
+            super().save_state(flow_uuid, method_name, state_data)
+
+    # The router's failed write is superseded by the final one
+    persistence = FlakyPersistence([True, False])
+    make_policy_flow(persistence, write_policy="routers")().kickoff()
+    assert [(method, counter) for method, counter, _ in persistence.saves] == [
+        ("step_3", 4)
+    ]
+
+    persistence = FlakyPersistence([False, True])
+    with pytest.raises(RuntimeError, match="disk full"):
+        make_policy_flow(persistence, write_policy="routers")().kickoff()
+
+
+def test_persist_writes_are_flushed_when_the_flow_fails():
+    persistence = RecordingPersistence()
+    flow = make_policy_flow(persistence, write_policy="flow_end")()
+
+    with pytest.raises(RuntimeError, match="step_3 failed"):
+        flow.kickoff(inputs={"message": "fail"})
+
+    assert [(method, counter) for method, counter, _ in persistence.saves] == [
+        ("step_2", 4)
+    ]
+
+    with pytest.raises(ValueError):
+        persist(persistence, write_policy="routers")(lambda self: None)
+
@@ -11,6 +11,7 @@ from crewai.utilities.chromadb import (
     is_ipv4_pattern,
     sanitize_collection_name,
     create_persistent_client,
+    ChromaClientRegistry,
 )
 
 
@@ -121,3 +122,89 @@ class TestChromadbUtils(unittest.TestCase):
 
             errors = [queue.get(timeout=5) for _ in processes]
             self.assertTrue(all(err is None for err in errors))
+
+
+class TestChromaClientRegistry(unittest.TestCase):
+    def test_clients_are_shared_per_path(self):
+        registry = ChromaClientRegistry()
+        with patch(
+            "crewai.utilities.chromadb.PersistentClient"
+        ) as mock_persistent_client, tempfile.TemporaryDirectory() as tmpdir:
+            mock_persistent_client.side_effect = lambda **kwargs: MagicMock()
+
+            first = registry.acquire(tmpdir)
+            second = registry.acquire(tmpdir + "/.")
+            other = registry.acquire(tmpdir + "/other")
+
+            self.assertIs(first, second)
+            self.assertIsNot(first, other)
+            self.assertEqual(mock_persistent_client.call_count, 2)
+
+    def test_last_release_closes_client(self):
+        registry = ChromaClientRegistry()
+        with patch("crewai.utilities.chromadb.PersistentClient"), tempfile.TemporaryDirectory() as tmpdir:
+            client = registry.acquire(tmpdir)
+            registry.acquire(tmpdir)
+
+            registry.release(tmpdir)
+            client.close.assert_not_called()
+            registry.release(tmpdir)
+
+            client.close.assert_called_once()
+            self.assertNotIn(tmpdir, registry)
+
+    def test_collection_handles_are_cached_per_embedding_function(self):
+        registry = ChromaClientRegistry()
+        with patch("crewai.utilities.chromadb.PersistentClient"), tempfile.TemporaryDirectory() as tmpdir:
+            client = registry.acquire(tmpdir)
+            client.get_or_create_collection.side_effect = lambda **kwargs: MagicMock()
+            embedder = MagicMock(fingerprint="model")
+
+            first = registry.get_or_create_collection(tmpdir, "memories", embedder)
+            second = registry.get_or_create_collection(tmpdir, "memories", embedder)
+            # Same model, other credentials
+            other = registry.get_or_create_collection(
+                tmpdir, "memories", MagicMock(fingerprint="model")
+            )
+
+            self.assertIs(first, second)
+            self.assertIsNot(first, other)
+            self.assertEqual(client.get_or_create_collection.call_count, 2)
+
+    def test_forget_collections_keeps_client_open(self):
+        registry = ChromaClientRegistry()
+        with patch("crewai.utilities.chromadb.PersistentClient"), tempfile.TemporaryDirectory() as tmpdir:
+            client = registry.acquire(tmpdir)
+            registry.get_or_create_collection(tmpdir, "memories")
+
+            registry.forget_collections(tmpdir)
+            registry.get_or_create_collection(tmpdir, "memories")
+
+            client.close.assert_not_called()
+            self.assertIs(registry.acquire(tmpdir), client)
+            self.assertEqual(client.get_or_create_collection.call_count, 2)
+
+    def test_collection_handles_are_shared_per_embedder_key(self):
+        registry = ChromaClientRegistry()
+        with patch("crewai.utilities.chromadb.PersistentClient"), tempfile.TemporaryDirectory() as tmpdir:
+            client = registry.acquire(tmpdir)
+            registry.acquire(tmpdir)
+            client.get_or_create_collection.side_effect = lambda **kwargs: MagicMock()
+
+            first = registry.get_or_create_collection(
+                tmpdir, "memories", MagicMock(), embedder_key="config"
+            )
+            second = registry.get_or_create_collection(
+                tmpdir, "memories", MagicMock(), embedder_key="config"
+            )
+            self.assertIs(first, second)
+
+            # Releasing drops the handle although the client stays open
+            registry.release(tmpdir, "memories", "config")
+            third = registry.get_or_create_collection(
+                tmpdir, "memories", MagicMock(), embedder_key="config"
+            )
+
+            self.assertIsNot(first, third)
+            client.close.assert_not_called()
+            self.assertEqual(client.get_or_create_collection.call_count, 2)
@@ -0,0 +1,147 @@
+import numpy as np
+import pytest
+from chromadb import Documents, EmbeddingFunction, Embeddings
+
+from crewai.rag.embeddings.configurator import EmbeddingConfigurator
+from crewai.rag.embeddings.embedding_cache import (
+    CachedEmbeddingFunction,
+    EmbeddingCache,
+    embedder_fingerprint,
+    embedding_cache,
+)
+
+
+class CountingEmbeddingFunction(EmbeddingFunction):
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, input: Documents) -> Embeddings:
+        self.calls.append(list(input))
+        return [np.full(4, len(text), dtype=np.float32) for text in input]
+
+
+@pytest.fixture
+def counting_embedder():
+    return CountingEmbeddingFunction()
+
+
+def test_cache_hits_skip_the_provider(counting_embedder):
+    cached = CachedEmbeddingFunction(counting_embedder, "model", EmbeddingCache())
+
+    first = cached(["hello", "world"])
+    second = cached(["world", "hello"])
+
+    assert counting_embedder.calls == [["hello", "world"]]
+    assert np.array_equal(first[0], second[1])
+    assert cached.cache.hits == 2
+    assert cached.cache.misses == 2
+
+
+def test_cache_misses_are_embedded_in_one_batch(counting_embedder):
+    cached = CachedEmbeddingFunction(counting_embedder, "model", EmbeddingCache())
+    cached(["a"])
+
+    cached(["a", "bb", "ccc", "bb"])
+
+    assert counting_embedder.calls == [["a"], ["bb", "ccc"]]
+
+
+def test_cache_is_keyed_by_embedder(counting_embedder):
+    cache = EmbeddingCache()
+    CachedEmbeddingFunction(counting_embedder, "model-a", cache)(["hello"])
+    CachedEmbeddingFunction(counting_embedder, "model-b", cache)(["hello"])
+
+    assert counting_embedder.calls == [["hello"], ["hello"]]
+
+
+def test_cache_evicts_least_recently_used(counting_embedder):
+    cached = CachedEmbeddingFunction(
+        counting_embedder, "model", EmbeddingCache(max_entries=2)
+    )
+    cached(["a", "b"])
+    cached(["a"])
+    cached(["c"])
+
+    cached(["a", "b"])
+
+    assert counting_embedder.calls == [["a", "b"], ["c"], ["b"]]
+
+
+def test_disk_cache_survives_new_instances(tmp_path, counting_embedder):
+    db_path = str(tmp_path / "embedding_cache.db")
+    CachedEmbeddingFunction(counting_embedder, "model", EmbeddingCache(db_path=db_path))(
+        ["hello"]
+    )
+
+    restored = CachedEmbeddingFunction(
+        counting_embedder, "model", EmbeddingCache(db_path=db_path)
+    )(["hello"])
+
+    assert counting_embedder.calls == [["hello"]]
+    assert np.array_equal(restored[0], np.full(4, 5, dtype=np.float32))
+
+
+def test_fingerprint_ignores_credentials():
+    config = {"provider": "openai", "config": {"model": "text-embedding-3-small"}}
+    with_key = {
+        "provider": "openai",
+        "config": {"model": "text-embedding-3-small", "api_key": "secret"},
+    }
+
+    assert embedder_fingerprint(config) == embedder_fingerprint(with_key)
+    assert embedder_fingerprint(None) == embedder_fingerprint(config)
+
+
+def test_configure_embedder_wraps_with_cache(counting_embedder):
+    configurator = EmbeddingConfigurator()
+    config = {"provider": "custom", "config": {"embedder": counting_embedder}}
+
+    cached = configurator.configure_embedder(config)
+    uncached = configurator.configure_embedder({**config, "cache": False})
+
+    assert isinstance(cached, CachedEmbeddingFunction)
+    assert cached.embedding_function is counting_embedder
+    assert uncached is counting_embedder
+
+
+def test_custom_embedders_are_fingerprinted_per_instance():
+    first, second = CountingEmbeddingFunction(), CountingEmbeddingFunction()
+
+    def custom(embedder, **config):
+        return {"provider": "custom", "config": {"embedder": embedder, **config}}
+
+    assert embedder_fingerprint(custom(first)) == embedder_fingerprint(custom(first))
+    assert embedder_fingerprint(custom(first)) != embedder_fingerprint(custom(second))
+    assert embedder_fingerprint(
+        custom(first, name="counting-4d")
+    ) == embedder_fingerprint(custom(second, name="counting-4d"))
+
+    class ConfiguredEmbeddingFunction(CountingEmbeddingFunction):
+        def __init__(self, dimensions):
+            super().__init__()
+            self.dimensions = dimensions
+
+        def get_config(self):
+            return {"dimensions": self.dimensions}
+
+    assert embedder_fingerprint(
+        custom(ConfiguredEmbeddingFunction(3))
+    ) == embedder_fingerprint(custom(ConfiguredEmbeddingFunction(3)))
+    assert embedder_fingerprint(
+        custom(ConfiguredEmbeddingFunction(3))
+    ) != embedder_fingerprint(custom(ConfiguredEmbeddingFunction(1536)))
+
+
+def test_disk_cache_is_set_per_embedder(tmp_path, monkeypatch, counting_embedder):
+    monkeypatch.setattr(
+        "crewai.rag.embeddings.embedding_cache.db_storage_path", lambda: str(tmp_path)
+    )
+    configurator = EmbeddingConfigurator()
+    config = {"provider": "custom", "config": {"embedder": counting_embedder}}
+
+    on_disk = configurator.configure_embedder({**config, "cache": "disk"})
+    in_memory = configurator.configure_embedder(config)
+
+    assert on_disk.cache.db_path == str(tmp_path / "embedding_cache.db")
+    assert in_memory.cache is embedding_cache
+    assert embedding_cache.db_path is None